@@ -0,0 +1 @@
+# وحدات مساندة لتطبيق دليل القياس الاقتصادي وعلم البيانات (econ2.py)
@@ -0,0 +1,111 @@
+# الملفات الثابتة للتطبيق: ورقة الأنماط وخط Tajawal المستضاف محليًا في static/
+# تُخدم عبر server.enableStaticServing (انظر .streamlit/config.toml) دون أي طلب لخوادم خارجية
+#
+# ملفات الخط تُرفع مع المستودع في static/fonts/ فلا يحتاج النشر المعزول إلى أي اتصال؛
+# وما دامت ناقصة يُربط خط Google Fonts بديلًا (remote_font_tag) حتى لا يفقد المستخدمون الخط.
+# تحديثها (أو إضافتها إن نقصت) من google/fonts، أو من نسخة محلية مفكوكة من أرشيف الخط:
+#     python -m econ.assets [--force]
+#     python -m econ.assets --from /path/to/tajawal
+
+import argparse
+import hashlib
+import sys
+import urllib.request
+from functools import lru_cache
+from pathlib import Path
+
+import streamlit as st
+
+STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
+STYLESHEET = STATIC_DIR / "econ.css"
+FONT_DIR = STATIC_DIR / "fonts"
+
+# المسار الذي يخدم منه Streamlit مجلد static/
+STATIC_URL = "app/static"
+
+# الخط مرخّص بـ SIL Open Font License، ويُحفظ ملف الترخيص بجانبه
+FONT_SOURCE = "https://raw.githubusercontent.com/google/fonts/main/ofl/tajawal"
+FONT_FILES = ("Tajawal-Regular.ttf", "Tajawal-Bold.ttf", "OFL.txt")
+
+# بديل مؤقت ما دامت ملفات الخط ناقصة في static/fonts/: خط Google Fonts السابق، يُربط بعد econ.css
+# فتحل قواعد @font-face الخاصة به محل القواعد المحلية التي لا تجد ملفاتها
+REMOTE_FONT_CSS = "https://fonts.googleapis.com/css2?family=Tajawal:wght@400;700&display=swap"
+
+
+@lru_cache(maxsize=1)
+def _stylesheet_tags() -> str:
+    css = STYLESHEET.read_text(encoding="utf-8")
+    # بصمة المحتوى في الرابط: يبقى الملف في ذاكرة المتصفح حتى يتغير فعلًا
+    version = hashlib.sha1(css.encode("utf-8")).hexdigest()[:10]
+    tags = [f'<link rel="stylesheet" href="{STATIC_URL}/econ.css?v={version}">', remote_font_tag()]
+    regular = FONT_DIR / "Tajawal-Regular.ttf"
+    if regular.exists():
+        tags.insert(0, f'<link rel="preload" as="font" type="font/ttf" crossorigin '
+                       f'href="{STATIC_URL}/fonts/{regular.name}">')
+    return "\n".join(filter(None, tags))
+
+
+@lru_cache(maxsize=1)
+def _inline_stylesheet() -> str:
+    return "\n".join(filter(None, [f"<style>\n{STYLESHEET.read_text(encoding='utf-8')}</style>", remote_font_tag()]))
+
+
+def remote_font_tag() -> str:
+    """رابط Google Fonts إن نقصت ملفات الخط المحلية، وإلا نص فارغ."""
+    if any(name.endswith(".ttf") for name in missing_fonts()):
+        return f'<link rel="stylesheet" href="{REMOTE_FONT_CSS}">'
+    return ""
+
+
+def inject_styles():
+    """ربط ورقة الأنماط الثابتة بالصفحة.
+
+    Streamlit يحذف في نهاية كل تشغيل العناصر التي لم تُرسل فيه، فيُرسل الرابط مع كل تشغيل،
+    لكنه سطر واحد ثابت لا يتغير، فلا يعيد المتصفح تحميل الملف ولا تتغير الصفحة.
+    """
+    if st.get_option("server.enableStaticServing"):
+        st.markdown(_stylesheet_tags(), unsafe_allow_html=True)
+    else:
+        # تشغيل دون إعدادات المشروع: تضمين الأنماط مباشرة حتى لا تفقد الصفحة تنسيقها
+        st.markdown(_inline_stylesheet(), unsafe_allow_html=True)
+
+
+def missing_fonts() -> list[str]:
+    return [name for name in FONT_FILES if not (FONT_DIR / name).is_file()]
+
+
+def _store(path: Path, data: bytes):
+    if path.suffix == ".ttf" and data[:4] not in (b"\x00\x01\x00\x00", b"true"):
+        raise ValueError(f"{path.name} ليس ملف TrueType صالحًا")
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+    print(f"{path} ({len(data) // 1024} KiB)")
+
+
+def fetch_fonts(force=False, source: Path | None = None):
+    """تحديث ملفات الخط في static/fonts/ من google/fonts، أو من مجلد محلي source دون اتصال."""
+    FONT_DIR.mkdir(parents=True, exist_ok=True)
+    for name in FONT_FILES:
+        path = FONT_DIR / name
+        if path.exists() and not force:
+            print(f"{path} موجود")
+            continue
+        if source is not None:
+            _store(path, (source / name).read_bytes())
+            continue
+        with urllib.request.urlopen(f"{FONT_SOURCE}/{name}", timeout=30) as response:
+            _store(path, response.read())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="تحديث ملفات خط Tajawal في static/fonts/")
+    parser.add_argument("--force", action="store_true", help="استبدال الملفات الموجودة")
+    parser.add_argument("--from", dest="source", type=Path, help="مجلد محلي فيه ملفات الخط بدل التنزيل")
+    args = parser.parse_args(argv)
+    fetch_fonts(force=args.force, source=args.source)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,367 @@
+# قياس أداء التطبيق دون متصفح: تشغيل econ2.py عبر AppTest وإعادة تسلسلات تفاعل واقعية
+# لكل تشغيل: الزمن، ذروة الذاكرة المخصصة، وعدد العناصر المعروضة
+#
+#     python -m econ.bench                       # تشغيل ومقارنة بخط الأساس إن وُجد
+#     python -m econ.bench --write-baseline      # حفظ النتائج كخط أساس جديد
+#     python -m econ.bench --scenario sections --repeat 5
+#     python -m econ.bench --imports             # زمن الاستيراد لكل مرحلة (على طريقة -X importtime)
+#     python -m econ.bench --fragments           # إعادة تشغيل الـ fragment وحده كما يفعل التطبيق الحي
+
+import argparse
+import ast
+import dataclasses
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+APP_PATH = ROOT / "econ2.py"
+BASELINE_PATH = Path(os.environ.get("ECON_CACHE_DIR", ROOT / ".cache")) / "bench-baseline.json"
+
+# نسبة الزمن الوسيط إلى خط الأساس التي تُعد تراجعًا في الأداء
+REGRESSION_THRESHOLD = 1.2
+
+SECTIONS = ["overview", "econometrics", "data_science", "learning_paths", "skills", "references"]
+
+# كل خطوة: (نوع العنصر في AppTest، مفتاح العنصر، القيمة الجديدة[، إعادة التشغيل])
+# الخطوات داخل نموذج لا تعيد التشغيل: المتصفح لا يرسلها إلا مع زر الإرسال
+SCENARIOS = {
+    "cold_start": [],
+    "sections": [("radio", "section", s) for s in SECTIONS[1:] + SECTIONS[:1]],
+    "skill_category": [("radio", "section", "skills")] + [
+        ("selectbox", "skill_category", c)
+        for c in ["الإحصاء", "القياس الاقتصادي", "التعلم الآلي", "هندسة البيانات", "البرمجة"]
+    ],
+    "self_assessment": [("radio", "section", "skills")] + [
+        ("slider", f"assess_{i}", value)
+        for i in range(8)
+        for value in (20, 85)
+    ],
+    "self_assessment_form": [
+        ("radio", "section", "skills"),
+        ("toggle", "assess_batch", True),
+        *[("slider", f"assess_{i}", 20 + 10 * i, False) for i in range(8)],
+        ("button", "assess_submit", None),
+    ],
+    "resource_filters": [
+        ("radio", "section", "references"),
+        ("multiselect", "yt_cat_filter", ["برمجة"]),
+        ("multiselect", "yt_cat_filter", ["برمجة", "إحصاء"]),
+        ("multiselect", "website_cat_filter", ["علم بيانات"]),
+        ("multiselect", "website_cat_filter", ["علم بيانات", "مقالات"]),
+        ("radio", "course_level_filter", "مبتدئ"),
+        ("radio", "course_level_filter", "متقدم"),
+        ("multiselect", "yt_cat_filter", []),
+        ("radio", "course_level_filter", "الكل"),
+    ],
+}
+
+# عناصر التحكم الواقعة داخل fragments في econ2.py: مفتاح العنصر -> مفتاح الـ fragment
+FRAGMENT_WIDGETS = {
+    **{f"assess_{i}": "self_assessment" for i in range(8)},
+    "assess_batch": "self_assessment",
+    "assess_submit": "self_assessment",
+    "book_category": "books_table",
+    "course_cat_filter": "courses_table",
+    "course_level_filter": "courses_table",
+    "yt_lang_filter": "channels_table",
+    "yt_cat_filter": "channels_table",
+    "website_cat_filter": "websites_table",
+    "blog_cat_filter": "blogs_table",
+}
+
+
+def count_elements(node) -> int:
+    children = getattr(node, "children", None)
+    if not children:
+        return 1
+    return sum(count_elements(child) for child in children.values())
+
+
+def _reset_caches():
+    import streamlit as st
+
+    from econ.charts import FIGURE_CACHE
+
+    st.cache_resource.clear()
+    st.cache_data.clear()
+    FIGURE_CACHE.clear()
+
+
+@contextmanager
+def _fragment_rerun(at, fragment_key):
+    """جعل التشغيل التالي لـ AppTest مقتصرًا على fragment واحد.
+
+    AppTest يعيد تشغيل السكربت كاملًا دائمًا، بينما يرسل المتصفح عند التفاعل داخل fragment
+    طلب إعادة تشغيل يحمل معرّفه؛ هنا يُضاف المعرّف نفسه إلى طلب إعادة التشغيل.
+    """
+    from streamlit.runtime.scriptrunner_utils.script_requests import ScriptRequests
+    from streamlit.testing.v1.local_script_runner import LocalScriptRunner
+
+    fragment_id = next(iter(at._fragment_storage._ids_by_target_key[fragment_key]))
+    request_rerun = LocalScriptRunner.request_rerun
+
+    def fragment_request_rerun(self, rerun_data):
+        # مشغل AppTest يبدأ بطلب تشغيل كامل معلق يبتلع طلب الـ fragment عند الدمج،
+        # بينما ينشئ الخادم الحي المشغل بطلب الـ fragment نفسه؛ فيُستبدل الطلب المعلق بالمثل
+        self._requests = ScriptRequests()
+        return request_rerun(self, dataclasses.replace(rerun_data, fragment_id=fragment_id))
+
+    LocalScriptRunner.request_rerun = fragment_request_rerun
+    try:
+        yield
+    finally:
+        LocalScriptRunner.request_rerun = request_rerun
+
+
+def _replay(steps, trace_memory, fragments=False):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(APP_PATH), default_timeout=120)
+    samples = []
+
+    def run(label, fragment_key=None):
+        if trace_memory:
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        if fragment_key is None:
+            at.run()
+        else:
+            with _fragment_rerun(at, fragment_key):
+                at.run()
+        wall_ms = (time.perf_counter() - start) * 1000
+        if at.exception:
+            raise RuntimeError(f"{label}: {at.exception[0].message}")
+        peak_kib = tracemalloc.get_traced_memory()[1] / 1024 if trace_memory else None
+        samples.append({
+            "step": label,
+            "wall_ms": wall_ms,
+            "peak_kib": peak_kib,
+            "elements": count_elements(at.main) + count_elements(at.sidebar),
+        })
+        if fragment_key is not None:
+            # شجرة AppTest بعد تشغيل fragment لا تحوي إلا عناصره، فيعيد تشغيل كامل غير مقاس
+            # بقية الصفحة وعناصر التحكم فيها قبل الخطوة التالية
+            at.run()
+
+    run("initial")
+    for widget, key, value, *rerun in steps:
+        element = getattr(at, widget)(key=key)
+        if widget == "button":
+            element.click()
+        else:
+            element.set_value(value)
+        if rerun and not rerun[0]:
+            continue
+        run(f"{widget}:{key}={value}", FRAGMENT_WIDGETS.get(key) if fragments else None)
+    return samples
+
+
+def run_scenario(name, repeat=3, memory=True, fragments=False):
+    # numpy يُستورد هنا لا في رأس الوحدة: مسبار الاستيراد يعمل داخل هذه الوحدة، ولو حُمّل numpy
+    # مسبقًا لسقطت تكلفته من مرحلة startup وهي على حساب أول جلسة في الخادم الحقيقي
+    import numpy as np
+
+    steps = SCENARIOS[name]
+    runs = []
+    for _ in range(repeat):
+        if name == "cold_start":
+            _reset_caches()
+        runs.append(_replay(steps, trace_memory=False, fragments=fragments))
+
+    # ذروة الذاكرة تُقاس في إعادة منفصلة لأن tracemalloc يبطئ التنفيذ ويشوه الأزمنة
+    peaks = None
+    if memory:
+        if name == "cold_start":
+            _reset_caches()
+        tracemalloc.start()
+        try:
+            peaks = [s["peak_kib"] for s in _replay(steps, trace_memory=True, fragments=fragments)]
+        finally:
+            tracemalloc.stop()
+
+    steps_out = []
+    for i, first in enumerate(runs[0]):
+        wall = np.array([r[i]["wall_ms"] for r in runs])
+        steps_out.append({
+            "step": first["step"],
+            "wall_ms_median": float(np.median(wall)),
+            "peak_kib": peaks[i] if peaks else None,
+            "elements": first["elements"],
+        })
+
+    # الخطوة الأولى تحميل أولي للصفحة؛ الملخص يقيس إعادة التشغيل بعد التفاعل
+    measured = steps_out[1:] or steps_out
+    all_wall = [s["wall_ms"] for r in runs for s in (r[1:] or r)]
+    return {
+        "scenario": name,
+        "rerun": "fragment" if fragments else "full",
+        "repeat": repeat,
+        "reruns": len(measured) if steps else 1,
+        "wall_ms_median": float(np.median([s["wall_ms_median"] for s in measured])),
+        "wall_ms_p95": float(np.percentile(all_wall, 95)),
+        "peak_kib_max": max((s["peak_kib"] for s in measured if s["peak_kib"] is not None), default=None),
+        "elements_median": float(np.median([s["elements"] for s in measured])),
+        "steps": steps_out,
+    }
+
+
+IMPORT_PHASE_MARKER = "##econ-bench-phase "
+
+
+def _mark_phase(name):
+    print(f"{IMPORT_PHASE_MARKER}{name}", file=sys.stderr, flush=True)
+
+
+def _import_probe():
+    """يعمل في عملية جديدة تحت -X importtime، ويفصل مراحل التشغيل بعلامات في stderr."""
+    from streamlit.testing.v1 import AppTest
+
+    # تحميل آلية AppTest نفسها خارج القياس
+    AppTest.from_string("pass").run()
+
+    sys.path.insert(0, str(ROOT))
+    tree = ast.parse(APP_PATH.read_text(encoding="utf-8"))
+    imports = ast.Module(
+        body=[node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))],
+        type_ignores=[]
+    )
+    _mark_phase("startup")
+    exec(compile(imports, str(APP_PATH), "exec"), {})
+
+    at = AppTest.from_file(str(APP_PATH), default_timeout=120)
+    for section in SECTIONS:
+        _mark_phase(f"section:{section}")
+        if section != SECTIONS[0]:
+            at.radio(key="section").set_value(section)
+        at.run()
+
+
+def parse_importtime(stderr: str, top=5):
+    """الاستيرادات ذات المستوى الأعلى في كل مرحلة: الزمن التراكمي (ms) وأثقلها."""
+    phases = {}
+    imports = None
+    for line in stderr.splitlines():
+        if line.startswith(IMPORT_PHASE_MARKER):
+            imports = phases.setdefault(line[len(IMPORT_PHASE_MARKER):], [])
+            continue
+        if imports is None or not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        name = name[1:]
+        # المسافات البادئة تعكس عمق التداخل: المستوى الأعلى وحده يمثل تكلفة المرحلة دون تكرار
+        if name.startswith(" "):
+            continue
+        imports.append((name, int(cumulative) / 1000))
+
+    report = []
+    for phase, imports in phases.items():
+        imports.sort(key=lambda item: -item[1])
+        report.append({
+            "phase": phase,
+            "import_ms": sum(ms for _, ms in imports),
+            "modules": len(imports),
+            "top": [{"module": name, "ms": ms} for name, ms in imports[:top]],
+        })
+    return report
+
+
+def import_report():
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "econ.bench", "--import-probe"],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return parse_importtime(completed.stderr)
+
+
+def _print_imports(report):
+    print(f"{'phase':<24} {'import ms':>10} {'modules':>8}  heaviest")
+    for r in report:
+        heaviest = ", ".join(f"{t['module']} {t['ms']:.0f}" for t in r["top"][:3])
+        print(f"{r['phase']:<24} {r['import_ms']:>10.1f} {r['modules']:>8}  {heaviest}")
+
+
+def compare(results, baseline, threshold=REGRESSION_THRESHOLD):
+    """مقارنة الزمن الوسيط لكل سيناريو بخط الأساس؛ تعيد قائمة السيناريوهات المتراجعة."""
+    regressions = []
+    previous = {r["scenario"]: r for r in baseline["results"]}
+    for r in results:
+        base = previous.get(r["scenario"])
+        if base is None:
+            continue
+        ratio = r["wall_ms_median"] / max(base["wall_ms_median"], 1e-9)
+        r["baseline_wall_ms_median"] = base["wall_ms_median"]
+        r["ratio"] = ratio
+        if ratio > threshold:
+            regressions.append(r["scenario"])
+    return regressions
+
+
+def _print_table(results):
+    print(f"{'scenario':<22} {'reruns':>6} {'median ms':>10} {'p95 ms':>10} {'peak KiB':>10} {'elements':>9} {'vs base':>8}")
+    for r in results:
+        peak = f"{r['peak_kib_max']:.0f}" if r["peak_kib_max"] is not None else "-"
+        ratio = f"{r['ratio']:.2f}x" if "ratio" in r else "-"
+        print(f"{r['scenario']:<22} {r['reruns']:>6} {r['wall_ms_median']:>10.1f} {r['wall_ms_p95']:>10.1f} "
+              f"{peak:>10} {r['elements_median']:>9.0f} {ratio:>8}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="سيناريو محدد (يمكن تكراره)؛ الافتراضي جميع السيناريوهات")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-memory", action="store_true", help="تخطي قياس ذروة الذاكرة")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--write-baseline", action="store_true")
+    parser.add_argument("--output", type=Path, help="كتابة النتائج الكاملة إلى ملف JSON")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    parser.add_argument("--fragments", action="store_true",
+                        help="إعادة تشغيل الـ fragment وحده عند التفاعل مع عناصره (كالتطبيق الحي)")
+    parser.add_argument("--imports", action="store_true", help="تقرير زمن الاستيراد لكل مرحلة فقط")
+    parser.add_argument("--import-probe", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.import_probe:
+        _import_probe()
+        return 0
+    if args.imports:
+        report = import_report()
+        _print_imports(report)
+        if args.output:
+            args.output.write_text(json.dumps({"imports": report}, ensure_ascii=False, indent=2))
+        return 0
+
+    names = args.scenario or list(SCENARIOS)
+    results = [run_scenario(name, args.repeat, memory=not args.no_memory, fragments=args.fragments)
+               for name in names]
+
+    regressions = []
+    if not args.write_baseline and args.baseline.exists():
+        regressions = compare(results, json.loads(args.baseline.read_text()), args.threshold)
+
+    _print_table(results)
+
+    report = {"created": time.time(), "python": sys.version.split()[0], "results": results}
+    if args.output:
+        args.output.write_text(json.dumps(report, ensure_ascii=False, indent=2))
+    if args.write_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(report, ensure_ascii=False, indent=2))
+        print(f"baseline written to {args.baseline}")
+
+    if regressions:
+        print(f"regressions (> {args.threshold:.2f}x baseline): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+# مخزن بيانات الموارد (الكتب، الدورات، القنوات، المواقع، ...)
+# تُقرأ الجداول مرة واحدة لكل عملية من ملفات بيانات ذات إصدار، وتُشارك للقراءة فقط بين جميع الجلسات
+# pandas يُستورد عند أول قراءة للكتالوج لا عند استيراد الوحدة، حتى لا يؤخر أول عرض للصفحة
+
+from __future__ import annotations
+
+import json
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Mapping
+
+import numpy as np
+import streamlit as st
+
+from econ import profiler
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+CATALOG_DIR = Path(__file__).resolve().parent.parent / "data" / "catalog"
+
+# أعمدة ذات قيم متكررة قليلة تُخزن كنوع فئوي لتقليل الذاكرة وتسريع المقارنة
+CATEGORICAL_COLUMNS = ("التصنيف", "المستوى", "اللغة", "النوع", "depth")
+
+CATEGORY_COLUMN = "التصنيف"
+CATEGORY_SEPARATORS = re.compile(r"[،,]")
+
+
+def split_categories(value: str) -> list[str]:
+    """تفكيك قيمة التصنيف ("علم بيانات، برمجة") إلى وسوم منفصلة."""
+    return [tag.strip() for tag in CATEGORY_SEPARATORS.split(str(value)) if tag.strip()]
+
+
+def category_tokens(value: str) -> set[str]:
+    """الوسوم الكاملة لقيمة التصنيف دون بادئات: "تعلم" لا يطابق "تعلم آلي" ولا "برمجة" يطابق "برمجة R"."""
+    return set(split_categories(value))
+
+
+class CategoryIndex:
+    """فهرس معكوس: وسم التصنيف -> مواقع الصفوف (مرتبة) التي تحمله."""
+
+    def __init__(self, values: pd.Series):
+        import pandas as pd
+
+        # التفكيك مرة لكل قيمة مميزة، ثم توزيع النتيجة على الصفوف بعمليات متجهة
+        codes, uniques = pd.factorize(values)
+        token_codes = defaultdict(list)
+        for code, value in enumerate(uniques):
+            for token in category_tokens(value):
+                token_codes[token].append(code)
+
+        self._postings = {
+            token: np.flatnonzero(np.isin(codes, token_code_list))
+            for token, token_code_list in token_codes.items()
+        }
+
+    def rows(self, categories) -> np.ndarray:
+        """مواقع الصفوف التي تحمل أيًا من التصنيفات المختارة (اتحاد القوائم)."""
+        postings = [self._postings[c] for c in categories if c in self._postings]
+        if not postings:
+            return np.empty(0, dtype=np.intp)
+        if len(postings) == 1:
+            return postings[0]
+        return np.unique(np.concatenate(postings))
+
+    def categories(self) -> list[str]:
+        return sorted(self._postings)
+
+
+@dataclass(frozen=True)
+class Catalog:
+    version: str
+    tables: Mapping[str, pd.DataFrame]
+    category_index: Mapping[str, CategoryIndex] = field(default_factory=dict)
+    _sort_ranks: dict = field(default_factory=dict, repr=False, compare=False)
+
+    def __getitem__(self, name: str) -> pd.DataFrame:
+        return self.tables[name]
+
+    def sort_rank(self, name: str, column: str) -> np.ndarray:
+        """رتبة كل صف من الجدول الكامل عند ترتيبه حسب العمود (القيم الفارغة أخيرًا).
+
+        تُحسب مرة لكل عمود وتُشارك بين الجلسات؛ ترتيب أي مجموعة صفوف مصفاة يصبح
+        بعدها ترتيبًا لأعداد صحيحة بدل مقارنة النصوص في كل تشغيل.
+        """
+        rank = self._sort_ranks.get((name, column))
+        if rank is None:
+            values = self.tables[name][column].reset_index(drop=True)
+            order = values.sort_values(kind="stable", na_position="last").index.to_numpy()
+            rank = np.empty(len(order), dtype=np.intp)
+            rank[order] = np.arange(len(order))
+            self._sort_ranks[(name, column)] = rank
+        return rank
+
+    def filter_categories(self, name: str, categories) -> pd.DataFrame:
+        """صفوف الجدول التي تحمل أيًا من التصنيفات المختارة، بترتيبها الأصلي."""
+        return self.tables[name].iloc[self.category_index[name].rows(categories)]
+
+
+def read_table(path: Path) -> pd.DataFrame:
+    """قراءة ملف جدول واحد: JSON (قائمة سجلات) أو Arrow IPC الناتج عن python -m econ.ingest."""
+    import pandas as pd
+
+    if path.suffix == ".arrow":
+        import pyarrow as pa
+
+        # ربط الملف بالذاكرة: أعمدة النصوص في pandas تبقى مدعومة بـ Arrow وتشير إلى صفحات الملف
+        # مباشرة، فلا تُنسخ إلى ذاكرة العملية إلا الصفحات التي تُقرأ فعلًا
+        return pa.ipc.open_file(pa.memory_map(str(path))).read_all().to_pandas()
+    return pd.DataFrame(json.loads(path.read_text(encoding="utf-8")))
+
+
+def read_catalog(path: Path = CATALOG_DIR) -> Catalog:
+    """قراءة جميع جداول الموارد من مجلد البيانات دون أي تخزين مؤقت."""
+    manifest = json.loads((path / "manifest.json").read_text(encoding="utf-8"))
+    # الجداول المستوردة بالجملة تُسجل في "files"؛ البقية ملفات JSON باسم الجدول
+    files = manifest.get("files", {})
+
+    tables = {}
+    category_index = {}
+    for name in manifest["tables"]:
+        df = read_table(path / files.get(name, f"{name}.json"))
+        for column in CATEGORICAL_COLUMNS:
+            if column in df.columns:
+                df[column] = df[column].astype("category")
+        tables[name] = df
+        if CATEGORY_COLUMN in df.columns:
+            category_index[name] = CategoryIndex(df[CATEGORY_COLUMN])
+
+    return Catalog(
+        version=str(manifest["version"]),
+        tables=MappingProxyType(tables),
+        category_index=MappingProxyType(category_index)
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def load_catalog() -> Catalog:
+    """الكتالوج المشترك على مستوى العملية.
+
+    الجداول المُعادة مشتركة بين كل الجلسات: يجب عدم تعديلها في مكانها،
+    فعمليات التصفية والاختيار تُنشئ نسخًا جديدة.
+    """
+    with profiler.section("catalog:read"):
+        return read_catalog()
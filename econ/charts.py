@@ -0,0 +1,595 @@
+# مصنع المخططات: يبني كل مخطط من مفتاح (معرّف المخطط + معاملاته)
+# ويخزن JSON المخطط المُسلسل في ذاكرة LRU محدودة مشتركة على مستوى العملية
+# ويُرسل JSON المخزن إلى الواجهة كما هو، دون إعادة بناء Figure وتسلسله عند كل عرض
+# plotly.express وpandas يُستوردان داخل دوال البناء فقط: لا يتأخر أول عرض للصفحة بسببهما،
+# ولا يُستوردان أصلًا ما دامت المخططات تُخدم من الذاكرة
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+import numpy as np
+import plotly.graph_objects as go
+import streamlit as st
+
+from econ import profiler
+
+FIGURE_CACHE_SIZE = int(os.environ.get("ECON_FIGURE_CACHE_SIZE", "256"))
+
+# عدد النقاط لكل مجموعة في مخطط فين: موازنة بين دقة الشكل وحجم البيانات المرسلة
+VENN_POINTS = int(os.environ.get("ECON_VENN_POINTS", "1000"))
+VENN_SEED = 2025
+
+MONTECARLO_COLORS = {'OLS': '#f72585', 'IV': '#4361ee', 'FE': '#2a9d8f'}
+
+
+class FigureCache:
+    """ذاكرة LRU آمنة بين الخيوط تربط مفتاح المخطط بـ JSON المخطط."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key, build):
+        with self._lock:
+            spec = self._entries.get(key)
+            if spec is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return spec
+            self.misses += 1
+
+        # البناء خارج القفل حتى لا تنتظر الجلسات الأخرى مخططًا بطيئًا
+        spec = build()
+
+        with self._lock:
+            self._entries[key] = spec
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return spec
+
+    def stats(self):
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+FIGURE_CACHE = FigureCache(FIGURE_CACHE_SIZE)
+
+_BUILDERS = {}
+
+
+def chart(chart_id):
+    """تسجيل دالة بناء مخطط تحت معرّف ثابت."""
+    def register(build):
+        _BUILDERS[chart_id] = build
+        return build
+    return register
+
+
+def _freeze(value):
+    # تحويل القوائم والقواميس إلى أشكال قابلة للتجزئة لاستخدامها في مفتاح الذاكرة
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+
+def figure_json(chart_id, **params):
+    """(JSON المخطط، ارتفاعه المحدد في تخطيطه أو None)."""
+    key = (chart_id, _freeze(params))
+
+    def build():
+        with profiler.section(f"chart_build:{chart_id}"):
+            fig = _BUILDERS[chart_id](**params)
+            return fig.to_json(), fig.layout.height
+
+    return FIGURE_CACHE.get_or_build(key, build)
+
+
+def _send_spec(spec, height):
+    """إرسال JSON المخطط المخزن كما هو في رسالة PlotlyChart.
+
+    st.plotly_chart يبني Figure مُتحققًا منه من أي مدخل (حتى القاموس) ثم يعيد تسلسله، وهذا
+    أغلى ما في عرض مخطط مخزن؛ هنا تُملأ الرسالة بالحقول نفسها التي يملؤها، فالمعرّف والسمة
+    والأبعاد لا تختلف.
+    """
+    from streamlit.elements.lib.form_utils import current_form_id
+    from streamlit.elements.lib.layout_utils import LayoutConfig
+    from streamlit.elements.lib.utils import compute_and_register_element_id
+    from streamlit.proto.PlotlyChart_pb2 import PlotlyChart as PlotlyChartProto
+
+    dg = st._main
+    proto = PlotlyChartProto()
+    proto.theme = "streamlit"
+    proto.form_id = current_form_id(dg)
+    proto.spec = spec
+    proto.config = "{}"
+    proto.id = compute_and_register_element_id(
+        "plotly_chart",
+        user_key=None,
+        key_as_main_identity=False,
+        dg=dg,
+        plotly_spec=proto.spec,
+        plotly_config=proto.config,
+        selection_mode=("points", "box", "lasso"),
+        is_selection_activated=False,
+        theme="streamlit",
+        width="stretch",
+        height="content",
+        alt=None,
+    )
+    dg._enqueue("plotly_chart", proto, layout_config=LayoutConfig(width="stretch", height=int(height or 450)))
+
+
+def plotly_chart(chart_id, **params):
+    with profiler.section(f"chart:{chart_id}"):
+        spec, height = figure_json(chart_id, **params)
+        try:
+            _send_spec(spec, height)
+        except (ImportError, AttributeError, TypeError):
+            # واجهات Streamlit الداخلية تغيرت: العرض العادي، دون إعادة التحقق من مخطط تحقق منه بناؤه
+            st.plotly_chart(go.Figure(json.loads(spec), _validate=False), width="stretch")
+
+
+@chart("core_skills")
+def build_core_skills(labels, values, colors):
+    import plotly.express as px
+
+    fig = px.pie(
+        values=values,
+        names=labels,
+        title="المهارات الأساسية المطلوبة",
+        color_discrete_sequence=colors,
+        hole=0.4
+    )
+    fig.update_layout(
+        font=dict(size=14, family="Tajawal"),
+        legend=dict(orientation="h", y=-0.1)
+    )
+    return fig
+
+
+@chart("skill_demand")
+def build_skill_demand(years, series):
+    fig = go.Figure()
+
+    for name, values, color in series:
+        fig.add_trace(go.Scatter(
+            x=years, y=values,
+            mode='lines+markers',
+            name=name,
+            line=dict(color=color, width=3)
+        ))
+
+    fig.update_layout(
+        title=f'تطور الطلب على المهارات ({years[0]}-{years[-1]})',
+        xaxis_title='السنة',
+        yaxis_title='مؤشر الطلب (100-0)',
+        legend=dict(orientation="h", y=1.1),
+        font=dict(family="Tajawal", size=14),
+        hovermode="x unified"
+    )
+    return fig
+
+
+@chart("econometrics_skills")
+def build_econometrics_skills(skills, importance):
+    import plotly.express as px
+
+    fig = px.bar(
+        x=importance,
+        y=skills,
+        orientation='h',
+        title='أهمية المهارات في القياس الاقتصادي',
+        color=importance,
+        color_continuous_scale='blues',
+        text=importance
+    )
+
+    fig.update_layout(
+        xaxis_title='مستوى الأهمية (100-0)',
+        yaxis_title='المهارة',
+        font=dict(family="Tajawal", size=14)
+    )
+    return fig
+
+
+@chart("econometrics_tools")
+def build_econometrics_tools(tools):
+    import pandas as pd
+    import plotly.express as px
+
+    tools_df = pd.DataFrame({
+        'الأداة': [t[0] for t in tools],
+        'الانتشار': [t[1] for t in tools]
+    })
+
+    fig = px.bar(
+        tools_df,
+        x='الانتشار',
+        y='الأداة',
+        orientation='h',
+        title='مدى انتشار الأدوات في مجال القياس الاقتصادي',
+        text='الانتشار',
+        color='الانتشار',
+        color_continuous_scale='blues'
+    )
+
+    fig.update_layout(
+        font=dict(family="Tajawal", size=14),
+        xaxis_title='مستوى الانتشار (100-0)'
+    )
+    return fig
+
+
+@chart("residuals_fitted")
+def build_residuals_fitted(fitted, resid):
+    fig = go.Figure(go.Scattergl(
+        x=fitted, y=resid,
+        mode='markers',
+        marker=dict(color='#4361ee', size=4, opacity=0.5)
+    ))
+    fig.add_hline(y=0, line=dict(color='#7209b7', dash='dash'))
+    fig.update_layout(
+        title='البواقي مقابل القيم المقدرة',
+        xaxis_title='القيمة المقدرة',
+        yaxis_title='البواقي',
+        font=dict(family="Tajawal", size=14)
+    )
+    return fig
+
+
+@chart("residuals_histogram")
+def build_residuals_histogram(edges, counts, normal):
+    centers = [(a + b) / 2 for a, b in zip(edges[:-1], edges[1:])]
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=centers, y=counts, name='البواقي', marker_color='#3a0ca3', opacity=0.7))
+    fig.add_trace(go.Scatter(x=centers, y=normal, name='التوزيع الطبيعي', line=dict(color='#f72585', width=3)))
+    fig.update_layout(
+        title='توزيع البواقي',
+        xaxis_title='البواقي',
+        yaxis_title='التكرار',
+        bargap=0,
+        legend=dict(orientation="h", y=1.1),
+        font=dict(family="Tajawal", size=14)
+    )
+    return fig
+
+
+@chart("resampling_draws")
+def build_resampling_draws(edges, counts, marks, title):
+    centers = [(a + b) / 2 for a, b in zip(edges[:-1], edges[1:])]
+    fig = go.Figure(go.Bar(x=centers, y=counts, marker_color='#4361ee', opacity=0.8))
+    for label, value in marks:
+        fig.add_vline(x=value, line=dict(color='#f72585', dash='dash'), annotation_text=label)
+    fig.update_layout(
+        title=title,
+        xaxis_title='قيمة المعامل',
+        yaxis_title='التكرار',
+        bargap=0,
+        showlegend=False,
+        font=dict(family="Tajawal", size=14)
+    )
+    return fig
+
+
+@chart("montecarlo_convergence")
+def build_montecarlo_convergence(sizes, series, beta):
+    fig = go.Figure()
+    for name, label, median, low, high in series:
+        color = MONTECARLO_COLORS[name]
+        fig.add_trace(go.Scatter(x=sizes + sizes[::-1], y=high + low[::-1], fill='toself', fillcolor=color,
+                                 opacity=0.15, line=dict(width=0), hoverinfo='skip', showlegend=False))
+        fig.add_trace(go.Scatter(x=sizes, y=median, name=label, mode='lines+markers', line=dict(color=color, width=3)))
+    fig.add_hline(y=beta, line=dict(color='#333', dash='dash'), annotation_text='القيمة الحقيقية')
+    fig.update_layout(
+        title='الوسيط ونطاق 95% من التقديرات مع نمو العينة',
+        xaxis=dict(title='حجم العينة', type='log'),
+        yaxis_title='تقدير β',
+        legend=dict(orientation="h", y=1.1),
+        font=dict(family="Tajawal", size=14)
+    )
+    return fig
+
+
+@chart("montecarlo_distributions")
+def build_montecarlo_distributions(edges, series, beta, title):
+    centers = [(a + b) / 2 for a, b in zip(edges[:-1], edges[1:])]
+    fig = go.Figure()
+    for name, label, counts in series:
+        fig.add_trace(go.Bar(x=centers, y=counts, name=label, marker_color=MONTECARLO_COLORS[name], opacity=0.55))
+    fig.add_vline(x=beta, line=dict(color='#333', dash='dash'), annotation_text='β')
+    fig.update_layout(
+        title=title,
+        xaxis_title='تقدير β',
+        yaxis_title='التكرار',
+        barmode='overlay',
+        bargap=0,
+        legend=dict(orientation="h", y=1.1),
+        font=dict(family="Tajawal", size=14)
+    )
+    return fig
+
+
+@chart("system_correlation")
+def build_system_correlation(labels, correlation):
+    fig = go.Figure(go.Heatmap(z=correlation, x=labels, y=labels, zmin=-1, zmax=1, colorscale='RdBu_r'))
+    fig.update_layout(
+        title='الارتباط بين أخطاء المعادلات (Σ)',
+        yaxis=dict(autorange='reversed'),
+        font=dict(family="Tajawal", size=14)
+    )
+    return fig
+
+
+@lru_cache(maxsize=4)
+def venn_points(points, seed=VENN_SEED):
+    """نقاط مخطط فين: بذرة ثابتة، فالشكل لا يتغير بين التشغيلات ويُولَّد مرة واحدة لكل عملية."""
+    rng = np.random.default_rng(seed)
+    groups = [
+        ('محلل بيانات', (-1, 0.5), '#4361ee'),  # دائرة محلل البيانات
+        ('عالم بيانات', (1, 0.5), '#7209b7'),  # دائرة عالم البيانات
+        ('مشترك', (0, 0.3), '#4cc9f0')  # التداخل
+    ]
+
+    data = []
+    for name, (x_mean, x_std), color in groups:
+        # دقة float32 تكفي للعرض وتقلص المصفوفات المرمّزة في JSON إلى النصف
+        x = rng.normal(x_mean, x_std, points).astype(np.float32)
+        y = rng.normal(0, 0.5, points).astype(np.float32)
+        data.append((name, x, y, color))
+    return data
+
+
+@chart("roles_venn")
+def build_roles_venn(points):
+    fig = go.Figure()
+
+    for name, x, y, color in venn_points(points):
+        fig.add_trace(go.Scattergl(
+            x=x, y=y,
+            mode='markers',
+            name=name,
+            opacity=0.6,
+            marker=dict(color=color)
+        ))
+
+    fig.update_layout(
+        title='العلاقة بين محلل البيانات وعالم البيانات',
+        showlegend=True,
+        font=dict(family="Tajawal", size=14),
+        xaxis=dict(showticklabels=False, title='x'),
+        yaxis=dict(showticklabels=False, title='y')
+    )
+
+    # إضافة نصوص على المخطط
+    fig.add_annotation(
+        x=-1.5, y=0,
+        text="تحليل البيانات<br>الإحصاء التقليدي<br>تصور البيانات",
+        showarrow=False,
+        font=dict(family="Tajawal", size=14)
+    )
+
+    fig.add_annotation(
+        x=1.5, y=0,
+        text="تعلم آلي متقدم<br>معالجة لغة طبيعية<br>رؤية حاسوبية",
+        showarrow=False,
+        font=dict(family="Tajawal", size=14)
+    )
+
+    fig.add_annotation(
+        x=0, y=0,
+        text="Python/R<br>إحصاء<br>SQL",
+        showarrow=False,
+        font=dict(family="Tajawal", size=14, color="white")
+    )
+    return fig
+
+
+@chart("project_lifecycle")
+def build_project_lifecycle(stages, stages_desc):
+    numbers = list(range(1, len(stages) + 1))
+
+    fig = go.Figure()
+
+    fig.add_trace(go.Scatter(
+        x=numbers,
+        y=[1] * len(stages),
+        mode='markers+text',
+        marker=dict(
+            size=30,
+            color=['#4361ee', '#4361ee', '#3a0ca3', '#3a0ca3',
+                   '#7209b7', '#7209b7', '#f72585', '#f72585',
+                   '#4cc9f0', '#4cc9f0'],
+            symbol='circle',
+            line=dict(width=2, color='white')
+        ),
+        text=numbers,
+        textfont=dict(color='white', size=14, family='Tajawal'),
+        name=''
+    ))
+
+    # إضافة التسميات للمراحل
+    for i, (stage, desc) in enumerate(zip(stages, stages_desc)):
+        fig.add_annotation(
+            x=i + 1,
+            y=1.2 if i % 2 == 0 else 0.8,
+            text=f"<b>{stage}</b><br>{desc}",
+            showarrow=False,
+            font=dict(size=12, family='Tajawal'),
+            align='center',
+            bgcolor='rgba(255, 255, 255, 0.8)',
+            bordercolor='gray',
+            borderwidth=1,
+            borderpad=4,
+            xanchor='center'
+        )
+
+    # إضافة السهم الذي يربط المراحل
+    fig.add_shape(
+        type='line',
+        x0=0.5, y0=1,
+        x1=len(stages) + 0.5, y1=1,
+        line=dict(color='gray', width=2)
+    )
+
+    fig.update_layout(
+        title='دورة حياة مشروع علم البيانات',
+        showlegend=False,
+        height=500,
+        xaxis=dict(
+            showticklabels=False,
+            range=[0, len(stages) + 1]
+        ),
+        yaxis=dict(
+            showticklabels=False,
+            range=[0.5, 1.5]
+        ),
+        plot_bgcolor='white',
+        font=dict(family='Tajawal')
+    )
+    return fig
+
+
+@chart("learning_timeline")
+def build_learning_timeline(timeline):
+    import pandas as pd
+    import plotly.express as px
+
+    df_timeline = pd.DataFrame(timeline)
+
+    fig = px.line(
+        df_timeline,
+        x='النهاية',
+        y='المكتسبات',
+        text='المرحلة',
+        markers=True,
+        line_shape='spline',
+        title='تطور المعرفة والمهارات مع الوقت'
+    )
+
+    fig.update_traces(
+        textposition='top center',
+        line=dict(color='#4361ee', width=3)
+    )
+
+    fig.update_layout(
+        xaxis_title='الأشهر',
+        yaxis_title='مستوى المهارة',
+        font=dict(family='Tajawal', size=14)
+    )
+    return fig
+
+
+@chart("technical_skills")
+def build_technical_skills(category, skills):
+    import pandas as pd
+    import plotly.express as px
+
+    skills_df = pd.DataFrame({
+        'المهارة': [s[0] for s in skills],
+        'المستوى': [s[1] for s in skills]
+    })
+
+    fig = px.bar(
+        skills_df,
+        x='المستوى',
+        y='المهارة',
+        orientation='h',
+        text='المستوى',
+        title=f'أهمية مهارات {category}',
+        color='المستوى',
+        color_continuous_scale='blues'
+    )
+
+    fig.update_layout(
+        font=dict(family='Tajawal', size=14),
+        xaxis_title='مستوى الأهمية (100-0)'
+    )
+    return fig
+
+
+@chart("soft_skills")
+def build_soft_skills(skills):
+    import pandas as pd
+    import plotly.express as px
+
+    soft_skills_df = pd.DataFrame({
+        'المهارة': [s[0] for s in skills],
+        'الأهمية': [s[1] for s in skills]
+    })
+
+    fig = px.pie(
+        soft_skills_df,
+        values='الأهمية',
+        names='المهارة',
+        title='أهمية المهارات الناعمة',
+        color_discrete_sequence=px.colors.sequential.Purples_r,
+        hole=0.4
+    )
+
+    fig.update_layout(
+        font=dict(family='Tajawal', size=14),
+        legend=dict(
+            orientation="v",
+            yanchor="top",
+            y=1,
+            xanchor="left",
+            x=-0.1
+        )
+    )
+    return fig
+
+
+@chart("self_assessment")
+def build_self_assessment(ratings):
+    import pandas as pd
+    import plotly.express as px
+
+    radar_df = pd.DataFrame({
+        'المهارة': [r[0] for r in ratings],
+        'المستوى': [r[1] for r in ratings]
+    })
+
+    fig = px.line_polar(
+        radar_df,
+        r='المستوى',
+        theta='المهارة',
+        line_close=True,
+        title='تقييمك الذاتي للمهارات'
+    )
+
+    fig.update_traces(
+        fill='toself',
+        fillcolor='rgba(67, 97, 238, 0.3)',
+        line=dict(color='#4361ee', width=3)
+    )
+
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 100]
+            )
+        ),
+        font=dict(family='Tajawal', size=14)
+    )
+    return fig
@@ -0,0 +1,339 @@
+# مؤشر الطلب على المهارات من بيانات إعلانات الوظائف (CSV أو JSONL، ملايين الصفوف)
+# يُقسم الملف إلى كتل على حدود السجلات، وتُحلل كل كتلة وتُطابق كلماتها المفتاحية في مجمع عمليات،
+# ثم تُجمع أعداد الإعلانات لكل شهر ومجال في ملف صغير يقرأه مخطط "تطور الطلب على المهارات"
+#
+#     python -m econ.demand postings.csv                     # معالجة الجديد فقط منذ آخر تشغيل
+#     python -m econ.demand postings/*.jsonl --workers 8
+#     python -m econ.demand postings.csv --text-column title --text-column description --date-column posted_at
+#     python -m econ.demand --rebuild postings.csv           # تجاهل العلامة المائية وإعادة الحساب
+#     python -m econ.demand --report [--monthly]             # المؤشر الحالي دون معالجة
+#
+# العلامة المائية لكل ملف مصدر هي موضع آخر سجل مكتمل عولج (بالبايت)، فالإعلانات المضافة إلى نهاية
+# الملف تُعالج وحدها؛ وإن تغيرت بداية الملف (استُبدل) يُعاد حساب مساهمته وحده
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import re
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import streamlit as st
+
+from econ.search import normalize_arabic
+
+ROOT = Path(__file__).resolve().parent.parent
+AGGREGATES_PATH = ROOT / "data" / "demand_index.json"
+
+BLOCK_SIZE = 8 * 2**20
+HEAD_BYTES = 4096
+
+DATE_COLUMN = "date"
+TEXT_COLUMNS = ("title", "description")
+
+# المجالات المعروضة في المخطط: الاسم، اللون، والكلمات الدالة عليه في عنوان الإعلان أو وصفه
+FIELDS = {
+    "القياس الاقتصادي": ("#4361ee", [
+        "econometrics", "econometric", "econometrician", "stata", "eviews", "time series", "panel data",
+        "causal inference", "difference-in-differences", "instrumental variables", "regression analysis",
+        "forecasting", "قياس اقتصادي", "القياس الاقتصادي", "اقتصاد قياسي", "السلاسل الزمنية", "بيانات البانل",
+    ]),
+    "تحليل البيانات": ("#3a0ca3", [
+        "data analyst", "data analysis", "analytics", "sql", "excel", "tableau", "power bi", "dashboard",
+        "business intelligence", "reporting", "محلل بيانات", "تحليل البيانات", "تحليل بيانات", "لوحات المعلومات",
+    ]),
+    "علم البيانات": ("#7209b7", [
+        "data scientist", "data science", "machine learning", "deep learning", "tensorflow", "pytorch",
+        "scikit-learn", "nlp", "artificial intelligence", "عالم بيانات", "علم البيانات", "تعلم آلي",
+        "التعلم الآلي", "ذكاء اصطناعي", "التعلم العميق",
+    ]),
+}
+
+# تقديرات تقريبية تُعرض إلى أن يُبنى المؤشر من بيانات فعلية
+FALLBACK_YEARS = [2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025]
+FALLBACK_INDEX = {
+    "القياس الاقتصادي": [70, 75, 80, 83, 85, 88, 90, 92],
+    "تحليل البيانات": [75, 82, 88, 92, 95, 97, 98, 99],
+    "علم البيانات": [80, 85, 90, 93, 95, 97, 98, 99],
+}
+
+
+def keywords_version() -> str:
+    """بصمة قوائم الكلمات: تغييرها يبطل كل الأعداد المحفوظة."""
+    payload = json.dumps({name: words for name, (_, words) in FIELDS.items()}, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:12]
+
+
+# --- المطابقة (داخل العمليات العاملة) ---
+
+@lru_cache(maxsize=1)
+def matcher():
+    """تعبير منتظم واحد مُجمَّع لكل الكلمات (الأطول أولًا) مع جدول الكلمة -> رقم المجال.
+
+    النص والكلمات يمران بتطبيع البحث نفسه، فتطابق "الاحصاء" و"الإحصاء" مثلًا.
+    """
+    field_of = {}
+    for i, (_, words) in enumerate(FIELDS.values()):
+        for word in words:
+            field_of[normalize_arabic(word)] = i
+    alternatives = sorted(field_of, key=len, reverse=True)
+    pattern = re.compile(r"(?<!\w)(?:" + "|".join(map(re.escape, alternatives)) + r")(?!\w)")
+    return pattern, field_of
+
+
+def match_fields(texts) -> np.ndarray:
+    """مصفوفة منطقية (إعلان × مجال): هل يذكر الإعلان أي كلمة من كلمات المجال.
+
+    نصوص الكتلة تُضم في سلسلة واحدة (سطر لكل إعلان) تُطبَّع وتُمسح مرة واحدة، ثم يُنسب
+    كل تطابق إلى إعلانه بموضعه بين فواصل الأسطر.
+    """
+    pattern, field_of = matcher()
+    hits = np.zeros((len(texts), len(FIELDS)), dtype=bool)
+    text = normalize_arabic("\n".join(t.replace("\n", " ") for t in texts))
+    breaks = np.flatnonzero(np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32) == ord("\n"))
+    found = [(m.start(), field_of[m.group()]) for m in pattern.finditer(text)]
+    if found:
+        starts, fields = np.array(found).T
+        hits[np.searchsorted(breaks, starts), fields] = True
+    return hits
+
+
+def _parse_block(block: bytes, header: bytes, fmt: str, date_column: str, text_columns):
+    import pandas as pd
+
+    columns = [date_column, *text_columns]
+    if fmt == "csv":
+        df = pd.read_csv(io.BytesIO(header + block), dtype=str, keep_default_na=False,
+                         usecols=lambda c: c in columns)
+    else:
+        df = pd.read_json(io.BytesIO(block), lines=True, dtype=False)
+    for column in columns:
+        if column not in df.columns:
+            df[column] = ""
+    dates = pd.to_datetime(df[date_column], errors="coerce", format="mixed", utc=True)
+    first, *rest = (df[column].fillna("").astype(str) for column in text_columns)
+    texts = first.str.cat(rest, sep=" ") if rest else first
+    valid = dates.notna().to_numpy()
+    return dates[valid].dt.strftime("%Y-%m").to_numpy(), texts[valid].tolist(), int((~valid).sum())
+
+
+def count_block(block: bytes, header: bytes, fmt: str, date_column: str, text_columns):
+    """أعداد كتلة واحدة: الشهر -> [عدد الإعلانات، عدد إعلانات كل مجال...]، وعدد الصفوف بلا تاريخ صالح."""
+    months, texts, skipped = _parse_block(block, header, fmt, date_column, text_columns)
+    hits = match_fields(texts)
+    keys, codes = np.unique(months, return_inverse=True)
+    counts = np.zeros((len(keys), 1 + len(FIELDS)), dtype=np.int64)
+    np.add.at(counts[:, 0], codes, 1)
+    np.add.at(counts[:, 1:], codes, hits.astype(np.int64))
+    return {str(k): c.tolist() for k, c in zip(keys, counts)}, skipped
+
+
+# --- تقسيم الملف إلى كتل ---
+
+def _record_end(data: bytes, fmt: str) -> int:
+    """طول أطول بادئة من data تنتهي بنهاية سجل كاملة (0 إن لم يكتمل أي سجل).
+
+    في JSONL كل سطر سجل. في CSV قد يحتوي الحقل المقتبس على أسطر جديدة، فنهاية السجل
+    سطر جديد يسبقه عدد زوجي من علامات الاقتباس منذ بداية الكتلة.
+    """
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    newlines = np.flatnonzero(buffer == ord("\n"))
+    if fmt == "csv" and len(newlines):
+        quotes = np.flatnonzero(buffer == ord('"'))
+        newlines = newlines[np.searchsorted(quotes, newlines) % 2 == 0]
+    return int(newlines[-1]) + 1 if len(newlines) else 0
+
+
+def read_blocks(path: Path, offset: int, fmt: str, block_size=BLOCK_SIZE):
+    """(الكتلة، موضع نهايتها) بدءًا من offset؛ تنتهي كل كتلة بسجل مكتمل، ويُترك السجل الأخير
+    غير المنتهي بسطر جديد (قد يكون قيد الكتابة) للتشغيل القادم."""
+    with path.open("rb") as f:
+        f.seek(offset)
+        carry = b""
+        while True:
+            data = f.read(block_size)
+            if not data:
+                return
+            data = carry + data
+            end = _record_end(data, fmt)
+            if end == 0:
+                carry = data
+                continue
+            offset += end
+            carry = data[end:]
+            yield data[:end], offset
+
+
+def _header(path: Path, fmt: str) -> tuple[bytes, int]:
+    """سطر العناوين في CSV وموضع أول سجل بعده."""
+    if fmt != "csv":
+        return b"", 0
+    with path.open("rb") as f:
+        header = f.readline()
+    return header, len(header)
+
+
+def _head_fingerprint(path: Path) -> str:
+    with path.open("rb") as f:
+        return hashlib.sha1(f.read(HEAD_BYTES)).hexdigest()
+
+
+def _format(path: Path) -> str:
+    if ".jsonl" in path.suffixes or ".ndjson" in path.suffixes:
+        return "jsonl"
+    if ".csv" in path.suffixes:
+        return "csv"
+    raise ValueError(f"صيغة غير مدعومة: {path.name} (المدعوم: csv، jsonl)")
+
+
+# --- التجميع والعلامة المائية ---
+
+def load_aggregates(path: Path = AGGREGATES_PATH) -> dict:
+    if path.exists():
+        aggregates = json.loads(path.read_text(encoding="utf-8"))
+        if aggregates.get("keywords") == keywords_version() and aggregates.get("fields") == list(FIELDS):
+            return aggregates
+    return {"fields": list(FIELDS), "keywords": keywords_version(), "sources": {}}
+
+
+def _merge(months: dict, partial: dict):
+    for month, counts in partial.items():
+        current = months.setdefault(month, [0] * len(counts))
+        for i, value in enumerate(counts):
+            current[i] += value
+
+
+def update(paths, output: Path = AGGREGATES_PATH, date_column=DATE_COLUMN, text_columns=TEXT_COLUMNS,
+           workers=None, rebuild=False, block_size=BLOCK_SIZE, progress=None) -> dict:
+    """معالجة الجديد في كل ملف منذ علامته المائية، وحفظ الأعداد المجمعة مع العلامات الجديدة.
+
+    عدد الكتل قيد المعالجة محدود بضعف عدد العمليات، فالذاكرة لا تتعلق بحجم الملف.
+    """
+    aggregates = {"fields": list(FIELDS), "keywords": keywords_version(), "sources": {}} if rebuild \
+        else load_aggregates(output)
+    stats = {"bytes": 0, "blocks": 0, "postings": 0, "skipped": 0}
+    workers = workers or os.cpu_count() or 1
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for path in map(Path, paths):
+            fmt = _format(path)
+            key = str(path.resolve())
+            head = _head_fingerprint(path)
+            source = aggregates["sources"].get(key)
+            size = path.stat().st_size
+            # ملف استُبدل أو قُص: تُحذف مساهمته السابقة ويُعالج من بدايته
+            if source is None or source["head"] != head or source["offset"] > size:
+                source = {"head": head, "offset": 0, "months": {}}
+            header, first_record = _header(path, fmt)
+            start = max(source["offset"], first_record)
+
+            in_flight = deque()
+
+            def collect():
+                future, end = in_flight.popleft()
+                partial, skipped = future.result()
+                _merge(source["months"], partial)
+                source["offset"] = end
+                stats["postings"] += sum(counts[0] for counts in partial.values())
+                stats["skipped"] += skipped
+                if progress:
+                    progress(path, end, size)
+
+            for block, end in read_blocks(path, start, fmt, block_size):
+                stats["bytes"] += len(block)
+                stats["blocks"] += 1
+                in_flight.append((pool.submit(count_block, block, header, fmt, date_column, tuple(text_columns)), end))
+                if len(in_flight) >= 2 * workers:
+                    collect()
+            while in_flight:
+                collect()
+            aggregates["sources"][key] = source
+
+    aggregates["updated"] = time.time()
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp = output.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(aggregates, ensure_ascii=False, indent=1) + "\n", encoding="utf-8")
+    tmp.replace(output)
+    return stats
+
+
+def demand_index(aggregates: dict, granularity="year"):
+    """(الفترات، المجال -> المؤشر): نسبة الإعلانات التي تذكر المجال، مُحجّمة بحيث يساوي أعلى
+    مجال في أعلى فترة 100، فتبقى المجالات قابلة للمقارنة فيما بينها."""
+    months = {}
+    for source in aggregates["sources"].values():
+        _merge(months, source["months"])
+    if not months:
+        return [], {}
+
+    periods = {}
+    for month, counts in months.items():
+        _merge(periods, {month[:4] if granularity == "year" else month: counts})
+    labels = sorted(periods)
+    counts = np.array([periods[p] for p in labels], dtype=np.float64)
+    share = counts[:, 1:] / np.maximum(counts[:, :1], 1)
+    peak = share.max()
+    index = np.round(100 * share / peak, 1) if peak > 0 else share
+    if granularity == "year":
+        labels = [int(p) for p in labels]
+    return labels, {name: index[:, i].tolist() for i, name in enumerate(aggregates["fields"])}
+
+
+@st.cache_resource(show_spinner=False)
+def _cached_index(path: str, mtime: float, granularity: str):
+    return demand_index(load_aggregates(Path(path)), granularity)
+
+
+def load_demand_index(granularity="year"):
+    """(الفترات، السلاسل [(الاسم، القيم، اللون)]، هل البيانات فعلية) للمخطط.
+
+    يُعاد حساب المؤشر فقط عند تغير ملف الأعداد؛ دونه تُعرض التقديرات التقريبية السابقة.
+    """
+    if AGGREGATES_PATH.exists():
+        periods, index = _cached_index(str(AGGREGATES_PATH), AGGREGATES_PATH.stat().st_mtime, granularity)
+        if periods:
+            return periods, [(name, index[name], FIELDS[name][0]) for name in index], True
+    return FALLBACK_YEARS, [(name, values, FIELDS[name][0]) for name, values in FALLBACK_INDEX.items()], False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="بناء مؤشر الطلب على المهارات من إعلانات الوظائف")
+    parser.add_argument("sources", nargs="*", type=Path, help="ملفات CSV أو JSONL")
+    parser.add_argument("--output", type=Path, default=AGGREGATES_PATH)
+    parser.add_argument("--date-column", default=DATE_COLUMN)
+    parser.add_argument("--text-column", action="append", dest="text_columns",
+                        help=f"يمكن تكراره؛ الافتراضي: {', '.join(TEXT_COLUMNS)}")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--block-size", type=int, default=BLOCK_SIZE // 2**20, help="بالميغابايت")
+    parser.add_argument("--rebuild", action="store_true", help="تجاهل العلامات المائية والأعداد السابقة")
+    parser.add_argument("--report", action="store_true", help="عرض المؤشر فقط دون معالجة")
+    parser.add_argument("--monthly", action="store_true", help="مؤشر شهري بدل السنوي")
+    args = parser.parse_args(argv)
+
+    if args.sources and not args.report:
+        start = time.perf_counter()
+        stats = update(args.sources, args.output, args.date_column, args.text_columns or TEXT_COLUMNS,
+                       args.workers, args.rebuild, args.block_size * 2**20)
+        elapsed = time.perf_counter() - start
+        print(f"processed {stats['postings']:,} postings ({stats['bytes'] / 2**20:.0f} MiB, {stats['blocks']} blocks) "
+              f"in {elapsed:.1f} s; skipped {stats['skipped']:,} without a valid date")
+
+    periods, index = demand_index(load_aggregates(args.output), "month" if args.monthly else "year")
+    if not periods:
+        print("no aggregates yet")
+        return 0
+    print(f"{'period':<8}" + "  ".join(f"{name:>16}" for name in index))
+    for i, period in enumerate(periods):
+        print(f"{period!s:<8}" + "  ".join(f"{index[name][i]:>16.1f}" for name in index))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,344 @@
+# تصدير الدليل إلى موقع ثابت: صفحة HTML لكل قسم تُعرض مسبقًا بتشغيل econ2.py عبر AppTest
+# المخططات تُضمَّن كـ JSON لـ Plotly، وجداول الموارد تُصفّى في المتصفح،
+# وأداة التقييم الذاتي وحدها تحيل إلى التطبيق الحي
+#
+#     python -m econ.export [مجلد الإخراج] [--live-url https://...]
+#
+# الملفات في assets/ تحمل بصمة محتواها في أسمائها فتُخزن في CDN دون انتهاء صلاحية،
+# وصفحات HTML وحدها تحتاج إلى إعادة التحقق (انظر ملف _headers في الإخراج)
+
+import argparse
+import ast
+import hashlib
+import html
+import re
+import shutil
+import sys
+import textwrap
+from pathlib import Path
+
+from econ.assets import FONT_DIR, STATIC_DIR, missing_fonts, remote_font_tag
+from econ.catalog import split_categories
+from econ.tables import UNPAGED_KEY
+
+ROOT = Path(__file__).resolve().parent.parent
+APP_PATH = ROOT / "econ2.py"
+DEFAULT_OUTPUT = ROOT / "site"
+
+# أعمدة الجداول التي تُعرض لها قائمة تصفية في المتصفح
+FILTER_COLUMNS = ("التصنيف", "المستوى", "اللغة")
+
+# حاويات تعتمد على مدخلات المستخدم ولا معنى لعرضها مسبقًا: مفتاح الحاوية -> عنوان الإحالة
+LIVE_ONLY_KEYS = {
+    "self_assessment": "أداة التقييم الذاتي للمهارات",
+    "econometrics_tools": "أدوات القياس الاقتصادي التطبيقية",
+}
+
+# عناصر التحكم لا تعمل في صفحة ثابتة: التصفية يتولاها export.js
+WIDGET_TYPES = {
+    "button", "checkbox", "color_picker", "date_input", "multiselect", "number_input",
+    "radio", "select_slider", "selectbox", "slider", "text_area", "text_input", "time_input", "toggle",
+}
+
+HEADERS_FILE = """/assets/*
+  Cache-Control: public, max-age=31536000, immutable
+/*.html
+  Cache-Control: public, max-age=300, must-revalidate
+"""
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="ar" dir="rtl">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+{styles}
+{scripts}
+</head>
+<body>
+<main class="page">
+{body}
+</main>
+</body>
+</html>
+"""
+
+
+# --- تحويل Markdown: يكفي ما يستخدمه الدليل (فقرات، قوائم متداخلة، تنسيق سطري، HTML خام) ---
+
+_INLINE = [
+    (re.compile(r"`([^`]+)`"), r"<code>\1</code>"),
+    (re.compile(r"\[([^\]]+)\]\(([^)\s]+)\)"), r'<a href="\2">\1</a>'),
+    (re.compile(r"\*\*(.+?)\*\*"), r"<strong>\1</strong>"),
+    (re.compile(r"(?<![*\w])\*(?![\s*])(.+?)(?<![\s*])\*(?![*\w])"), r"<em>\1</em>"),
+]
+_LIST_ITEM = re.compile(r"^( *)([-*+]|\d+\.)\s+(.*)$")
+_HEADING = re.compile(r"^(#{1,6})\s+(.*)$")
+
+
+def _inline(text: str) -> str:
+    for pattern, replacement in _INLINE:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def markdown_to_html(text: str) -> str:
+    out, paragraph = [], []
+    lists = []  # مكدس القوائم المفتوحة: (المسافة البادئة، الوسم)
+
+    def flush_paragraph():
+        if paragraph:
+            out.append(f"<p>{_inline(' '.join(paragraph))}</p>")
+            paragraph.clear()
+
+    def close_lists(indent=-1):
+        while lists and lists[-1][0] > indent:
+            out.append(f"</li></{lists.pop()[1]}>")
+
+    for line in textwrap.dedent(text).strip("\n").splitlines():
+        stripped = line.strip()
+        if not stripped:
+            flush_paragraph()
+            continue
+
+        item = _LIST_ITEM.match(line)
+        if item:
+            flush_paragraph()
+            indent, marker, content = len(item.group(1)), item.group(2), item.group(3)
+            tag = "ol" if marker[0].isdigit() else "ul"
+            close_lists(indent)
+            if lists and lists[-1][0] == indent and lists[-1][1] == tag:
+                out.append("</li><li>")
+            else:
+                if lists and lists[-1][0] == indent:
+                    out.append(f"</li></{lists.pop()[1]}>")
+                out.append(f"<{tag}><li>")
+                lists.append((indent, tag))
+            out.append(_inline(content))
+            continue
+
+        indent = len(line) - len(line.lstrip())
+        if lists and indent > lists[-1][0]:
+            # سطر تابع لعنصر القائمة الحالي
+            out.append(" " + _inline(stripped))
+            continue
+
+        close_lists()
+        heading = _HEADING.match(stripped)
+        if stripped.startswith("<"):
+            flush_paragraph()
+            out.append(stripped)
+        elif heading:
+            flush_paragraph()
+            level = len(heading.group(1))
+            out.append(f"<h{level}>{_inline(heading.group(2))}</h{level}>")
+        else:
+            paragraph.append(stripped)
+
+    flush_paragraph()
+    close_lists()
+    return "\n".join(out)
+
+
+# --- عرض شجرة عناصر AppTest ---
+
+def section_keys(source: str) -> list[str]:
+    """مفاتيح الأقسام بترتيبها من القاموس SECTIONS في ملف التطبيق."""
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.Assign) and any(getattr(t, "id", None) == "SECTIONS" for t in node.targets):
+            return [key.value for key in node.value.keys]
+    raise ValueError("SECTIONS غير موجود في ملف التطبيق")
+
+
+def page_name(section: str, sections: list[str]) -> str:
+    return "index.html" if section == sections[0] else f"{section}.html"
+
+
+class PageRenderer:
+    def __init__(self, section, sections, labels, live_url):
+        self.section = section
+        self.sections = sections
+        self.labels = labels
+        self.live_url = live_url
+        self._ids = 0
+
+    def _next_id(self, prefix):
+        self._ids += 1
+        return f"{prefix}-{self._ids}"
+
+    def render(self, node) -> str:
+        kind = getattr(node, "type", None)
+        if kind in WIDGET_TYPES:
+            if kind == "radio" and node.key == "section":
+                return self._nav()
+            return ""
+        if kind == "markdown":
+            # رابط ورقة الأنماط في التطبيق الحي؛ الصفحة الثابتة تربط ملفاتها في الرأس
+            return "" if node.value.lstrip().startswith("<link") else markdown_to_html(node.value)
+        if kind in ("table", "dataframe"):
+            return self._table(node.value)
+        if kind == "plotly_chart":
+            return self._chart(node.proto.spec)
+        if kind == "tab_container":
+            return self._tabs(node)
+        if kind == "column":
+            return f'<div class="column" style="flex: {node.proto.weight:g}">{self._children(node)}</div>'
+        if kind == "flex_container":
+            block_id = node.proto.id
+            for key, title in LIVE_ONLY_KEYS.items():
+                if block_id.endswith(f"-{key}"):
+                    return self._live_only(title)
+            horizontal = node.proto.flex_container.direction == node.proto.flex_container.HORIZONTAL
+            return f'<div class="{"columns" if horizontal else "block"}">{self._children(node)}</div>'
+        if getattr(node, "children", None):
+            return self._children(node)
+        return ""
+
+    def _children(self, node) -> str:
+        return "\n".join(filter(None, (self.render(child) for child in node.children.values())))
+
+    def _nav(self) -> str:
+        links = []
+        for key in self.sections:
+            active = ' class="active" aria-current="page"' if key == self.section else ""
+            links.append(f'<a href="{page_name(key, self.sections)}"{active}>{html.escape(self.labels[key])}</a>')
+        return f'<nav class="sections">{"".join(links)}</nav>'
+
+    def _tabs(self, node) -> str:
+        tabs = list(node.children.values())
+        buttons = "".join(
+            f'<button type="button" role="tab" aria-selected="{"true" if i == 0 else "false"}">'
+            f"{html.escape(tab.label)}</button>"
+            for i, tab in enumerate(tabs)
+        )
+        panels = "".join(
+            f'<div class="tab-panel" role="tabpanel"{"" if i == 0 else " hidden"}>{self._children(tab)}</div>'
+            for i, tab in enumerate(tabs)
+        )
+        return f'<div class="tabs"><div class="tab-list" role="tablist">{buttons}</div>{panels}</div>'
+
+    def _chart(self, spec: str) -> str:
+        figure_id = self._next_id("figure")
+        # منع إغلاق وسم script من داخل نصوص المخطط
+        spec = spec.replace("</", "<\\/")
+        return (f'<div class="chart" data-figure="{figure_id}"></div>'
+                f'<script type="application/json" id="{figure_id}">{spec}</script>')
+
+    def _table(self, df) -> str:
+        table_id = self._next_id("table")
+        show_index = df.index.name is not None
+        table = df.to_html(index=show_index, border=0, classes="data-table", table_id=table_id,
+                           na_rep="", escape=True)
+
+        filters = []
+        offset = df.index.nlevels if show_index else 0
+        for column in FILTER_COLUMNS:
+            if column not in df.columns:
+                continue
+            values = df[column].dropna().astype(str)
+            options = sorted({tag for v in values for tag in split_categories(v)} if column == "التصنيف"
+                             else set(values))
+            position = offset + list(df.columns).index(column)
+            # data-tags: الخلية قائمة وسوم يُطابق أحدها كاملًا، وإلا فالمطابقة للقيمة كلها
+            tags = ' data-tags="1"' if column == "التصنيف" else ""
+            filters.append(
+                f'<select data-column="{position}"{tags} aria-label="{html.escape(column)}">'
+                f'<option value="">{html.escape(column)}: الكل</option>'
+                + "".join(f"<option>{html.escape(o)}</option>" for o in options)
+                + "</select>"
+            )
+        if not filters:
+            return f'<div class="table-wrap">{table}</div>'
+
+        bar = (f'<div class="table-filter" data-table="{table_id}">'
+               f'<input type="search" placeholder="ابحث في الجدول..." aria-label="بحث">{"".join(filters)}</div>')
+        return f'{bar}<div class="table-wrap">{table}</div>'
+
+    def _live_only(self, title) -> str:
+        link = (f'<a class="live-link" href="{html.escape(self.live_url)}">افتح الأداة في التطبيق التفاعلي</a>'
+                if self.live_url else "<code>streamlit run econ2.py</code>")
+        return (f'<div class="live-only"><h3>{html.escape(title)}</h3>'
+                "<p>هذه الأداة تعتمد على مدخلاتك، لذلك تعمل في النسخة التفاعلية من الدليل فقط.</p>"
+                f"<p>{link}</p></div>")
+
+
+# --- كتابة الموقع ---
+
+def _copy_hashed(source: Path, assets_dir: Path) -> str:
+    """نسخ الملف باسم يحمل بصمة محتواه، وإعادة اسمه الجديد."""
+    digest = hashlib.sha1(source.read_bytes()).hexdigest()[:10]
+    name = f"{source.stem}.{digest}{source.suffix}"
+    shutil.copyfile(source, assets_dir / name)
+    return name
+
+
+def _plotly_js() -> Path:
+    import plotly
+
+    return Path(plotly.__file__).parent / "package_data" / "plotly.min.js"
+
+
+def export_site(output: Path = DEFAULT_OUTPUT, live_url: str = "") -> list[Path]:
+    from streamlit.testing.v1 import AppTest
+
+    source = APP_PATH.read_text(encoding="utf-8")
+    sections = section_keys(source)
+
+    assets_dir = output / "assets"
+    if assets_dir.exists():
+        shutil.rmtree(assets_dir)
+    assets_dir.mkdir(parents=True)
+    # econ.css يشير إلى الخطوط بمسار نسبي fonts/
+    missing = missing_fonts()
+    if missing:
+        print(f"تحذير: ملفات الخط ناقصة في {FONT_DIR} ({', '.join(missing)})؛ "
+              "سيُحمَّل الخط من Google Fonts. انظر python -m econ.assets", file=sys.stderr)
+    if any(FONT_DIR.glob("*.ttf")):
+        shutil.copytree(FONT_DIR, assets_dir / "fonts")
+
+    styles = [_copy_hashed(STATIC_DIR / name, assets_dir) for name in ("econ.css", "export.css")]
+    scripts = [_copy_hashed(_plotly_js(), assets_dir), _copy_hashed(STATIC_DIR / "export.js", assets_dir)]
+    head_styles = "\n".join([*(f'<link rel="stylesheet" href="assets/{name}">' for name in styles),
+                             remote_font_tag()]).rstrip()
+    head_scripts = "\n".join(f'<script defer src="assets/{name}"></script>' for name in scripts)
+
+    at = AppTest.from_file(str(APP_PATH), default_timeout=120)
+    # الموقع الثابت يصفّي جداوله في المتصفح، فيحتاج إلى كل الصفوف لا الصفحة الأولى فقط
+    at.session_state[UNPAGED_KEY] = True
+    at.run()
+    labels = dict(zip(sections, at.radio(key="section").options))
+
+    pages = []
+    for section in sections:
+        at.radio(key="section").set_value(section)
+        at.run()
+        if at.exception:
+            raise RuntimeError(f"{section}: {at.exception[0].message}")
+
+        body = PageRenderer(section, sections, labels, live_url).render(at.main)
+        path = output / page_name(section, sections)
+        path.write_text(PAGE_TEMPLATE.format(
+            title=html.escape(f"{labels[section]} · الدليل الشامل للتخصص في القياس الاقتصادي وعلم البيانات"),
+            styles=head_styles,
+            scripts=head_scripts,
+            body=body
+        ), encoding="utf-8")
+        pages.append(path)
+
+    (output / "_headers").write_text(HEADERS_FILE, encoding="utf-8")
+    return pages
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="تصدير الدليل إلى موقع HTML ثابت")
+    parser.add_argument("output", nargs="?", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--live-url", default="", help="رابط التطبيق الحي لأداة التقييم الذاتي")
+    args = parser.parse_args(argv)
+
+    for path in export_site(args.output, args.live_url):
+        print(f"{path} ({path.stat().st_size // 1024} KiB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,284 @@
+# استيراد الموارد بالجملة من ملفات CSV/Parquet إلى الكتالوج
+# يُقرأ الملف على دفعات، وتُتحقق كل دفعة من المخطط وتُطبّع تصنيفاتها وتُزال المكررات (بالرابط أو العنوان)،
+# ثم تُكتب إلى ملف Arrow IPC غير مضغوط يربطه التطبيق بالذاكرة عند الإقلاع (econ.catalog.read_catalog)
+#
+#     python -m econ.ingest books new_books.csv                 # إضافة إلى الكتب الحالية
+#     python -m econ.ingest courses courses.parquet --replace   # استبدال جدول الدورات بالكامل
+#     python -m econ.ingest blogs blogs.csv --rejects rejected.csv --chunk-size 20000
+#
+# الذاكرة محدودة بحجم الدفعة، إضافة إلى بصمة من 8 بايت لكل صف مقبول لإزالة المكررات
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from econ.catalog import CATALOG_DIR, CATEGORY_COLUMN, read_table, split_categories
+
+CHUNK_SIZE = 50_000
+
+URL_COLUMN = "الرابط"
+
+# لكل جدول: أعمدته بترتيب العرض، الأعمدة الإلزامية، وأعمدة مفتاح إزالة التكرار عند غياب الرابط
+SCHEMAS = {
+    "books": {
+        "columns": ("العنوان", "المؤلف", "المستوى", "الوصف", "التصنيف", "الرابط"),
+        "required": ("العنوان", "المؤلف"),
+        "key": ("العنوان", "المؤلف"),
+    },
+    "courses": {
+        "columns": ("العنوان", "المنصة", "المقدم", "المستوى", "المدة", "الرابط", "التصنيف"),
+        "required": ("العنوان", "المنصة"),
+        "key": ("العنوان", "المنصة", "المقدم"),
+    },
+    "youtube_channels": {
+        "columns": ("القناة", "المحتوى", "اللغة", "الرابط", "التصنيف"),
+        "required": ("القناة",),
+        "key": ("القناة",),
+    },
+    "websites": {
+        "columns": ("الموقع", "الوصف", "الرابط", "التصنيف"),
+        "required": ("الموقع", "الرابط"),
+        "key": ("الموقع",),
+    },
+    "blogs": {
+        "columns": ("المدونة", "الكاتب", "الوصف", "الرابط", "التصنيف"),
+        "required": ("المدونة",),
+        "key": ("المدونة", "الكاتب"),
+    },
+}
+
+_SPACES = re.compile(r"\s+")
+_URL = re.compile(r"^https?://[^\s/]+\S*$", re.IGNORECASE)
+
+
+def normalize_category(value: str) -> str:
+    """توحيد قيمة التصنيف: فاصل "، " واحد، مسافات مفردة، بلا تطويل ولا وسوم مكررة أو فارغة."""
+    tags = []
+    for tag in split_categories(value.replace("ـ", "")):
+        tag = _SPACES.sub(" ", tag)
+        if tag not in tags:
+            tags.append(tag)
+    return "، ".join(tags)
+
+
+def fingerprints(df: pd.DataFrame, key_columns) -> np.ndarray:
+    """بصمة 64 بت لكل صف: من الرابط إن وُجد، وإلا من أعمدة المفتاح.
+
+    الرابط يُقارن بلا بروتوكول ولا www ولا جزء # ولا / أخيرة وبأحرف صغيرة، والمفتاح بعد توحيد
+    المسافات وحالة الأحرف. التجزئة (SipHash عبر pandas) متجهة وثابتة بين التشغيلات.
+    """
+    key = df[key_columns[0]]
+    for column in key_columns[1:]:
+        key = key + "|" + df[column]
+    key = "key:" + key.str.replace(_SPACES, " ", regex=True).str.lower()
+    if URL_COLUMN in df.columns:
+        url = (df[URL_COLUMN].str.replace(r"#.*$", "", regex=True)
+               .str.replace(r"^https?://(www\.)?", "", regex=True, case=False)
+               .str.rstrip("/").str.lower())
+        key = key.where(df[URL_COLUMN] == "", "url:" + url)
+    return pd.util.hash_array(key.to_numpy(dtype=object))
+
+
+def _new_rows(values: np.ndarray, seen: np.ndarray) -> np.ndarray:
+    """قناع أول ظهور لكل بصمة داخل الدفعة، بشرط ألا تكون ضمن seen (مصفوفة مرتبة)."""
+    order = np.argsort(values, kind="stable")
+    ordered = values[order]
+    first = np.ones(len(values), dtype=bool)
+    first[order[1:][ordered[1:] == ordered[:-1]]] = False
+
+    position = np.searchsorted(seen, values)
+    found = position < len(seen)
+    found[found] = seen[position[found]] == values[found]
+    return first & ~found
+
+
+@dataclass
+class IngestReport:
+    table: str
+    existing: int = 0
+    read: int = 0
+    written: int = 0
+    duplicates: int = 0
+    rejected: Counter = field(default_factory=Counter)
+    ignored_columns: list = field(default_factory=list)
+    path: Path = None
+    version: str = ""
+
+
+def _clean_chunk(df: pd.DataFrame, schema) -> tuple[pd.DataFrame, pd.Series]:
+    """تنظيف دفعة وإعادة (الدفعة بأعمدة المخطط، سبب الرفض لكل صف أو "" للصفوف السليمة)."""
+    df = df.reindex(columns=schema["columns"]).fillna("").astype(str)
+    for column in df.columns:
+        df[column] = df[column].str.strip()
+
+    if CATEGORY_COLUMN in df.columns:
+        # التطبيع مرة لكل قيمة مميزة ثم توزيع النتيجة على الصفوف
+        codes, uniques = pd.factorize(df[CATEGORY_COLUMN])
+        normalized = [normalize_category(value) for value in uniques]
+        df[CATEGORY_COLUMN] = pd.Series(normalized, dtype=str).take(codes).to_numpy()
+
+    reason = pd.Series("", index=df.index, dtype=object)
+    for column in schema["required"]:
+        reason = reason.mask((reason == "") & (df[column] == ""), f"missing:{column}")
+    if URL_COLUMN in df.columns:
+        bad_url = (df[URL_COLUMN] != "") & ~df[URL_COLUMN].str.match(_URL)
+        reason = reason.mask((reason == "") & bad_url, "invalid:الرابط")
+    return df, reason
+
+
+def _chunks(path: Path, chunk_size: int):
+    """دفعات DataFrame من ملف CSV أو Parquet دون قراءته كاملًا."""
+    suffixes = path.suffixes
+    if ".parquet" in suffixes or ".pq" in suffixes:
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
+    elif ".csv" in suffixes or ".tsv" in suffixes:
+        yield from pd.read_csv(path, chunksize=chunk_size, dtype=str, keep_default_na=False,
+                               sep="\t" if ".tsv" in suffixes else ",", encoding="utf-8-sig")
+    else:
+        raise ValueError(f"صيغة غير مدعومة: {path.name} (المدعوم: csv، tsv، parquet)")
+
+
+def _existing_chunks(path: Path):
+    """صفوف الجدول الحالي: ملف Arrow دفعةً دفعة كما كُتب، أو ملف JSON (الجداول الصغيرة) دفعة واحدة."""
+    if path.suffix == ".arrow":
+        reader = pa.ipc.open_file(pa.memory_map(str(path)))
+        for i in range(reader.num_record_batches):
+            yield reader.get_batch(i).to_pandas()
+    else:
+        yield read_table(path)
+
+
+def _source_columns(path: Path) -> list[str]:
+    if ".parquet" in path.suffixes or ".pq" in path.suffixes:
+        return pq.ParquetFile(path).schema_arrow.names
+    return list(pd.read_csv(path, nrows=0, sep="\t" if ".tsv" in path.suffixes else ",",
+                            encoding="utf-8-sig").columns)
+
+
+def _next_version(version: str, table: str, digest: str) -> str:
+    return hashlib.sha1(f"{version}:{table}:{digest}".encode("utf-8")).hexdigest()[:12]
+
+
+def _write_json_atomic(path: Path, data):
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    tmp.replace(path)
+
+
+def ingest(table: str, source: Path, catalog_dir: Path = CATALOG_DIR, replace: bool = False,
+           chunk_size: int = CHUNK_SIZE, rejects: Path = None) -> IngestReport:
+    """استيراد ملف إلى جدول من الكتالوج وكتابة الجدول الناتج بصيغة Arrow.
+
+    الصفوف الحالية (ما لم يُطلب replace) تُكتب أولًا وتُسجل بصماتها، فتُعد الصفوف المستوردة
+    المطابقة لها مكررة. لا يُعدَّل ملف الجدول ولا manifest.json إلا بعد اكتمال الكتابة بنجاح.
+    """
+    if table not in SCHEMAS:
+        raise ValueError(f"جدول غير معروف: {table} (المتاح: {', '.join(SCHEMAS)})")
+    schema = SCHEMAS[table]
+
+    source_columns = _source_columns(source)
+    missing = [c for c in schema["required"] if c not in source_columns]
+    if missing:
+        raise ValueError(f"أعمدة إلزامية غير موجودة في {source.name}: {', '.join(missing)}")
+
+    manifest_path = catalog_dir / "manifest.json"
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    files = manifest.get("files", {})
+
+    report = IngestReport(table=table, ignored_columns=[c for c in source_columns if c not in schema["columns"]])
+    arrow_schema = pa.schema([(column, pa.string()) for column in schema["columns"]])
+    output = catalog_dir / f"{table}.arrow"
+    tmp = output.with_suffix(f".{os.getpid()}.tmp")
+    seen = np.empty(0, dtype=np.uint64)  # بصمات الصفوف المكتوبة، مرتبة
+    digest = hashlib.blake2b(digest_size=16)
+    rejects_written = False
+
+    def write(writer, df, reason, count_as_existing=False):
+        nonlocal rejects_written, seen
+        if rejects is not None and (reason != "").any():
+            rejected = df[reason != ""].assign(سبب_الرفض=reason[reason != ""])
+            rejected.to_csv(rejects, mode="a" if rejects_written else "w", header=not rejects_written,
+                            index=False, encoding="utf-8")
+            rejects_written = True
+        report.rejected.update(reason[reason != ""])
+        df = df[reason == ""]
+
+        values = fingerprints(df, schema["key"])
+        keep = _new_rows(values, seen)
+        # دمج البصمات الجديدة مع المرتبة سابقًا: الفرز المستقر يدمج السلسلتين المرتبتين خطيًا
+        seen = np.concatenate([seen, np.sort(values[keep])])
+        seen.sort(kind="stable")
+        digest.update(values[keep].tobytes())
+        df = df[keep]
+        report.duplicates += len(keep) - len(df)
+
+        writer.write_table(pa.Table.from_pandas(df, schema=arrow_schema, preserve_index=False))
+        if count_as_existing:
+            report.existing += len(df)
+        else:
+            report.written += len(df)
+
+    try:
+        with pa.OSFile(str(tmp), "wb") as sink, pa.ipc.new_file(sink, arrow_schema) as writer:
+            current = catalog_dir / files.get(table, f"{table}.json")
+            if not replace and current.exists():
+                for chunk in _existing_chunks(current):
+                    df, reason = _clean_chunk(chunk, schema)
+                    write(writer, df, reason, count_as_existing=True)
+            for chunk in _chunks(source, chunk_size):
+                report.read += len(chunk)
+                df, reason = _clean_chunk(chunk, schema)
+                write(writer, df, reason)
+        tmp.replace(output)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+    manifest["files"] = {**files, table: output.name}
+    manifest["version"] = _next_version(str(manifest["version"]), table, digest.hexdigest())
+    _write_json_atomic(manifest_path, manifest)
+
+    report.path = output
+    report.version = manifest["version"]
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="استيراد موارد من CSV/Parquet إلى الكتالوج")
+    parser.add_argument("table", choices=sorted(SCHEMAS))
+    parser.add_argument("source", type=Path)
+    parser.add_argument("--catalog", type=Path, default=CATALOG_DIR)
+    parser.add_argument("--replace", action="store_true", help="استبدال الجدول بدل الإضافة إليه")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--rejects", type=Path, help="كتابة الصفوف المرفوضة مع سبب الرفض إلى ملف CSV")
+    args = parser.parse_args(argv)
+
+    try:
+        report = ingest(args.table, args.source, args.catalog, args.replace, args.chunk_size, args.rejects)
+    except ValueError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 2
+
+    print(f"{report.table}: read {report.read:,}, written {report.written:,}, kept existing {report.existing:,}, "
+          f"duplicates {report.duplicates:,}, rejected {sum(report.rejected.values()):,}")
+    for reason, count in report.rejected.most_common():
+        print(f"  rejected {reason}: {count:,}")
+    if report.ignored_columns:
+        print(f"  ignored columns: {', '.join(report.ignored_columns)}")
+    print(f"wrote {report.path} ({report.path.stat().st_size / 2**20:.1f} MiB), catalog version {report.version}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,900 @@
+# الأدوات التطبيقية في قسم القياس الاقتصادي: تجارب تفاعلية بجانب الشرح النظري
+# كل أداة fragment مستقل، فتغيير مدخلاتها لا يعيد رسم بقية القسم، ومدخلاتها داخل نموذج
+# فلا يُعاد التقدير إلا عند الإرسال. البيانات والنتائج مخزنة على مستوى العملية حسب مدخلاتها،
+# فالعودة إلى إعداد سابق (أو فتحه من جلسة أخرى) لا تعيد الحساب
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import replace
+
+import numpy as np
+import streamlit as st
+
+from econ import charts, montecarlo, ols, panel, profiler, resample, streaming, system
+
+# أقصى عدد خلايا (صفوف × متغيرات) لبيانات المختبر في الذاكرة: 50 مليون خلية ≈ 400 ميغابايت
+MAX_CELLS = int(os.environ.get("ECON_LAB_MAX_CELLS", "50000000"))
+
+# أقصى عدد عمليات يطلبها تشغيل واحد من أي جلسة: الخادم مشترك، فلا يُترك الحد لعدد أنوية الجهاز
+MAX_WORKERS = max(1, min(int(os.environ.get("ECON_LAB_MAX_WORKERS", "2")), os.cpu_count() or 1))
+
+# عدد نقاط مخطط البواقي: عينة عشوائية ثابتة مهما كبر عدد المشاهدات
+RESIDUAL_POINTS = 2000
+HISTOGRAM_BINS = 40
+
+SAMPLE_SIZES = [1_000, 10_000, 100_000, 1_000_000, 2_000_000]
+CLUSTER_COUNTS = [0, 10, 50, 200, 1000]
+
+ESTIMATORS = {
+    "OLS": "المربعات الصغرى العادية (OLS)",
+    "WLS": "المربعات الصغرى الموزونة (WLS)",
+    "FGLS": "المربعات الصغرى المعممة الممكنة (FGLS)",
+}
+
+COV_LABELS = {
+    "nonrobust": "عادية (بافتراض تجانس التباين)",
+    "HC0": "HC0 (White)",
+    "HC1": "HC1 (تصحيح درجات الحرية)",
+    "HC2": "HC2 (تصحيح الرافعة)",
+    "HC3": "HC3 (الأكثر تحفظًا في العينات الصغيرة)",
+    "cluster": "عنقودية",
+}
+
+THEORY = {
+    "OLS": "يقدّر **OLS** المعاملات بتصغير مجموع مربعات البواقي: β̂ = (X'X)⁻¹X'y. يبقى غير متحيز مع عدم تجانس التباين، "
+           "لكنه يفقد الكفاءة وتصبح أخطاؤه المعيارية العادية مضللة، ولذا تُستخدم الأخطاء المتينة.",
+    "WLS": "يعطي **WLS** كل مشاهدة وزنًا يتناسب عكسيًا مع تباين خطئها، فيستعيد الكفاءة حين يكون شكل التباين معروفًا. "
+           "في البيانات المحاكاة تُستخدم الأوزان الحقيقية.",
+    "FGLS": "حين يكون التباين مجهولًا يقدّره **FGLS** من البيانات: انحدار log(û²) على المتغيرات المستقلة، "
+            "ثم WLS بمقلوب التباين المقدر.",
+}
+
+TOOLS = {
+    "regression": "مختبر الانحدار (OLS / WLS / FGLS)",
+    "streaming": "انحدار تدفقي على ملف كبير",
+    "resampling": "Bootstrap واختبارات التبديل",
+    "montecarlo": "محاكاة مونت كارلو لخصائص المقدرات",
+    "panel": "بيانات البانل: تأثيرات ثابتة وعشوائية",
+    "system": "نظم المعادلات الآنية (2SLS / 3SLS)",
+}
+
+# القيم الابتدائية لعناصر التحكم؛ تُعيَّن عبر session_state لا value= لأن التطبيق
+# يعيد تعيين قيمها عند التنقل بين الأقسام (PERSISTENT_KEYS في econ2.py)
+DEFAULTS = {
+    "lab_source": "محاكاة",
+    "lab_n": 10_000,
+    "lab_k": 5,
+    "lab_hetero": 1.0,
+    "lab_seed": 0,
+    "lab_clusters": 50,
+    "lab_rho": 0.3,
+    "lab_estimator": "OLS",
+    "lab_cov": "HC1",
+    "lab_const": True,
+    "stream_const": True,
+    "stream_cov": "HC1",
+    "stream_workers": 1,
+    "resample_n": 10_000,
+    "resample_k": 3,
+    "resample_hetero": 1.0,
+    "resample_clusters": 50,
+    "resample_method": "pairs",
+    "resample_reps": 999,
+    "resample_workers": 1,
+    "mc_rho": 0.5,
+    "mc_pi": 0.5,
+    "mc_gamma": 0.5,
+    "mc_periods": 5,
+    "mc_sizes": [100, 1_000, 10_000],
+    "mc_reps": 1000,
+    "mc_estimators": list(montecarlo.ESTIMATORS),
+    "panel_entities": 10_000,
+    "panel_periods": 10,
+    "panel_k": 2,
+    "panel_dropout": 0.0,
+    "panel_correlation": 0.5,
+    "panel_estimators": ["pooled", "fe", "twoway", "re"],
+    "panel_cov": "cluster",
+    "system_equations": 10,
+    "system_rows": 100_000,
+    "system_rho": 0.5,
+    "system_gamma": 0.4,
+    "system_method": "3sls",
+}
+
+PERSISTENT_KEYS = [
+    "econ_tool", *DEFAULTS, "lab_y", "lab_x", "lab_w", "lab_cluster",
+    "stream_file", "stream_y", "stream_x", "stream_w", "stream_cluster",
+]
+
+# نتائج الأدوات الطويلة (التدفقي وإعادة المعاينة) الأخيرة، مشتركة بين الجلسات
+RESULTS_SIZE = 16
+
+
+def render_tools():
+    """اختيار أداة تطبيقية وعرضها؛ لا يُحسب شيء قبل اختيار أداة."""
+    tool = st.selectbox(
+        "أداة تطبيقية:",
+        list(TOOLS),
+        index=None,
+        format_func=TOOLS.get,
+        placeholder="اختر أداة لتجربة المفاهيم على بيانات...",
+        key="econ_tool"
+    )
+    if tool is None:
+        return
+    for key, value in DEFAULTS.items():
+        st.session_state.setdefault(key, value)
+    if tool == "regression":
+        render_regression_lab()
+    elif tool == "streaming":
+        render_streaming_lab()
+    elif tool == "resampling":
+        render_resampling_lab()
+    elif tool == "montecarlo":
+        render_montecarlo_lab()
+    elif tool == "panel":
+        render_panel_lab()
+    elif tool == "system":
+        render_system_lab()
+
+
+@st.cache_resource(show_spinner=False)
+def _results():
+    # ذاكرة LRU يدوية لا st.cache_resource على الحساب نفسه، لأن الحساب يحدّث عناصر الصفحة أثناء عمله
+    return OrderedDict(), threading.Lock()
+
+
+def _recall(key):
+    results, lock = _results()
+    with lock:
+        entry = results.get(key)
+        if entry is not None:
+            results.move_to_end(key)
+        return entry
+
+
+def _remember(key, value):
+    results, lock = _results()
+    with lock:
+        results[key] = value
+        while len(results) > RESULTS_SIZE:
+            results.popitem(last=False)
+    return value
+
+
+# --- البيانات ---
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def simulate(n, k, hetero, clusters, rho, seed):
+    """بيانات انحدار محاكاة: ثابت و k-1 متغيرًا طبيعيًا، وخطأ تباينه exp(hetero·x1).
+
+    مع العناقيد يشترك أفراد العنقود في جزء من المتغيرات ومن الخطأ بنسبة rho،
+    وهي الحالة التي تقلل فيها الأخطاء المعيارية العادية والمتينة من عدم اليقين.
+    """
+    rng = np.random.default_rng(seed)
+    X = np.empty((n, k))
+    X[:, 0] = 1.0
+    X[:, 1:] = rng.standard_normal((n, k - 1))
+    eps = rng.standard_normal(n)
+    groups = None
+    if clusters:
+        groups = rng.integers(0, clusters, n)
+        X[:, 1:] *= np.sqrt(1.0 - rho)
+        X[:, 1:] += np.sqrt(rho) * rng.standard_normal((clusters, k - 1))[groups]
+        eps = np.sqrt(1.0 - rho) * eps + np.sqrt(rho) * rng.standard_normal(clusters)[groups]
+    variance = np.exp(hetero * X[:, 1]) if k > 1 else np.ones(n)
+    beta = np.round(rng.normal(0.0, 1.0, k), 2)
+    y = X @ beta + np.sqrt(variance) * eps
+    names = ["const"] + [f"x{i}" for i in range(1, k)]
+    return {"X": X, "y": y, "names": names, "beta": beta, "variance": variance, "groups": groups}
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _read_upload(file_id, _data: bytes):
+    # الملف المرفوع يُعرّف بمعرّفه، فلا تُجزَّأ محتوياته في كل تشغيل
+    import io
+
+    import pandas as pd
+
+    return pd.read_csv(io.BytesIO(_data))
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _upload_data(file_id, _df, y_column, x_columns, constant, weight_column, cluster_column):
+    columns = [y_column, *x_columns, *filter(None, [weight_column, cluster_column])]
+    df = _df[columns].dropna()
+    X = df[x_columns].to_numpy(dtype=np.float64)
+    names = list(x_columns)
+    if constant:
+        X = np.column_stack([np.ones(len(df)), X])
+        names = ["const"] + names
+    return {
+        "X": X,
+        "y": df[y_column].to_numpy(dtype=np.float64),
+        "names": names,
+        "beta": None,
+        "variance": 1.0 / df[weight_column].to_numpy(dtype=np.float64) if weight_column else None,
+        "groups": df[cluster_column].to_numpy() if cluster_column else None,
+    }
+
+
+# --- التقدير ---
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def estimate(data_key, estimator, cov_type, _data):
+    """التقدير والتشخيص وملخصات المخططات لبيانات data_key؛ لا تُحفظ البواقي الكاملة."""
+    X, y, groups = _data["X"], _data["y"], _data["groups"]
+    start = time.perf_counter()
+    with profiler.section(f"lab:{estimator}:{cov_type}"):
+        if estimator == "FGLS":
+            result = ols.fgls(X, y, names=_data["names"], cov_type=cov_type, groups=groups)
+        else:
+            weights = 1.0 / _data["variance"] if estimator == "WLS" else None
+            result = ols.fit(X, y, names=_data["names"], weights=weights, cov_type=cov_type, groups=groups)
+    elapsed = time.perf_counter() - start
+    tests = ols.diagnostics(result, X)
+
+    resid = result.resid
+    sample = np.random.default_rng(0).choice(len(resid), min(len(resid), RESIDUAL_POINTS), replace=False)
+    counts, edges = np.histogram(resid, bins=HISTOGRAM_BINS)
+    sd = resid.std()
+    centers = (edges[:-1] + edges[1:]) / 2
+    normal = len(resid) * (edges[1] - edges[0]) * np.exp(-0.5 * (centers / sd) ** 2) / (sd * np.sqrt(2 * np.pi))
+
+    table = result.table()
+    if _data["beta"] is not None:
+        table.insert(1, "القيمة الحقيقية", _data["beta"])
+    return {
+        "table": table,
+        "tests": tests,
+        "nobs": result.nobs,
+        "k": len(result.params),
+        "r2": result.rsquared,
+        "r2_adj": result.rsquared_adj,
+        "method": result.method,
+        "seconds": elapsed,
+        "fitted": np.round(result.fitted[sample], 4).tolist(),
+        "resid": np.round(resid[sample], 4).tolist(),
+        "edges": np.round(edges, 4).tolist(),
+        "counts": counts.tolist(),
+        "normal": np.round(normal, 2).tolist(),
+    }
+
+
+# --- الواجهة ---
+
+@profiler.fragment("regression_lab")
+def render_regression_lab():
+    with st.container(key="econometrics_lab"):
+        source = st.radio("مصدر البيانات:", ["محاكاة", "ملف CSV"], horizontal=True, key="lab_source")
+
+        if source == "محاكاة":
+            data_key, data = _simulation_inputs()
+        else:
+            data_key, data = _upload_inputs()
+        if data is None:
+            return
+
+        with st.form("lab_estimator_form", border=False):
+            col1, col2 = st.columns(2)
+            with col1:
+                estimator = st.radio("المقدِّر:", list(ESTIMATORS), format_func=ESTIMATORS.get, key="lab_estimator")
+            with col2:
+                cov_types = [c for c in ols.COV_TYPES if c != "cluster" or data["groups"] is not None]
+                if st.session_state["lab_cov"] not in cov_types:
+                    st.session_state["lab_cov"] = DEFAULTS["lab_cov"]
+                cov_type = st.radio("الأخطاء المعيارية:", cov_types, format_func=COV_LABELS.get, key="lab_cov")
+            st.form_submit_button("تقدير", key="lab_submit")
+
+        if estimator == "WLS" and data["variance"] is None:
+            st.warning("WLS يحتاج إلى عمود أوزان؛ اختر عمود الأوزان أعلاه.")
+            return
+
+        st.markdown(THEORY[estimator])
+        with st.spinner("جارٍ التقدير..."):
+            try:
+                fit = estimate(data_key, estimator, cov_type, data)
+            except ValueError as error:
+                st.error(str(error))
+                return
+
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("المشاهدات", f"{fit['nobs']:,}")
+        col2.metric("R²", f"{fit['r2']:.4f}")
+        col3.metric("R² المعدل", f"{fit['r2_adj']:.4f}")
+        col4.metric("زمن التقدير", f"{fit['seconds'] * 1000:,.0f} ms")
+        st.caption(f"{fit['k']} معاملًا؛ الحل عبر {'Cholesky على X′X' if fit['method'] == 'cholesky' else 'QR على X'}.")
+
+        st.dataframe(
+            fit["table"],
+            hide_index=True,
+            use_container_width=True,
+            column_config={
+                column: st.column_config.NumberColumn(format="%.4f")
+                for column in fit["table"].columns[1:]
+            }
+        )
+
+        st.markdown("<h4>تشخيص البواقي</h4>", unsafe_allow_html=True)
+        col1, col2 = st.columns(2)
+        with col1:
+            charts.plotly_chart('residuals_fitted', fitted=fit["fitted"], resid=fit["resid"])
+        with col2:
+            charts.plotly_chart('residuals_histogram', edges=fit["edges"], counts=fit["counts"], normal=fit["normal"])
+
+        import pandas as pd
+
+        st.table(pd.DataFrame([
+            {"الاختبار": name, "الإحصاءة": f"{stat:.4f}", "قيمة p": "—" if p is None else f"{p:.4f}"}
+            for name, (stat, p) in fit["tests"].items()
+        ]).set_index("الاختبار"))
+
+
+def _simulation_inputs():
+    with st.form("lab_simulation_form", border=False):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            n = st.select_slider("عدد المشاهدات:", SAMPLE_SIZES, format_func="{:,}".format, key="lab_n")
+            k = st.slider("عدد المعاملات (مع الثابت):", 2, 200, key="lab_k")
+        with col2:
+            hetero = st.slider("شدة عدم تجانس التباين:", 0.0, 2.0, step=0.1, key="lab_hetero")
+            seed = st.number_input("البذرة العشوائية:", 0, 10_000, key="lab_seed")
+        with col3:
+            clusters = st.select_slider(
+                "عدد العناقيد:", CLUSTER_COUNTS,
+                format_func=lambda c: "بدون" if c == 0 else f"{c:,}", key="lab_clusters"
+            )
+            rho = st.slider("الارتباط داخل العنقود:", 0.0, 0.9, step=0.1, key="lab_rho", disabled=clusters == 0)
+        st.form_submit_button("توليد البيانات", key="lab_generate")
+
+    if n * k > MAX_CELLS:
+        st.error(f"حجم البيانات ({n:,} × {k}) يتجاوز حد المختبر ({MAX_CELLS:,} خلية)؛ قلّل عدد المشاهدات أو المعاملات.")
+        return None, None
+    key = ("sim", n, k, hetero, clusters, rho if clusters else 0.0, seed)
+    with st.spinner("جارٍ توليد البيانات..."):
+        return key, simulate(*key[1:])
+
+
+def _upload_inputs():
+    uploaded = st.file_uploader("ملف CSV:", type=["csv"], key="lab_upload")
+    if uploaded is None:
+        st.info("ارفع ملف CSV يحتوي على متغير تابع ومتغير مستقل واحد على الأقل.")
+        return None, None
+    df = _read_upload(uploaded.file_id, uploaded.getvalue())
+    numeric = list(df.select_dtypes("number").columns)
+    if len(numeric) < 2:
+        st.error("الملف يحتاج إلى عمودين رقميين على الأقل.")
+        return None, None
+
+    st.session_state.setdefault("lab_x", numeric[1:2])
+    with st.form("lab_columns_form", border=False):
+        col1, col2 = st.columns(2)
+        with col1:
+            y_column = st.selectbox("المتغير التابع:", numeric, key="lab_y")
+            x_columns = st.multiselect("المتغيرات المستقلة:", numeric, key="lab_x")
+            constant = st.checkbox("إضافة ثابت", key="lab_const")
+        with col2:
+            weight_column = st.selectbox("عمود الأوزان (WLS):", numeric, index=None, key="lab_w")
+            cluster_column = st.selectbox("عمود العناقيد:", list(df.columns), index=None, key="lab_cluster")
+        st.form_submit_button("اعتماد الأعمدة", key="lab_apply")
+
+    x_columns = [c for c in x_columns if c != y_column]
+    if not x_columns:
+        st.warning("اختر متغيرًا مستقلًا واحدًا على الأقل غير المتغير التابع.")
+        return None, None
+    key = ("upload", uploaded.file_id, y_column, tuple(x_columns), constant, weight_column, cluster_column)
+    return key, _upload_data(uploaded.file_id, df, y_column, x_columns, constant, weight_column, cluster_column)
+
+
+# --- الانحدار التدفقي ---
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _stream_columns(path, mtime):
+    return streaming.columns(path)
+
+
+@profiler.fragment("streaming_lab")
+def render_streaming_lab():
+    with st.container(key="econometrics_streaming"):
+        st.markdown(
+            "يقرأ الملف على كتل ويجمع X'X وX'y ثم يحل المعادلات الطبيعية، فلا يتجاوز استهلاك الذاكرة كتلة واحدة "
+            "مهما كبر الملف؛ والأخطاء المتينة والعنقودية تحتاج إلى قراءة ثانية بالمعاملات المقدرة."
+        )
+        files = sorted(
+            path.name for path in streaming.DATASETS_DIR.glob("*")
+            if path.suffix.lower() in streaming.FORMATS
+        ) if streaming.DATASETS_DIR.is_dir() else []
+        if not files:
+            st.info(
+                f"لا توجد ملفات بيانات في {streaming.DATASETS_DIR}. لإنشاء ملف تجريبي: "
+                "python -m econ.streaming data/datasets/demo.parquet --make-demo --rows 10000000"
+            )
+            return
+
+        name = st.selectbox("الملف:", files, key="stream_file")
+        path = streaming.DATASETS_DIR / name
+        try:
+            columns = _stream_columns(str(path), path.stat().st_mtime)
+        except (OSError, ValueError) as error:
+            st.error(str(error))
+            return
+
+        # عند تغيير الملف تُحذف الأعمدة المختارة التي ليست فيه
+        for key in ("stream_y", "stream_w", "stream_cluster"):
+            if st.session_state.get(key) not in (None, *columns):
+                del st.session_state[key]
+        kept = [c for c in st.session_state.get("stream_x", []) if c in columns]
+        st.session_state["stream_x"] = kept or columns[1:2]
+        with st.form("stream_form", border=False):
+            col1, col2 = st.columns(2)
+            with col1:
+                y_column = st.selectbox("المتغير التابع:", columns, key="stream_y")
+                x_columns = st.multiselect("المتغيرات المستقلة:", columns, key="stream_x")
+                constant = st.checkbox("إضافة ثابت", key="stream_const")
+                workers = st.number_input("عدد العمليات:", 1, MAX_WORKERS, key="stream_workers")
+            with col2:
+                weight_column = st.selectbox("عمود الأوزان (WLS):", columns, index=None, key="stream_w")
+                cluster_column = st.selectbox("عمود العناقيد:", columns, index=None, key="stream_cluster")
+                cov_type = st.radio("الأخطاء المعيارية:", ols.COV_TYPES, format_func=COV_LABELS.get, key="stream_cov")
+            submitted = st.form_submit_button("تقدير", key="stream_submit")
+
+        x_columns = [c for c in x_columns if c != y_column]
+        if not x_columns:
+            st.warning("اختر متغيرًا مستقلًا واحدًا على الأقل غير المتغير التابع.")
+            return
+        if cov_type == "cluster" and not cluster_column:
+            st.warning("الأخطاء المعيارية العنقودية تحتاج إلى عمود العناقيد.")
+            return
+
+        spec = streaming.Spec(str(path), y_column, tuple(x_columns), constant, weight_column, cluster_column, cov_type)
+        key = (spec, path.stat().st_mtime_ns)
+        entry = _recall(("streaming", *key))
+        if entry is None:
+            if not submitted:
+                st.info("اضغط «تقدير» لقراءة الملف.")
+                return
+            bar = st.progress(0.0, text="جارٍ القراءة...")
+            stages = 1 if cov_type == "nonrobust" else 2
+
+            def progress(stage, done, total):
+                passed = (0 if stage == "moments" else 1) + done / total
+                bar.progress(passed / stages, text=f"{'المرور الأول' if stage == 'moments' else 'المرور الثاني'}: {done}/{total}")
+
+            start = time.perf_counter()
+            try:
+                # حالة الأجزاء تُحفظ في ذاكرة القرص، فتشغيل انقطع (بمغادرة الصفحة مثلًا) يُستأنف من حيث توقف
+                with profiler.section("lab:streaming"):
+                    result = streaming.fit(spec, workers, progress=progress, checkpoint=streaming.CACHE_DIR / "streaming")
+            except (ValueError, KeyError) as error:
+                bar.empty()
+                st.error(str(error))
+                return
+            bar.empty()
+            entry = _remember(("streaming", *key), (result, time.perf_counter() - start))
+
+        result, seconds = entry
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("المشاهدات", f"{result.nobs:,}")
+        col2.metric("R²", f"{result.rsquared:.4f}")
+        col3.metric("R² المعدل", f"{result.rsquared_adj:.4f}")
+        col4.metric("زمن التقدير", f"{seconds:,.1f} s")
+        table = result.table()
+        st.dataframe(
+            table,
+            hide_index=True,
+            use_container_width=True,
+            column_config={column: st.column_config.NumberColumn(format="%.4f") for column in table.columns[1:]}
+        )
+
+
+# --- إعادة المعاينة ---
+
+# أقل فاصل بين تحديثين للجدول والمخطط أثناء التشغيل، حتى لا تغرق الرسائل المتصفح
+REFRESH_SECONDS = 0.25
+RESAMPLE_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+REPLICATIONS = [199, 499, 999, 1999, 4999]
+
+
+def _resampling_table(names, snapshot, analytic, method):
+    import pandas as pd
+
+    table = pd.DataFrame({"المتغير": names, "المعامل": snapshot.observed, "الخطأ المعياري التحليلي": analytic.bse})
+    if method == "permutation":
+        table["قيمة p التحليلية"] = analytic.pvalues
+        table["قيمة p بالتبديل"] = resample.permutation_pvalues(snapshot.draws, snapshot.observed)
+    else:
+        ci = resample.percentile_ci(snapshot.draws)
+        table["خطأ Bootstrap"] = np.nanstd(snapshot.draws, axis=0, ddof=1)
+        table["الحد الأدنى 95%"] = ci[:, 0]
+        table["الحد الأعلى 95%"] = ci[:, 1]
+    return table
+
+
+def _draws_chart(snapshot, method, j=1):
+    draws = snapshot.draws[:, j]
+    draws = draws[np.isfinite(draws)]
+    counts, edges = np.histogram(draws, bins=HISTOGRAM_BINS)
+    if method == "permutation":
+        marks = [("المشاهد", float(snapshot.observed[j]))]
+    else:
+        low, high = resample.percentile_ci(snapshot.draws[:, j:j + 1])[0]
+        marks = [("2.5%", float(low)), ("97.5%", float(high))]
+    charts.plotly_chart(
+        'resampling_draws',
+        edges=np.round(edges, 5).tolist(),
+        counts=counts.tolist(),
+        marks=marks,
+        title=f"توزيع {'التبديل' if method == 'permutation' else 'Bootstrap'} لمعامل x{j} ({snapshot.done:,} تكرار)"
+    )
+
+
+@profiler.fragment("resampling_lab")
+def render_resampling_lab():
+    with st.container(key="econometrics_resampling"):
+        st.markdown(
+            "حين تسقط افتراضات الأخطاء المعيارية التحليلية (تجانس التباين، استقلال المشاهدات) يُقدَّر توزيع المعاملات "
+            "بإعادة المعاينة من البيانات نفسها. تُعرض فترات الثقة وتتحدث أثناء اكتمال التكرارات."
+        )
+        with st.form("resample_form", border=False):
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                n = st.select_slider("عدد المشاهدات:", RESAMPLE_SIZES, format_func="{:,}".format, key="resample_n")
+                k = st.slider("عدد المعاملات (مع الثابت):", 2, 10, key="resample_k")
+            with col2:
+                hetero = st.slider("شدة عدم تجانس التباين:", 0.0, 2.0, step=0.1, key="resample_hetero")
+                clusters = st.select_slider("عدد العناقيد:", CLUSTER_COUNTS[1:], format_func="{:,}".format,
+                                            key="resample_clusters")
+            with col3:
+                replications = st.select_slider("عدد التكرارات:", REPLICATIONS, format_func="{:,}".format,
+                                                key="resample_reps")
+                workers = st.number_input("عدد العمليات:", 1, MAX_WORKERS, key="resample_workers")
+            method = st.radio("الطريقة:", list(resample.METHODS), format_func=resample.METHODS.get,
+                              horizontal=True, key="resample_method")
+            submitted = st.form_submit_button("تشغيل", key="resample_submit")
+
+        data_key = ("sim", n, k, hetero, clusters, 0.3, 0)
+        key = ("resampling", data_key, method, replications)
+        entry = _recall(key)
+        table_slot, chart_slot = st.empty(), st.empty()
+        if entry is None:
+            if not submitted:
+                st.info("اضغط «تشغيل» لبدء التكرارات.")
+                return
+            # الأخطاء التحليلية للمقارنة تُحسب مع التكرارات وتُخزن معها، فعرض القسم لا يكلف تقديرًا كاملًا
+            data = simulate(*data_key[1:])
+            analytic = ols.fit(data["X"], data["y"], names=data["names"],
+                               cov_type="cluster" if method == "cluster" else "HC1", groups=data["groups"])
+            # البواقي والقيم المقدرة بطول العينة لا تلزم الجدول، فلا تُبقى في الذاكرة مع النتيجة
+            analytic = replace(analytic, resid=None, fitted=None, factor=None)
+            bar = st.progress(0.0)
+            start = shown = time.perf_counter()
+            snapshot = None
+            with profiler.section(f"lab:resample:{method}"):
+                for snapshot in resample.run(data["X"], data["y"], method, data["groups"], replications, workers):
+                    now = time.perf_counter()
+                    # اللقطة الأخيرة تُعرض بعد الحلقة مع النتائج المخزنة
+                    if now - shown >= REFRESH_SECONDS and snapshot.done < snapshot.total:
+                        shown = now
+                        bar.progress(snapshot.done / snapshot.total, text=f"{snapshot.done:,} / {snapshot.total:,}")
+                        table_slot.dataframe(_resampling_table(data["names"], snapshot, analytic, method),
+                                             hide_index=True, use_container_width=True)
+                        with chart_slot.container():
+                            _draws_chart(snapshot, method)
+            bar.empty()
+            entry = _remember(key, (snapshot, analytic, time.perf_counter() - start))
+
+        snapshot, analytic, seconds = entry
+        table_slot.dataframe(_resampling_table(analytic.names, snapshot, analytic, method),
+                             hide_index=True, use_container_width=True)
+        with chart_slot.container():
+            _draws_chart(snapshot, method)
+        st.caption(f"{snapshot.total:,} تكرار في {seconds:,.1f} ثانية؛ "
+                   f"الخطأ التحليلي {'العنقودي' if method == 'cluster' else 'HC1'} للمقارنة.")
+
+
+# --- مونت كارلو ---
+
+MC_SIZES = [50, 100, 500, 1_000, 5_000, 10_000, 50_000, 100_000]
+MC_REPLICATIONS = [200, 500, 1000, 2000, 5000]
+
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def monte_carlo(rho, pi, gamma, periods, n, replications):
+    """تكرارات حجم عينة واحد لكل المقدرات على البيانات نفسها؛ المفتاح معاملات النموذج وحجم العينة،
+    فإضافة حجم أو إخفاء مقدر لا يعيد حساب ما سبق."""
+    dgp = montecarlo.DGP(rho=rho, pi=pi, gamma=gamma, periods=periods)
+    return montecarlo.simulate(dgp, [n], replications)
+
+
+@profiler.fragment("montecarlo_lab")
+def render_montecarlo_lab():
+    with st.container(key="econometrics_montecarlo"):
+        st.markdown(
+            "تولّد المحاكاة آلاف العينات من نموذج معروف المعاملات (β = 1) وتقدّر كلًا منها، فيظهر توزيع المقدر "
+            "وهل يقترب من القيمة الحقيقية مع نمو العينة. البيانات: "
+            "x = π·z + γ·α + v، و y = β·x + α + u، حيث α أثر فردي ثابت عبر فترات الكيان، "
+            "و ρ الارتباط بين u و v (الداخلية)، و z أداة خارجية."
+        )
+        with st.form("montecarlo_form", border=False):
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                rho = st.slider("الداخلية ρ = corr(u, v):", 0.0, 0.9, step=0.1, key="mc_rho")
+                gamma = st.slider("ارتباط x بالأثر الفردي γ:", 0.0, 1.5, step=0.1, key="mc_gamma")
+            with col2:
+                pi = st.slider("قوة الأداة π:", 0.05, 1.5, step=0.05, key="mc_pi")
+                periods = st.slider("عدد الفترات لكل كيان:", 2, 20, key="mc_periods")
+            with col3:
+                replications = st.select_slider("عدد التكرارات:", MC_REPLICATIONS, format_func="{:,}".format,
+                                                key="mc_reps")
+                sizes = st.multiselect("أحجام العينات:", MC_SIZES, format_func="{:,}".format, key="mc_sizes")
+            estimators = st.multiselect("المقدرات:", list(montecarlo.ESTIMATORS),
+                                        format_func=montecarlo.ESTIMATORS.get, key="mc_estimators")
+            st.form_submit_button("تشغيل المحاكاة", key="mc_submit")
+
+        if not sizes or not estimators:
+            st.info("اختر حجم عينة ومقدرًا واحدًا على الأقل.")
+            return
+
+        results = {}
+        bar = st.progress(0.0)
+        start = time.perf_counter()
+        with profiler.section("lab:montecarlo"):
+            for i, size in enumerate(sorted(sizes)):
+                bar.progress(i / len(sizes), text=f"n = {size:,}")
+                results.update(monte_carlo(rho, pi, gamma, periods, size, replications))
+        seconds = time.perf_counter() - start
+        bar.empty()
+
+        dgp = montecarlo.DGP(rho=rho, pi=pi, gamma=gamma, periods=periods)
+        results = {key: value for key, value in results.items() if key[0] in estimators}
+        summaries = montecarlo.summarize(dgp, results)
+        _montecarlo_table(summaries)
+        _montecarlo_charts(dgp, results, estimators)
+        st.caption(f"{replications:,} تكرار لكل حجم عينة؛ زمن الحساب {seconds:,.1f} ثانية "
+                   "(الأحجام المحسوبة سابقًا لهذا النموذج لا يعاد حسابها). أحجام العينات مقربة إلى مضاعفات عدد الفترات.")
+
+
+def _montecarlo_table(summaries):
+    import pandas as pd
+
+    st.dataframe(pd.DataFrame({
+        "المقدر": [montecarlo.ESTIMATORS[s.estimator] for s in summaries],
+        "حجم العينة": [s.n for s in summaries],
+        "المتوسط": [s.mean for s in summaries],
+        "الوسيط": [s.median for s in summaries],
+        "التحيز": [s.bias for s in summaries],
+        "الانحراف المعياري": [s.sd for s in summaries],
+        "RMSE": [s.rmse for s in summaries],
+        "تغطية فترة 95%": [s.coverage for s in summaries],
+    }), hide_index=True, use_container_width=True)
+
+
+def _montecarlo_charts(dgp, results, estimators):
+    sizes = sorted({n for _, n in results})
+    series = []
+    for name in estimators:
+        low, median, high = np.array([np.nanpercentile(results[(name, n)][0], [2.5, 50, 97.5]) for n in sizes]).T
+        series.append((name, montecarlo.ESTIMATORS[name], *(np.round(v, 5).tolist() for v in (median, low, high))))
+    charts.plotly_chart('montecarlo_convergence', sizes=sizes, series=series, beta=dgp.beta)
+
+    n = sizes[-1] if len(sizes) == 1 else st.select_slider(
+        "توزيع التقديرات عند حجم العينة:", sizes, value=sizes[-1], format_func="{:,}".format, key="mc_view_n")
+    # مجال مشترك لكل المقدرات يستبعد أطراف IV الضعيفة البعيدة
+    draws = {name: results[(name, n)][0] for name in estimators}
+    edges = np.histogram_bin_edges(np.concatenate([
+        np.clip(d, *np.nanpercentile(d, [0.5, 99.5])) for d in draws.values()]), bins=HISTOGRAM_BINS)
+    charts.plotly_chart(
+        'montecarlo_distributions',
+        edges=np.round(edges, 5).tolist(),
+        series=[(name, montecarlo.ESTIMATORS[name], np.histogram(d, bins=edges)[0].tolist())
+                for name, d in draws.items()],
+        beta=dgp.beta,
+        title=f"توزيع التقديرات عند n = {n:,}"
+    )
+
+
+# --- البانل ---
+
+PANEL_ENTITIES = [1_000, 10_000, 100_000, 1_000_000]
+PANEL_COV_LABELS = {
+    "nonrobust": COV_LABELS["nonrobust"],
+    "HC1": COV_LABELS["HC1"],
+    "cluster": "عنقودية على الكيان",
+}
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def panel_data(entities, periods, k, dropout, correlation):
+    """بانل محاكى مع تفكيك معرّفاته مرة واحدة لكل التقديرات عليه."""
+    X, y, entity, period = panel.make_panel(entities, periods, k, dropout, correlation)
+    return {"X": X, "y": y, "entity": panel.groups(entity), "time": panel.groups(period)}
+
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def panel_estimate(data_key, estimator, cov_type, _data):
+    """تقدير بانل على بيانات data_key؛ تُحذف البواقي والقيم المقدرة (بطول البيانات) قبل التخزين."""
+    import dataclasses
+
+    start = time.perf_counter()
+    with profiler.section(f"lab:panel:{estimator}:{cov_type}"):
+        fitted = panel.fit(_data["X"], _data["y"], _data["entity"], _data["time"],
+                           estimator=estimator, cov_type=cov_type)
+    elapsed = time.perf_counter() - start
+    result = dataclasses.replace(fitted.result, resid=None, fitted=None)
+    return dataclasses.replace(fitted, result=result), elapsed
+
+
+@profiler.fragment("panel_lab")
+def render_panel_lab():
+    with st.container(key="econometrics_panel"):
+        st.markdown(
+            "بانل محاكى: y = x·β + α_i + λ_t + e، حيث α_i أثر فردي مرتبط بالمتغيرات بدرجة يحددها «الارتباط»، "
+            "و λ_t صدمة زمنية مشتركة. حين يرتبط الأثر الفردي بالمتغيرات يتحيز OLS المجمّع والتأثيرات العشوائية، "
+            "وتستعيد التأثيرات الثابتة القيمة الحقيقية؛ ويفصل اختبار هاوسمان بين FE و RE. "
+            "التحويلات مجاميع مجموعات على معرّفات مُفكَّكة، دون مصفوفات وهمية."
+        )
+        with st.form("panel_form", border=False):
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                entities = st.select_slider("عدد الكيانات:", PANEL_ENTITIES, format_func="{:,}".format,
+                                            key="panel_entities")
+                periods = st.slider("عدد الفترات:", 2, 20, key="panel_periods")
+            with col2:
+                k = st.slider("عدد المتغيرات المستقلة:", 1, 5, key="panel_k")
+                dropout = st.slider("نسبة الصفوف المفقودة (بانل غير متوازن):", 0.0, 0.5, step=0.05,
+                                    key="panel_dropout")
+            with col3:
+                correlation = st.slider("ارتباط المتغيرات بالأثر الفردي:", 0.0, 1.5, step=0.1,
+                                        key="panel_correlation")
+                cov_type = st.radio("الأخطاء المعيارية:", list(panel.COV_TYPES), format_func=PANEL_COV_LABELS.get,
+                                    key="panel_cov")
+            estimators = st.multiselect("المقدرات:", list(panel.ESTIMATORS), format_func=panel.ESTIMATORS.get,
+                                        key="panel_estimators")
+            st.form_submit_button("تقدير", key="panel_submit")
+
+        if not estimators:
+            st.info("اختر مقدرًا واحدًا على الأقل.")
+            return
+        rows = entities * periods
+        if rows * (k + 2) > MAX_CELLS:
+            st.error(f"حجم البانل ({rows:,} × {k + 2}) يتجاوز حد المختبر ({MAX_CELLS:,} خلية)؛ "
+                     "قلّل عدد الكيانات أو الفترات أو المتغيرات.")
+            return
+
+        data_key = ("panel", entities, periods, k, dropout, correlation)
+        with st.spinner("جارٍ توليد البيانات..."):
+            data = panel_data(*data_key[1:])
+        fits = {}
+        with st.spinner("جارٍ التقدير..."):
+            for estimator in estimators:
+                try:
+                    fits[estimator] = panel_estimate(data_key, estimator, cov_type, data)
+                except ValueError as error:
+                    st.error(f"{panel.ESTIMATORS[estimator]}: {error}")
+                    return
+
+        _panel_tables(fits, np.arange(1.0, k + 1))
+        if "fe" in fits and "re" in fits:
+            # هاوسمان بصيغته الكلاسيكية على تقديرين بأخطاء عادية، أيًا كان النوع المختار للجدول
+            fe, re = (fits[name][0] if cov_type == "nonrobust" else panel_estimate(data_key, name, "nonrobust", data)[0]
+                      for name in ("fe", "re"))
+            stat, df, p = panel.hausman(fe, re)
+            verdict = "يُرفض اتساق RE، فالتأثيرات الثابتة أنسب" if p < 0.05 else "لا يُرفض اتساق RE، وهو الأكفأ"
+            st.caption(f"اختبار هاوسمان (FE مقابل RE): χ²({df}) = {stat:,.2f}، قيمة p = {p:.4f} — {verdict}.")
+        st.caption(f"المشاهدات: {len(data['y']):,}؛ الكيانات: {len(data['entity']):,}؛ الفترات: {len(data['time'])}.")
+
+
+def _panel_tables(fits, beta):
+    import pandas as pd
+
+    rows = []
+    for estimator, (fitted, _) in fits.items():
+        table = fitted.result.table()
+        for _, row in table.iterrows():
+            name = row["المتغير"]
+            rows.append({
+                "المقدر": panel.ESTIMATORS[estimator],
+                "المتغير": name,
+                "القيمة الحقيقية": beta[int(name[1:]) - 1] if name != "const" else np.nan,
+                "المعامل": row["المعامل"],
+                "الخطأ المعياري": row["الخطأ المعياري"],
+                "قيمة p": row["قيمة p"],
+            })
+    coefficients = pd.DataFrame(rows)
+    st.dataframe(
+        coefficients,
+        hide_index=True,
+        use_container_width=True,
+        column_config={column: st.column_config.NumberColumn(format="%.4f") for column in coefficients.columns[2:]}
+    )
+
+    st.dataframe(pd.DataFrame([{
+        "المقدر": panel.ESTIMATORS[estimator],
+        "R²": fitted.result.rsquared,
+        "دورات الإسقاط": fitted.iterations or None,
+        "θ (RE)": fitted.theta,
+        "زمن التقدير (ms)": seconds * 1000,
+    } for estimator, (fitted, seconds) in fits.items()]), hide_index=True, use_container_width=True)
+    st.caption("R² في التأثيرات الثابتة داخل الكيانات، وفي Between بين متوسطاتها.")
+
+
+# --- نظم المعادلات الآنية ---
+
+SYSTEM_ROWS = [10_000, 100_000, 1_000_000]
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def system_moments(equations, rows, rho, gamma):
+    """عزوم نظام محاكى (بحجم مربع عدد المتغيرات)؛ البيانات نفسها تُولَّد بدفعات ولا تُخزن."""
+    eqs, instruments, truth, chunks = system.make_system(equations, rows, rho, gamma)
+    start = time.perf_counter()
+    with profiler.section("lab:system:moments"):
+        m = system.moments(chunks(), eqs, instruments)
+    return m, eqs, truth, time.perf_counter() - start
+
+
+@profiler.fragment("system_lab")
+def render_system_lab():
+    with st.container(key="econometrics_system"):
+        st.markdown(
+            "نظام محاكى من معادلات آنية: y_g = 1 + γ·y_{g+1} + β_g·x_g + u_g، فكل متغير تابع يظهر مفسِّرًا "
+            "في المعادلة السابقة له، و x_g خارجي خاص بمعادلته يعمل أداةً للمعادلات الأخرى. "
+            "**2SLS** يقدّر كل معادلة منفردة، و**3SLS** يستغل الارتباط بين أخطاء المعادلات (ρ) فتصغر أخطاؤه المعيارية."
+        )
+        with st.form("system_form", border=False):
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                equations = st.slider("عدد المعادلات:", 2, 40, key="system_equations")
+                rows = st.select_slider("عدد المشاهدات:", SYSTEM_ROWS, format_func="{:,}".format, key="system_rows")
+            with col2:
+                rho = st.slider("الارتباط بين أخطاء المعادلات ρ:", 0.0, 0.9, step=0.1, key="system_rho")
+                gamma = st.slider("أثر المتغير التابع التالي γ:", 0.0, 0.8, step=0.1, key="system_gamma")
+            with col3:
+                method = st.radio("مقدِّر النظام:", ["3sls", "i3sls"], format_func=system.METHODS.get,
+                                  key="system_method")
+            st.form_submit_button("تقدير", key="system_submit")
+
+        with st.spinner("جارٍ تجميع العزوم..."):
+            m, eqs, truth, seconds = system_moments(equations, rows, rho, gamma)
+        try:
+            start = time.perf_counter()
+            two_stage = system.fit(m, eqs, "2sls")
+            full = system.fit(m, eqs, method)
+            elapsed = time.perf_counter() - start
+        except ValueError as error:
+            st.error(str(error))
+            return
+
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("المعاملات", f"{len(full.params):,}")
+        col2.metric("تجميع العزوم", f"{seconds:,.2f} s")
+        col3.metric("زمن الحل (2SLS و3SLS)", f"{elapsed * 1000:,.1f} ms")
+        col4.metric("متوسط نسبة الخطأ 3SLS / 2SLS", f"{np.mean(full.bse / two_stage.bse):.3f}")
+
+        import pandas as pd
+
+        table = pd.DataFrame({
+            "المعادلة": [eq for eq, _ in full.index],
+            "المتغير": [name for _, name in full.index],
+            "القيمة الحقيقية": truth,
+            "2SLS": two_stage.params,
+            "خطأ 2SLS": two_stage.bse,
+            system.METHODS[method]: full.params,
+            f"خطأ {system.METHODS[method]}": full.bse,
+        })
+        st.dataframe(
+            table,
+            hide_index=True,
+            use_container_width=True,
+            column_config={column: st.column_config.NumberColumn(format="%.4f") for column in table.columns[2:]}
+        )
+        charts.plotly_chart(
+            'system_correlation',
+            labels=[eq.name for eq in eqs],
+            correlation=np.round(full.sigma.correlation, 3).tolist()
+        )
+        st.caption(f"{rows:,} مشاهدة؛ العزوم {len(m.variables)}×{len(m.variables)} تكفي لكل التقديرات"
+                   + (f"؛ {full.iterations} تكرارات حتى التقارب." if method == "i3sls" else "."))
@@ -0,0 +1,537 @@
+# فحص صحة روابط الكتالوج: أي مورد يحمل "الرابط" يُفحص دوريًا خارج التطبيق وتُحفظ النتيجة في قاعدة sqlite محلية
+# التطبيق يقرأ النتائج المحفوظة فقط (إخفاء الموارد المعطلة وتمييز روابطها)، ولا يتصل بالشبكة أثناء العرض
+#
+#     python -m econ.links                      # فحص الروابط التي لم تُفحص منذ 24 ساعة
+#     python -m econ.links --all --concurrency 300
+#     python -m econ.links --report             # الروابط المعطلة حاليًا
+#     python -m econ.links --stub 100000        # قياس السرعة على خادم HTTP محلي وهمي دون شبكة
+#
+# عميل HTTP/1.1 مبني على asyncio مباشرة: مجمع اتصالات محدود، حد لكل مضيف، إعادة المحاولة بتراجع أسي،
+# وطلبات شرطية (If-None-Match / If-Modified-Since) تجعل الفحص المتكرر شبه مجاني للخوادم الداعمة
+
+import argparse
+import asyncio
+import os
+import random
+import socket
+import sqlite3
+import ssl
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import quote, urljoin, urlsplit
+
+import streamlit as st
+
+CACHE_DIR = Path(os.environ.get("ECON_CACHE_DIR", Path(__file__).resolve().parent.parent / ".cache"))
+STORE_PATH = CACHE_DIR / "links.sqlite"
+
+URL_COLUMN = "الرابط"
+
+CONCURRENCY = 200
+PER_HOST = 4
+TIMEOUT = 15.0
+RETRIES = 2
+BACKOFF = 0.5
+MAX_BACKOFF = 30.0
+MAX_REDIRECTS = 5
+MAX_AGE_HOURS = 24
+
+# حالات تعني أن المورد غير موجود فعلًا؛ غيرها من الإخفاقات يُعد معطلًا بعد DEAD_AFTER فحوص متتالية
+DEAD_STATUSES = {404, 410}
+DEAD_AFTER = 2
+# الخادم موجود ويرد على المورد نفسه لكنه يمنع الفحص الآلي أو يحد سرعته: الرابط ليس معطلًا
+RESTRICTED_STATUSES = {401, 403, 429}
+RETRY_STATUSES = {408, 429, 500, 502, 503, 504}
+# خوادم ترفض HEAD أو تسيء التعامل معه: يُعاد الطلب بـ GET وتُقرأ الترويسات فقط
+HEAD_REJECTED = {400, 403, 405, 501}
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+
+USER_AGENT = "econ-linkcheck/1.0 (+https://github.com/NouarMns/econ)"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS links (
+    url TEXT PRIMARY KEY,
+    status INTEGER,
+    error TEXT NOT NULL DEFAULT '',
+    etag TEXT NOT NULL DEFAULT '',
+    last_modified TEXT NOT NULL DEFAULT '',
+    final_url TEXT NOT NULL DEFAULT '',
+    checked_at REAL NOT NULL,
+    failures INTEGER NOT NULL DEFAULT 0,
+    dead INTEGER NOT NULL DEFAULT 0
+)
+"""
+
+
+@dataclass
+class CheckResult:
+    url: str
+    status: int = None
+    error: str = ""
+    etag: str = ""
+    last_modified: str = ""
+    final_url: str = ""
+    retry_after: float = None
+
+    @property
+    def alive(self) -> bool:
+        return self.status is not None and (self.status < 400 or self.status in RESTRICTED_STATUSES)
+
+    @property
+    def retryable(self) -> bool:
+        return self.status in RETRY_STATUSES or (self.status is None and self.error not in ("ssl", "url"))
+
+
+# --- عميل HTTP ---
+
+class _Connection:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.reused = False
+        self.keep_alive = False
+
+    def close(self):
+        self.writer.close()
+
+
+class ConnectionPool:
+    """اتصالات keep-alive مفتوحة لكل مضيف، بحد كلي للاتصالات النشطة وحد لكل مضيف.
+
+    الاتصالات الخاملة محدودة أيضًا بالحد الكلي، فلا يتراكم عدد المقابس مع كثرة المضيفين.
+    """
+
+    def __init__(self, limit=CONCURRENCY, per_host=PER_HOST):
+        self.limit = limit
+        self._slots = asyncio.Semaphore(limit)
+        self._host_slots = defaultdict(lambda: asyncio.Semaphore(per_host))
+        self._idle = defaultdict(list)
+        self._idle_count = 0
+        self._ssl = ssl.create_default_context()
+
+    @asynccontextmanager
+    async def connection(self, scheme, host, port):
+        key = (scheme, host, port)
+        async with self._host_slots[key], self._slots:
+            if self._idle[key]:
+                connection = self._idle[key].pop()
+                self._idle_count -= 1
+                connection.reused = True
+                connection.keep_alive = False
+            else:
+                reader, writer = await asyncio.open_connection(
+                    host, port, ssl=self._ssl if scheme == "https" else None,
+                    server_hostname=host if scheme == "https" else None
+                )
+                connection = _Connection(reader, writer)
+            keep = False
+            try:
+                yield connection
+                keep = connection.keep_alive
+            finally:
+                if keep and self._idle_count < self.limit:
+                    connection.reused = False
+                    self._idle[key].append(connection)
+                    self._idle_count += 1
+                else:
+                    connection.close()
+
+    def close(self):
+        for connections in self._idle.values():
+            for connection in connections:
+                connection.close()
+        self._idle.clear()
+        self._idle_count = 0
+
+
+async def _read_head(reader):
+    """سطر الحالة والترويسات؛ تُتجاوز الردود المؤقتة 1xx."""
+    while True:
+        line = await reader.readline()
+        if not line:
+            raise ConnectionResetError("connection closed by server")
+        parts = line.decode("latin-1").split(None, 2)
+        if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+            raise ValueError(f"bad status line: {line[:80]!r}")
+        status = int(parts[1])
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        if status >= 200:
+            return status, headers
+
+
+def _target(parts):
+    path = quote(parts.path or "/", safe="/%:@!$&'()*+,;=~-._")
+    query = quote(parts.query, safe="=&%:@!$'()*+,;/?~-._")
+    return f"{path}?{query}" if query else path
+
+
+class LinkChecker:
+    def __init__(self, pool, timeout=TIMEOUT, retries=RETRIES, backoff=BACKOFF):
+        self.pool = pool
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+
+    async def _request(self, method, url, headers):
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError("unsupported url")
+        host = parts.hostname.encode("idna").decode("ascii")
+        port = parts.port or (443 if scheme == "https" else 80)
+        host_header = host if parts.port is None else f"{host}:{port}"
+        request = (f"{method} {_target(parts)} HTTP/1.1\r\nHost: {host_header}\r\n"
+                   f"User-Agent: {USER_AGENT}\r\nAccept: */*\r\nConnection: keep-alive\r\n"
+                   + "".join(f"{k}: {v}\r\n" for k, v in headers.items()) + "\r\n").encode("latin-1")
+
+        # اتصال خامل قد يكون الخادم أغلقه من طرفه: تُعاد المحاولة مرة على اتصال جديد دون احتسابها
+        for _ in range(2):
+            async with self.pool.connection(scheme, host, port) as connection:
+                try:
+                    connection.writer.write(request)
+                    await connection.writer.drain()
+                    status, response_headers = await _read_head(connection.reader)
+                except (ConnectionError, ValueError):
+                    if connection.reused:
+                        continue
+                    raise
+                # جسم GET لا يُقرأ: الاتصال يُغلق بدل إعادة استخدامه
+                connection.keep_alive = (
+                    (method == "HEAD" or status in (204, 304))
+                    and response_headers.get("connection", "").lower() != "close"
+                )
+                return status, response_headers
+        raise ConnectionResetError("connection closed by server")
+
+    async def _check_once(self, url, etag, last_modified) -> CheckResult:
+        result = CheckResult(url)
+        current = url
+        try:
+            async with asyncio.timeout(self.timeout):
+                for hop in range(MAX_REDIRECTS + 1):
+                    headers = {}
+                    if hop == 0 and etag:
+                        headers["If-None-Match"] = etag
+                    if hop == 0 and last_modified:
+                        headers["If-Modified-Since"] = last_modified
+                    status, response_headers = await self._request("HEAD", current, headers)
+                    if status in HEAD_REJECTED:
+                        status, response_headers = await self._request("GET", current, headers)
+                    if status in REDIRECT_STATUSES and "location" in response_headers:
+                        current = urljoin(current, response_headers["location"])
+                        continue
+                    break
+                else:
+                    result.error = "redirects"
+                    return result
+        except TimeoutError:
+            result.error = "timeout"
+            return result
+        except ssl.SSLError:
+            result.error = "ssl"
+            return result
+        except ValueError:
+            result.error = "url"
+            return result
+        except OSError as exc:
+            result.error = "dns" if isinstance(exc, socket.gaierror) else "connection"
+            return result
+
+        result.status = status
+        result.final_url = current if current != url else ""
+        if status == 304:
+            result.etag, result.last_modified = etag, last_modified
+        else:
+            result.etag = response_headers.get("etag", "")
+            result.last_modified = response_headers.get("last-modified", "")
+        retry_after = response_headers.get("retry-after", "")
+        if retry_after.isdigit():
+            result.retry_after = float(retry_after)
+        return result
+
+    async def check(self, url, etag="", last_modified="") -> CheckResult:
+        """فحص رابط واحد مع إعادة المحاولة للإخفاقات المؤقتة (تراجع أسي مع عشوائية، أو Retry-After)."""
+        for attempt in range(self.retries + 1):
+            result = await self._check_once(url, etag, last_modified)
+            if not result.retryable or attempt == self.retries:
+                return result
+            delay = result.retry_after or self.backoff * 2 ** attempt * (0.5 + random.random())
+            await asyncio.sleep(min(delay, MAX_BACKOFF))
+        return result
+
+
+# --- مخزن النتائج ---
+
+def open_store(path: Path = STORE_PATH) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    db = sqlite3.connect(path)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute(SCHEMA)
+    return db
+
+
+def _save(db, results, previous, now):
+    rows = []
+    for result in results:
+        old = previous.get(result.url)
+        if result.status == 304 and old is not None:
+            result.status = old[0]
+        failures = 0 if result.alive else (old[3] if old else 0) + 1
+        dead = result.status in DEAD_STATUSES or (not result.alive and failures >= DEAD_AFTER)
+        rows.append((result.url, result.status, result.error, result.etag, result.last_modified,
+                     result.final_url, now, failures, int(dead)))
+    db.executemany(
+        "INSERT INTO links VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT(url) DO UPDATE SET "
+        "status=excluded.status, error=excluded.error, etag=excluded.etag, "
+        "last_modified=excluded.last_modified, final_url=excluded.final_url, "
+        "checked_at=excluded.checked_at, failures=excluded.failures, dead=excluded.dead",
+        rows
+    )
+    db.commit()
+
+
+def catalog_urls(catalog) -> list[str]:
+    """كل الروابط المميزة في جداول الكتالوج التي تحمل عمود الرابط."""
+    urls = set()
+    for df in catalog.tables.values():
+        if URL_COLUMN in df.columns:
+            urls.update(u for u in df[URL_COLUMN].dropna().astype(str) if u.strip())
+    return sorted(urls)
+
+
+async def sweep(urls, db, concurrency=CONCURRENCY, per_host=PER_HOST, timeout=TIMEOUT,
+                retries=RETRIES, max_age_hours=MAX_AGE_HOURS, progress=None) -> Counter:
+    """فحص الروابط التي لم تُفحص منذ max_age_hours (None = جميعها) وحفظ النتائج على دفعات."""
+    previous = {
+        url: (status, etag, last_modified, failures, checked_at)
+        for url, status, etag, last_modified, failures, checked_at in db.execute(
+            "SELECT url, status, etag, last_modified, failures, checked_at FROM links")
+    }
+    now = time.time()
+    if max_age_hours is not None:
+        cutoff = now - max_age_hours * 3600
+        urls = [u for u in urls if u not in previous or previous[u][4] < cutoff]
+    # خلط الروابط يوزع الطلبات على المضيفين، فلا ينتظر كل العمال حد مضيف واحد كبير
+    urls = list(urls)
+    random.Random(0).shuffle(urls)
+
+    pool = ConnectionPool(concurrency, per_host)
+    checker = LinkChecker(pool, timeout, retries)
+    queue = asyncio.Queue(maxsize=concurrency * 2)
+    pending, outcomes = [], Counter()
+
+    async def worker():
+        while (url := await queue.get()) is not None:
+            old = previous.get(url)
+            result = await checker.check(url, *(old[1:3] if old else ("", "")))
+            pending.append(result)
+            outcomes[_outcome(result)] += 1
+            if len(pending) >= 500:
+                _save(db, pending, previous, time.time())
+                pending.clear()
+                if progress:
+                    progress(sum(outcomes.values()), len(urls))
+
+    workers = [asyncio.create_task(worker()) for _ in range(min(concurrency, len(urls)) or 1)]
+    for url in urls:
+        await queue.put(url)
+    for _ in workers:
+        await queue.put(None)
+    await asyncio.gather(*workers)
+    _save(db, pending, previous, time.time())
+    pool.close()
+    return outcomes
+
+
+def _outcome(result: CheckResult) -> str:
+    if result.status == 304:
+        return "not_modified"
+    if result.alive:
+        return "redirected" if result.final_url else "ok"
+    if result.status is not None:
+        return f"http_{result.status}"
+    return result.error
+
+
+# --- جهة التطبيق: قراءة فقط ---
+
+class LinkHealth:
+    """الروابط المعطلة وفق آخر فحص، مع أقنعة صفوف محسوبة مرة لكل جدول."""
+
+    def __init__(self, dead=frozenset(), checked_at=None):
+        self.dead = dead
+        self.checked_at = checked_at
+        self._masks = {}
+
+    @classmethod
+    def read(cls, path: Path = STORE_PATH):
+        if not path.exists():
+            return cls()
+        db = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            dead = frozenset(url for (url,) in db.execute("SELECT url FROM links WHERE dead = 1"))
+            (checked_at,) = db.execute("SELECT MAX(checked_at) FROM links").fetchone()
+        except sqlite3.Error:
+            return cls()
+        finally:
+            db.close()
+        return cls(dead, checked_at)
+
+    def is_dead(self, url) -> bool:
+        return bool(url) and url in self.dead
+
+    def dead_rows(self, name, table):
+        """قناع منطقي بطول الجدول للصفوف ذات الروابط المعطلة، أو None إن لم يكن فيه ما يُخفى."""
+        if not self.dead or URL_COLUMN not in table.columns:
+            return None
+        key = (name, id(table))
+        if key not in self._masks:
+            self._masks[key] = table[URL_COLUMN].isin(self.dead).to_numpy()
+        return self._masks[key]
+
+
+@st.cache_resource(ttl=600, show_spinner=False)
+def load_link_health() -> LinkHealth:
+    """نتائج آخر فحص، يُعاد تحميلها كل 10 دقائق لالتقاط الفحوص الجديدة دون إعادة تشغيل الخادم."""
+    return LinkHealth.read()
+
+
+def link_markdown(title: str, url: str) -> str:
+    """رابط Markdown للمورد؛ الرابط المعطل يُستبدل بتنبيه بدل توجيه المستخدم إلى صفحة غير موجودة."""
+    if not url:
+        return title
+    if load_link_health().is_dead(url):
+        return f"{title} (⚠️ الرابط لا يعمل حاليًا)"
+    return f"[{title}]({url})"
+
+
+# --- خادم وهمي لقياس السرعة دون شبكة ---
+
+async def _stub_handler(reader, writer, state):
+    """مسارات تحاكي حالات الروابط: /ok /gone /moved /etag /flaky /nohead، مع keep-alive.
+
+    state يعد الطلبات الواردة لكل مسار، و/flaky يرد 503 على أول طلب فقط.
+    """
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            method, target, _ = request_line.decode("latin-1").split(" ", 2)
+            headers = {}
+            while (line := await reader.readline()) not in (b"\r\n", b""):
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            kind = target.split("/")[1]
+            state[target] += 1
+            extra = ""
+            if kind == "gone":
+                status = 404
+            elif kind == "moved":
+                status, extra = 301, f"Location: /ok{target[6:]}\r\n"
+            elif kind == "etag":
+                tag = f'"{target}"'
+                status = 304 if headers.get("if-none-match") == tag else 200
+                extra = f"ETag: {tag}\r\n"
+            elif kind == "flaky":
+                status = 503 if state[target] == 1 else 200
+            elif kind == "nohead" and method == "HEAD":
+                status = 405
+            else:
+                status = 200
+            writer.write(f"HTTP/1.1 {status} X\r\nContent-Length: 0\r\n{extra}\r\n".encode("latin-1"))
+            await writer.drain()
+    except (ConnectionError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+
+@asynccontextmanager
+async def stub_servers(hosts=1):
+    """خوادم HTTP وهمية على 127.0.0.1 للقياس والاختبار: (منافذها، عدد الطلبات لكل مسار)."""
+    state = Counter()
+    servers = [await asyncio.start_server(lambda r, w: _stub_handler(r, w, state), "127.0.0.1", 0)
+               for _ in range(hosts)]
+    try:
+        yield [server.sockets[0].getsockname()[1] for server in servers], state
+    finally:
+        # إتاحة الفرصة لمعالجات الخادم كي تلاحظ إغلاق اتصالات العميل قبل إيقافه
+        await asyncio.sleep(0.1)
+        for server in servers:
+            server.close()
+            await server.wait_closed()
+
+
+async def _stub_benchmark(count, hosts, concurrency, per_host):
+    kinds = ["ok"] * 6 + ["gone", "moved", "etag", "flaky", "nohead"]
+    async with stub_servers(hosts) as (ports, _):
+        urls = [f"http://127.0.0.1:{ports[i % hosts]}/{kinds[i % len(kinds)]}/{i}" for i in range(count)]
+        with tempfile.TemporaryDirectory() as tmp:
+            db = open_store(Path(tmp) / "links.sqlite")
+            for label in ("first sweep", "second sweep (conditional)"):
+                start = time.perf_counter()
+                outcomes = await sweep(urls, db, concurrency, per_host, timeout=5, retries=2,
+                                       max_age_hours=None)
+                elapsed = time.perf_counter() - start
+                print(f"{label}: {count:,} urls in {elapsed:.1f} s ({count / elapsed:,.0f} urls/s) "
+                      + ", ".join(f"{k} {v:,}" for k, v in outcomes.most_common()))
+            (dead,) = db.execute("SELECT COUNT(*) FROM links WHERE dead = 1").fetchone()
+            print(f"dead links recorded: {dead:,}")
+            db.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="فحص صحة روابط الكتالوج")
+    parser.add_argument("--all", action="store_true", help="فحص كل الروابط مهما كان وقت آخر فحص")
+    parser.add_argument("--max-age", type=float, default=MAX_AGE_HOURS, help="بالساعات")
+    parser.add_argument("--concurrency", type=int, default=CONCURRENCY)
+    parser.add_argument("--per-host", type=int, default=PER_HOST)
+    parser.add_argument("--timeout", type=float, default=TIMEOUT)
+    parser.add_argument("--retries", type=int, default=RETRIES)
+    parser.add_argument("--store", type=Path, default=STORE_PATH)
+    parser.add_argument("--report", action="store_true", help="عرض الروابط المعطلة دون فحص")
+    parser.add_argument("--stub", type=int, metavar="N", help="قياس السرعة على N رابط لخادم محلي وهمي")
+    parser.add_argument("--stub-hosts", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    if args.stub:
+        asyncio.run(_stub_benchmark(args.stub, args.stub_hosts, args.concurrency, args.per_host))
+        return 0
+
+    db = open_store(args.store)
+    if not args.report:
+        from econ.catalog import read_catalog
+
+        urls = catalog_urls(read_catalog())
+
+        def progress(done, total):
+            print(f"  {done:,}/{total:,}", file=sys.stderr)
+
+        start = time.perf_counter()
+        outcomes = asyncio.run(sweep(urls, db, args.concurrency, args.per_host, args.timeout, args.retries,
+                                     None if args.all else args.max_age, progress))
+        print(f"checked {sum(outcomes.values()):,} of {len(urls):,} urls in {time.perf_counter() - start:.1f} s: "
+              + ", ".join(f"{k} {v:,}" for k, v in outcomes.most_common()))
+
+    dead = db.execute("SELECT url, status, error, failures FROM links WHERE dead = 1 ORDER BY url").fetchall()
+    print(f"dead links: {len(dead):,}")
+    for url, status, error, failures in dead:
+        print(f"  {url}  {status or error} (failures: {failures})")
+    db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
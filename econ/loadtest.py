@@ -0,0 +1,346 @@
+# اختبار حمل محلي: تشغيل خادم econ2.py وفتح N جلسة Streamlit متزامنة عبر websocket
+# كل جلسة تتنقل عشوائيًا بين الأقسام وتغير عناصر التحكم الفعلية التي يعرضها التطبيق،
+# ثم يُقاس لكل مستوى N: معدل إعادة التشغيل، توزيع زمن الاستجابة، استهلاك المعالج وذاكرة كل جلسة
+#
+#     python -m econ.loadtest                          # المستويات 1 5 10 20، 20 ثانية لكل مستوى
+#     python -m econ.loadtest --sessions 1 10 40 --duration 30 --think 0.5
+#     python -m econ.loadtest --slo-ms 300 --output .cache/load.json
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+import numpy as np
+from websockets.asyncio.client import connect
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+ROOT = Path(__file__).resolve().parent.parent
+APP_PATH = ROOT / "econ2.py"
+
+# زمن الاستجابة (p95) الذي تُحسب عنده سعة العامل الواحد
+SLO_MS = 500
+
+# نصوص واقعية لمربعي البحث والسؤال
+SEARCH_QUERIES = ["السلاسل الزمنية", "تعلم آلي", "Stata", "regression", "بايثون", ""]
+QUESTIONS = ["ما الفرق بين OLS و IV؟", "كيف أبدأ في علم البيانات؟", ""]
+
+# عناصر التحكم التي تحاكيها الجلسات (اسم الحقل في Element) ووزن اختيار قائمة الأقسام
+WIDGET_TYPES = {"radio", "selectbox", "multiselect", "checkbox", "slider", "text_input", "text_area", "button"}
+SECTION_WEIGHT = 4
+
+_CLK_TCK = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port, timeout=60):
+    """تشغيل `streamlit run econ2.py` في عملية مستقلة وانتظار جاهزيتها."""
+    process = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", str(APP_PATH),
+         "--server.headless", "true",
+         "--server.port", str(port),
+         "--server.fileWatcherType", "none",
+         "--browser.gatherUsageStats", "false"],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"streamlit exited with code {process.returncode}")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1) as response:
+                if response.status == 200:
+                    return process
+        except OSError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("streamlit did not become healthy in time")
+
+
+def stop_server(process):
+    process.terminate()
+    try:
+        process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def proc_sample(pid):
+    """(زمن المعالج بالثواني، الذاكرة المقيمة بالبايت) من /proc؛ None خارج لينكس."""
+    try:
+        stat = Path(f"/proc/{pid}/stat").read_text()
+        status = Path(f"/proc/{pid}/status").read_text()
+    except OSError:
+        return None
+    # الحقول بعد اسم العملية (بين قوسين): utime وstime في الموضعين 14 و15
+    fields = stat[stat.rindex(")") + 2:].split()
+    cpu = (int(fields[11]) + int(fields[12])) / _CLK_TCK
+    rss = next(int(line.split()[1]) * 1024 for line in status.splitlines() if line.startswith("VmRSS:"))
+    return cpu, rss
+
+
+class Session:
+    """جلسة متصفح محاكاة: تحتفظ بحالة عناصر التحكم وترسلها كاملة مع كل إعادة تشغيل كما يفعل المتصفح."""
+
+    def __init__(self, url, rng):
+        self.url = url
+        self.rng = rng
+        self.widgets = {}  # المعرّف -> (نوع العنصر، رسالة proto، معرّف الـ fragment)
+        self.states = {}   # المعرّف -> WidgetState المرسلة
+        self.pending = {}  # قيم داخل نموذج لم تُرسل بعد
+        self.errors = 0
+        self.ws = None
+
+    async def __aenter__(self):
+        host = self.url.split("://", 1)[1].rstrip("/")
+        self.ws = await connect(f"ws://{host}/_stcore/stream", subprotocols=["streamlit"], max_size=None)
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.ws.close()
+
+    async def rerun(self, fragment_id=""):
+        """إرسال طلب إعادة تشغيل وانتظار script_finished؛ يعيد الزمن بالمللي ثانية."""
+        message = BackMsg()
+        client_state = message.rerun_script
+        client_state.context_info.url = self.url
+        client_state.fragment_id = fragment_id
+        client_state.widget_states.widgets.extend(self.states.values())
+        # قيم الأزرار تُرسل مرة واحدة فقط
+        self.states = {k: v for k, v in self.states.items() if not v.HasField("trigger_value")}
+
+        start = time.perf_counter()
+        await self.ws.send(message.SerializeToString())
+        seen = {}
+        while True:
+            forward = ForwardMsg()
+            forward.ParseFromString(await self.ws.recv())
+            kind = forward.WhichOneof("type")
+            if kind == "script_finished":
+                break
+            if kind != "delta" or forward.delta.WhichOneof("type") != "new_element":
+                continue
+            element = forward.delta.new_element
+            element_type = element.WhichOneof("type")
+            if element_type == "exception":
+                self.errors += 1
+            elif element_type in WIDGET_TYPES:
+                proto = getattr(element, element_type)
+                seen[proto.id] = (element_type, proto, forward.delta.fragment_id)
+        elapsed = (time.perf_counter() - start) * 1000
+
+        # تشغيل fragment يستبدل عناصره فقط؛ التشغيل الكامل يستبدل الصفحة كلها
+        if fragment_id:
+            self.widgets = {k: v for k, v in self.widgets.items() if v[2] != fragment_id}
+            self.widgets.update(seen)
+        else:
+            self.widgets = seen
+            self.states = {k: v for k, v in self.states.items() if k in seen}
+        return elapsed
+
+    def _state(self, element_type, proto):
+        state = WidgetState(id=proto.id)
+        if element_type in ("radio", "selectbox"):
+            state.string_value = self.rng.choice(proto.options)
+        elif element_type == "multiselect":
+            state.string_array_value.data.extend(
+                self.rng.sample(list(proto.options), self.rng.randint(0, min(2, len(proto.options))))
+            )
+        elif element_type == "checkbox":
+            state.bool_value = self.rng.random() < 0.5
+        elif element_type == "slider":
+            steps = int((proto.max - proto.min) / proto.step)
+            state.double_array_value.data.append(proto.min + self.rng.randint(0, steps) * proto.step)
+        elif element_type == "text_input":
+            state.string_value = self.rng.choice(SEARCH_QUERIES)
+        elif element_type == "text_area":
+            state.string_value = self.rng.choice(QUESTIONS)
+        else:
+            state.trigger_value = True
+        return state
+
+    def choose(self):
+        """اختيار عنصر تحكم عشوائي مما تعرضه الصفحة الآن، مع ترجيح قائمة الأقسام."""
+        ids = [k for k, v in self.widgets.items() if not v[1].disabled]
+        weights = [SECTION_WEIGHT if k.endswith("-section") else 1 for k in ids]
+        return self.rng.choices(ids, weights)[0]
+
+    async def act(self):
+        """تفاعل واحد؛ يعيد زمن إعادة التشغيل أو None إن كان التغيير داخل نموذج لم يُرسل."""
+        widget_id = self.choose()
+        element_type, proto, fragment_id = self.widgets[widget_id]
+        state = self._state(element_type, proto)
+        form_id = getattr(proto, "form_id", "")
+        if form_id and not getattr(proto, "is_form_submitter", False):
+            self.pending[widget_id] = (form_id, state)
+            return None
+        if form_id:
+            # زر الإرسال يرسل قيم النموذج كلها دفعة واحدة
+            for pending_id, (pending_form, pending_state) in list(self.pending.items()):
+                if pending_form == form_id:
+                    self.states[pending_id] = pending_state
+                    del self.pending[pending_id]
+        self.states[widget_id] = state
+        return await self.rerun(fragment_id)
+
+
+async def _drive(url, seed, deadline, think, latencies, stats):
+    rng = random.Random(seed)
+    async with Session(url, rng) as session:
+        latencies.append(await session.rerun())
+        while time.monotonic() < deadline:
+            # زمن تفكير المستخدم بين تفاعلين: توزيع أسي متوسطه think
+            await asyncio.sleep(rng.expovariate(1 / think) if think > 0 else 0)
+            elapsed = await session.act()
+            if elapsed is not None:
+                latencies.append(elapsed)
+        stats["errors"] += session.errors
+
+
+async def _warm_up(url):
+    """جلسة واحدة تزور كل قسم مرة لتحميل الكتالوج والذاكرات المؤقتة قبل القياس."""
+    async with Session(url, random.Random(0)) as session:
+        await session.rerun()
+        section_id, (_, proto, _) = next((k, v) for k, v in session.widgets.items() if k.endswith("-section"))
+        for option in proto.options:
+            session.states[section_id] = WidgetState(id=section_id, string_value=option)
+            await session.rerun()
+
+
+async def _sample_process(pid, samples, stop):
+    while not stop.is_set():
+        sample = proc_sample(pid)
+        if sample is not None:
+            samples.append((time.monotonic(), *sample))
+        try:
+            await asyncio.wait_for(stop.wait(), 0.25)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def run_level(url, pid, sessions, duration, think, seed):
+    await _warm_up(url)
+    base = proc_sample(pid)
+
+    latencies, stats = [], {"errors": 0}
+    samples, stop = [], asyncio.Event()
+    sampler = asyncio.create_task(_sample_process(pid, samples, stop))
+
+    start = time.monotonic()
+    deadline = start + duration
+    own_cpu = time.process_time()
+    await asyncio.gather(*(
+        _drive(url, seed + i, deadline, think, latencies, stats) for i in range(sessions)
+    ))
+    wall = time.monotonic() - start
+    own_cpu = time.process_time() - own_cpu
+    stop.set()
+    await sampler
+
+    result = {
+        "sessions": sessions,
+        "reruns": len(latencies),
+        "throughput": len(latencies) / wall,
+        "errors": stats["errors"],
+        "generator_cpu_pct": own_cpu / wall * 100,
+    }
+    lat = np.asarray(latencies)
+    for q in (50, 95, 99):
+        result[f"p{q}_ms"] = float(np.percentile(lat, q))
+    result["max_ms"] = float(lat.max())
+    if base is not None and len(samples) >= 2:
+        result["cpu_pct"] = (samples[-1][1] - samples[0][1]) / (samples[-1][0] - samples[0][0]) * 100
+        peak = max(s[2] for s in samples)
+        result["rss_base_mib"] = base[1] / 2**20
+        result["rss_peak_mib"] = peak / 2**20
+        result["per_session_kib"] = max(peak - base[1], 0) / sessions / 1024
+    return result
+
+
+def run(levels, duration, think, seed=0):
+    """لكل مستوى: خادم جديد (ذاكرة أساس نظيفة)، إحماء، ثم N جلسة متزامنة لمدة duration ثانية."""
+    results = []
+    for sessions in levels:
+        port = _free_port()
+        server = start_server(port)
+        try:
+            results.append(asyncio.run(
+                run_level(f"http://127.0.0.1:{port}/", server.pid, sessions, duration, think, seed)
+            ))
+        finally:
+            stop_server(server)
+        _print_row(results[-1], header=len(results) == 1)
+    return results
+
+
+def capacity(results, slo_ms):
+    """أكبر عدد جلسات بقي عنده p95 ضمن الحد؛ None إن تجاوزه حتى المستوى الأول."""
+    within = [r["sessions"] for r in results if r["p95_ms"] <= slo_ms]
+    return max(within) if within else None
+
+
+def _print_row(r, header=False):
+    if header:
+        print(f"{'sessions':>8} {'reruns/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8} "
+              f"{'cpu %':>6} {'rss MiB':>8} {'KiB/sess':>9} {'errors':>6}")
+    cpu = f"{r['cpu_pct']:.0f}" if "cpu_pct" in r else "-"
+    rss = f"{r['rss_peak_mib']:.0f}" if "rss_peak_mib" in r else "-"
+    per_session = f"{r['per_session_kib']:.0f}" if "per_session_kib" in r else "-"
+    print(f"{r['sessions']:>8} {r['throughput']:>9.1f} {r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} "
+          f"{r['p99_ms']:>8.1f} {r['max_ms']:>8.1f} {cpu:>6} {rss:>8} {per_session:>9} {r['errors']:>6}",
+          flush=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 5, 10, 20],
+                        help="مستويات عدد الجلسات المتزامنة")
+    parser.add_argument("--duration", type=float, default=20, help="مدة كل مستوى بالثواني")
+    parser.add_argument("--think", type=float, default=1.0,
+                        help="متوسط زمن التفكير بين تفاعلين بالثواني (0 = بلا توقف)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--slo-ms", type=float, default=SLO_MS, help="حد p95 لحساب السعة")
+    parser.add_argument("--output", type=Path, help="كتابة النتائج الكاملة إلى ملف JSON")
+    args = parser.parse_args(argv)
+
+    results = run(args.sessions, args.duration, args.think, args.seed)
+    limit = capacity(results, args.slo_ms)
+    if limit is None:
+        print(f"capacity: p95 exceeds {args.slo_ms:.0f} ms already at {results[0]['sessions']} session(s)")
+    else:
+        print(f"capacity: {limit} concurrent sessions with p95 <= {args.slo_ms:.0f} ms")
+
+    if args.output:
+        report = {
+            "created": time.time(),
+            "python": sys.version.split()[0],
+            "cpus": os.cpu_count(),
+            "duration": args.duration,
+            "think": args.think,
+            "slo_ms": args.slo_ms,
+            "capacity": limit,
+            "results": results,
+        }
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
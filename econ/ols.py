@@ -0,0 +1,398 @@
+# محرك الانحدار الخطي: OLS وWLS وFGLS مع أخطاء معيارية عادية ومتينة (HC0–HC3) وعنقودية
+# كل الحسابات مصفوفية على NumPy: مصفوفة X'X (n·k² عملية) ثم تحليل Cholesky لها (k³)،
+# ويُلجأ إلى QR على X نفسها فقط حين تكون X'X سيئة التكييف. لا حلقات على الصفوف في بايثون
+#
+#     from econ import ols
+#     result = ols.fit(X, y, names=["const", "x1"], cov_type="HC3")
+#     result = ols.fit(X, y, cov_type="cluster", groups=firm_id)
+#     result = ols.fgls(X, y)              # أوزان مقدرة من تباين البواقي
+#     result.table()                       # جدول المعاملات (pandas)
+#     ols.diagnostics(result, X)           # بروش-باغان، دربن-واتسون، جارك-بيرا
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+
+import numpy as np
+
+COV_TYPES = ("nonrobust", "HC0", "HC1", "HC2", "HC3", "cluster")
+
+# حد نسبة أصغر عنصر في قطر عامل Cholesky إلى أكبرها: دونه تفقد X'X دقة كافية (رقم التكييف ~ 1/النسبة²)
+CHOLESKY_MIN_RATIO = 1e-6
+
+RANK_ERROR = "مصفوفة المتغيرات المستقلة ليست كاملة الرتبة: أحد المتغيرات تركيبة خطية من غيره"
+
+
+# --- التوزيعات (قيم p والقيم الحرجة دون SciPy) ---
+
+def _betacf(a, b, x):
+    # الكسر المستمر لدالة بيتا غير التامة (Lentz)
+    tiny = 1e-300
+    qab, qap, qam = a + b, a + 1.0, a - 1.0
+    c, d = 1.0, 1.0 - qab * x / qap
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    h = d
+    for m in range(1, 10000):
+        m2 = 2 * m
+        aa = m * (b - m) * x / ((qam + m2) * (a + m2))
+        d = 1.0 + aa * d
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = 1.0 + aa / c
+        c = c if abs(c) > tiny else tiny
+        h *= d * c
+        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        d = 1.0 + aa * d
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = 1.0 + aa / c
+        c = c if abs(c) > tiny else tiny
+        delta = d * c
+        h *= delta
+        if abs(delta - 1.0) < 1e-14:
+            break
+    return h
+
+
+def _betainc(a, b, x):
+    """دالة بيتا غير التامة المنتظمة I_x(a, b)."""
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    log_front = math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) + a * math.log(x) + b * math.log1p(-x)
+    if x < (a + 1.0) / (a + b + 2.0):
+        return math.exp(log_front) * _betacf(a, b, x) / a
+    return 1.0 - math.exp(log_front) * _betacf(b, a, 1.0 - x) / b
+
+
+def _gammaincc(a, x):
+    """دالة غاما غير التامة العليا المنتظمة Q(a, x)."""
+    if x <= 0.0:
+        return 1.0
+    log_front = a * math.log(x) - x - math.lgamma(a)
+    if x < a + 1.0:
+        term = total = 1.0 / a
+        n = a
+        while abs(term) > abs(total) * 1e-15:
+            n += 1.0
+            term *= x / n
+            total += term
+        return max(0.0, 1.0 - total * math.exp(log_front))
+    tiny = 1e-300
+    b = x + 1.0 - a
+    c, d = 1.0 / tiny, 1.0 / b
+    h = d
+    for i in range(1, 10000):
+        an = -i * (i - a)
+        b += 2.0
+        d = an * d + b
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = b + an / c
+        c = c if abs(c) > tiny else tiny
+        delta = d * c
+        h *= delta
+        if abs(delta - 1.0) < 1e-15:
+            break
+    return math.exp(log_front) * h
+
+
+def normal_pvalue(z) -> np.ndarray:
+    """قيمة p الثنائية الطرف لإحصاءة z."""
+    return np.vectorize(lambda v: math.erfc(abs(v) / math.sqrt(2.0)), otypes=[float])(z)
+
+
+def t_pvalue(t, df) -> np.ndarray:
+    """قيمة p الثنائية الطرف لإحصاءة t بدرجات حرية df (التوزيع الطبيعي عند df كبيرة جدًا)."""
+    if df > 1e6:
+        return normal_pvalue(t)
+    return np.vectorize(lambda v: _betainc(df / 2.0, 0.5, df / (df + v * v)), otypes=[float])(t)
+
+
+def chi2_pvalue(x, df) -> float:
+    """P(χ²(df) > x)."""
+    return _gammaincc(df / 2.0, x / 2.0)
+
+
+def f_pvalue(x, df1, df2) -> float:
+    """P(F(df1, df2) > x)."""
+    if x <= 0:
+        return 1.0
+    return _betainc(df2 / 2.0, df1 / 2.0, df2 / (df2 + df1 * x))
+
+
+def t_critical(df, level=0.95) -> float:
+    """القيمة الحرجة الثنائية الطرف لتوزيع t (تنصيف على دالة البقاء)."""
+    alpha = 1.0 - level
+    lo, hi = 0.0, 1.0
+    while t_pvalue(hi, df) > alpha:
+        hi *= 2.0
+    for _ in range(100):
+        mid = (lo + hi) / 2.0
+        if t_pvalue(mid, df) > alpha:
+            lo = mid
+        else:
+            hi = mid
+    return (lo + hi) / 2.0
+
+
+# --- الحل ---
+
+@dataclass(frozen=True)
+class Factor:
+    """تحليل X'X المُعاد استخدامه: (X'X)⁻¹ وطريقة حسابه."""
+    xtx_inv: np.ndarray
+    method: str
+
+
+def cholesky_inverse(xtx: np.ndarray):
+    """(X'X)⁻¹ عبر Cholesky بعد توحيد مقياس الأعمدة، أو None إن كانت X'X سيئة التكييف.
+
+    التوحيد (قسمة كل صف وعمود على جذر عنصر القطر) يفصل رقم التكييف عن وحدات القياس،
+    فلا يُرفض متغير لمجرد أن قيمه بالملايين.
+    """
+    scale = np.sqrt(np.diag(xtx))
+    if not (scale > 0).all():
+        return None
+    try:
+        L = np.linalg.cholesky(xtx / np.outer(scale, scale))
+    except np.linalg.LinAlgError:
+        return None
+    diag = np.diag(L)
+    if diag.min() / diag.max() < CHOLESKY_MIN_RATIO:
+        return None
+    L_inv = np.linalg.inv(L) / scale
+    return L_inv.T @ L_inv
+
+
+def factorize(X: np.ndarray) -> Factor:
+    """(X'X)⁻¹ عبر Cholesky، أو QR على X إن كانت X'X سيئة التكييف.
+
+    ترفع ValueError إن لم تكن X كاملة الرتبة (متغير مكرر أو ثابت مع مجموعة وهمية كاملة).
+    """
+    xtx_inv = cholesky_inverse(X.T @ X)
+    if xtx_inv is not None:
+        return Factor(xtx_inv, "cholesky")
+    R = np.linalg.qr(X, mode="r")
+    diag = np.abs(np.diag(R))
+    if diag.min() <= diag.max() * X.shape[0] * np.finfo(float).eps:
+        raise ValueError(RANK_ERROR)
+    R_inv = np.linalg.inv(R)
+    return Factor(R_inv @ R_inv.T, "qr")
+
+
+def group_sums(values: np.ndarray, groups) -> np.ndarray:
+    """مجموع صفوف values لكل مجموعة (G × أعمدة values)، بترتيب المجموعات المُفكَّكة.
+
+    فرز واحد ثم np.add.reduceat، بدل مصفوفة وهمية n × G.
+    """
+    codes = _codes(groups)
+    order = np.argsort(codes, kind="stable")
+    sorted_codes = codes[order]
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    return np.add.reduceat(values[order], starts, axis=0)
+
+
+def _codes(groups) -> np.ndarray:
+    import pandas as pd
+
+    codes, _ = pd.factorize(np.asarray(groups))
+    if (codes < 0).any():
+        raise ValueError("معرّفات العناقيد تحتوي قيمًا مفقودة")
+    return codes
+
+
+def sandwich(X, resid, factor: Factor, cov_type="nonrobust", groups=None, df_resid=None):
+    """مصفوفة تباين المعاملات: (X'X)⁻¹ · وسط · (X'X)⁻¹ حسب نوع الخطأ المعياري."""
+    n, k = X.shape
+    df_resid = n - k if df_resid is None else df_resid
+    bread = factor.xtx_inv
+    if cov_type == "nonrobust":
+        return bread * (resid @ resid / df_resid)
+
+    if cov_type == "cluster":
+        if groups is None:
+            raise ValueError("الأخطاء المعيارية العنقودية تحتاج إلى معرّفات العناقيد")
+        scores = group_sums(X * resid[:, None], groups)
+        g = len(scores)
+        if g < 2:
+            raise ValueError("الأخطاء المعيارية العنقودية تحتاج إلى عنقودين على الأقل")
+        meat = scores.T @ scores * (g / (g - 1) * (n - 1) / df_resid)
+        return bread @ meat @ bread
+
+    if cov_type not in COV_TYPES:
+        raise ValueError(f"نوع خطأ معياري غير معروف: {cov_type} (المتاح: {', '.join(COV_TYPES)})")
+    u2 = resid * resid
+    if cov_type in ("HC2", "HC3"):
+        # الرافعة h_i = x_i (X'X)⁻¹ x_i' دون تكوين مصفوفة الإسقاط n × n
+        leverage = np.einsum("ij,ij->i", X @ bread, X)
+        u2 = u2 / (1.0 - leverage) ** (1 if cov_type == "HC2" else 2)
+    Xu = X * np.sqrt(u2)[:, None]
+    meat = Xu.T @ Xu
+    if cov_type == "HC1":
+        meat *= n / df_resid
+    return bread @ meat @ bread
+
+
+@dataclass(frozen=True)
+class OLSResult:
+    names: list
+    params: np.ndarray
+    cov: np.ndarray
+    cov_type: str
+    nobs: int
+    df_resid: int
+    resid: np.ndarray
+    fitted: np.ndarray
+    ssr: float
+    tss: float
+    estimator: str = "OLS"
+    method: str = "cholesky"
+    # أوزان WLS/FGLS (None في OLS)؛ البواقي والقيم المقدرة أعلاه على مقياس y الأصلي،
+    # وهما None في التقدير التدفقي (econ.streaming) الذي لا يحتفظ بالصفوف
+    weights: np.ndarray | None = field(default=None, repr=False)
+    # تحليل X'X (الموزونة) المستخدم في التقدير، يعيد استخدامه الانحدار المساعد في diagnostics (دون أوزان)
+    factor: Factor | None = field(default=None, repr=False)
+
+    @property
+    def bse(self) -> np.ndarray:
+        return np.sqrt(np.diag(self.cov))
+
+    @property
+    def tvalues(self) -> np.ndarray:
+        return self.params / self.bse
+
+    @property
+    def pvalues(self) -> np.ndarray:
+        return t_pvalue(self.tvalues, self.df_resid)
+
+    @property
+    def rsquared(self) -> float:
+        return 1.0 - self.ssr / self.tss if self.tss > 0 else float("nan")
+
+    @property
+    def rsquared_adj(self) -> float:
+        return 1.0 - (1.0 - self.rsquared) * (self.nobs - 1) / self.df_resid
+
+    def conf_int(self, level=0.95) -> np.ndarray:
+        half = t_critical(self.df_resid, level) * self.bse
+        return np.column_stack([self.params - half, self.params + half])
+
+    def table(self, level=0.95):
+        """جدول المعاملات: التقدير، الخطأ المعياري، t، قيمة p، وفترة الثقة."""
+        import pandas as pd
+
+        ci = self.conf_int(level)
+        pct = f"{level:.0%}"
+        return pd.DataFrame({
+            "المتغير": self.names,
+            "المعامل": self.params,
+            "الخطأ المعياري": self.bse,
+            "t": self.tvalues,
+            "قيمة p": self.pvalues,
+            f"الحد الأدنى {pct}": ci[:, 0],
+            f"الحد الأعلى {pct}": ci[:, 1],
+        })
+
+
+def _names(names, k):
+    return list(names) if names is not None else [f"x{i}" for i in range(k)]
+
+
+def fit(X, y, names=None, weights=None, cov_type="nonrobust", groups=None, estimator=None) -> OLSResult:
+    """تقدير OLS، أو WLS إن مُررت الأوزان (تناسب مقلوب تباين الخطأ).
+
+    WLS هو OLS على البيانات المحولة √w·X و√w·y؛ الأخطاء المعيارية تُحسب في الفضاء المحول
+    وR² كذلك، بينما تعود البواقي على مقياس y الأصلي للتشخيص.
+    """
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if X.ndim == 1:
+        X = X[:, None]
+    n, k = X.shape
+    if n <= k:
+        raise ValueError(f"عدد المشاهدات ({n}) يجب أن يزيد على عدد المعاملات ({k})")
+
+    if weights is not None:
+        weights = np.asarray(weights, dtype=np.float64)
+        if (weights <= 0).any() or not np.isfinite(weights).all():
+            raise ValueError("الأوزان يجب أن تكون موجبة ومحدودة")
+        root = np.sqrt(weights)
+        Xw, yw = X * root[:, None], y * root
+    else:
+        Xw, yw = X, y
+
+    factor = factorize(Xw)
+    params = factor.xtx_inv @ (Xw.T @ yw)
+    resid_w = yw - Xw @ params
+    df_resid = n - k
+    cov = sandwich(Xw, resid_w, factor, cov_type, groups, df_resid)
+
+    fitted = X @ params
+    if weights is None:
+        tss = float(((y - y.mean()) ** 2).sum())
+    else:
+        tss = float((weights * (y - np.average(y, weights=weights)) ** 2).sum())
+    return OLSResult(
+        names=_names(names, k), params=params, cov=cov, cov_type=cov_type, nobs=n, df_resid=df_resid,
+        resid=y - fitted, fitted=fitted, ssr=float(resid_w @ resid_w), tss=tss,
+        estimator=estimator or ("OLS" if weights is None else "WLS"), method=factor.method, weights=weights,
+        factor=factor,
+    )
+
+
+def fgls(X, y, names=None, cov_type="nonrobust", groups=None) -> OLSResult:
+    """FGLS لعدم تجانس التباين: OLS، ثم انحدار log(û²) على X، ثم WLS بأوزان 1/exp(المقدر).
+
+    الانحدار المساعد يشارك تحليل X'X مع الخطوة الأولى فلا يكلف إلا ضربًا مصفوفيًا واحدًا.
+    """
+    X = np.asarray(X, dtype=np.float64)
+    X = X[:, None] if X.ndim == 1 else X
+    y = np.asarray(y, dtype=np.float64)
+    factor = factorize(X)
+    resid = y - X @ (factor.xtx_inv @ (X.T @ y))
+    log_u2 = np.log(resid * resid + np.finfo(float).tiny)
+    variance = np.exp(X @ (factor.xtx_inv @ (X.T @ log_u2)))
+    return fit(X, y, names=names, weights=1.0 / variance, cov_type=cov_type, groups=groups, estimator="FGLS")
+
+
+def diagnostics(result: OLSResult, X) -> dict:
+    """اختبارات البواقي: اسم الاختبار -> (الإحصاءة، قيمة p أو None).
+
+    - بروش-باغان (صيغة Koenker): n·R² لانحدار û² على X وثابت، ويتبع χ²(k-1) تحت تجانس التباين
+    - دربن-واتسون: قريب من 2 دون ارتباط ذاتي من الدرجة الأولى (حسب ترتيب الصفوف)
+    - جارك-بيرا: طبيعية البواقي عبر الالتواء والتفرطح، χ²(2)
+    """
+    X = np.asarray(X, dtype=np.float64)
+    X = X[:, None] if X.ndim == 1 else X
+    n, k = X.shape
+    resid = result.resid if result.weights is None else result.resid * np.sqrt(result.weights)
+
+    # الانحدار المساعد على X الأصلية مع ثابت (يُضاف إن لم يكن فيها)، فيُقارن بالمجموع الكلي الممركز.
+    # في WLS/FGLS تُستخدم البواقي الموزونة: هل بقي عدم تجانس بعد الترجيح؟ و√w·X بلا ثابت لا تصلح لذلك
+    has_const = k > 0 and np.ptp(X, axis=0).min() == 0
+    Z = X if has_const else np.column_stack([np.ones(n), X])
+    if has_const and result.weights is None:
+        factor = result.factor or factorize(X)
+    else:
+        factor = factorize(Z)
+
+    u2 = resid * resid
+    aux = u2 - Z @ (factor.xtx_inv @ (Z.T @ u2))
+    centered = u2 - u2.mean()
+    bp = float(n * (1.0 - (aux @ aux) / (centered @ centered)))
+    bp_df = Z.shape[1] - 1
+
+    dw = float(np.diff(resid) @ np.diff(resid) / (resid @ resid))
+
+    z = (resid - resid.mean()) / resid.std()
+    skew = float((z ** 3).mean())
+    kurt = float((z ** 4).mean())
+    jb = n / 6.0 * (skew ** 2 + (kurt - 3.0) ** 2 / 4.0)
+
+    return {
+        "بروش-باغان (عدم تجانس التباين)": (bp, chi2_pvalue(bp, max(bp_df, 1))),
+        "دربن-واتسون (الارتباط الذاتي)": (dw, None),
+        "جارك-بيرا (طبيعية البواقي)": (jb, chi2_pvalue(jb, 2)),
+        "الالتواء": (skew, None),
+        "التفرطح": (kurt, None),
+    }
@@ -0,0 +1,241 @@
+# قياس زمن كل تشغيل للتطبيق لكل جزء (قسم، مخطط، جدول) وعدد العناصر المُرسلة
+# يُفعَّل عبر متغير البيئة ECON_PROFILE=1، أو بمعامل الرابط ?profile=1 إن سمح به الخادم بـ ECON_PROFILE_QUERY=1
+# (فلا يستطيع أي زائر أن يجعل الخادم يكتب إلى القرص)
+# النتائج تظهر في لوحة قابلة للطي وتُكتب كسطور JSON لمتابعة p50/p95 في بيئة الإنتاج؛ حين يتجاوز
+# السجل ECON_PROFILE_MAX_BYTES (10 ميغابايت افتراضيًا) يُنقل إلى profile.jsonl.1 ويبدأ سجل جديد
+#
+# الأجزاء المعرّفة بـ profiler.fragment بدل st.fragment تُقاس أيضًا حين يُعاد تشغيلها وحدها،
+# وتُسجَّل بعنوان fragment=<المفتاح> بجانب التشغيلات الكاملة (section=<القسم>)
+#
+# الاستخدام من سطر الأوامر لتلخيص السجل:
+#     python -m econ.profiler [profile.jsonl]
+
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+
+import streamlit as st
+
+LOG_PATH = Path(os.environ.get(
+    "ECON_PROFILE_LOG",
+    Path(__file__).resolve().parent.parent / ".cache" / "profile.jsonl"
+))
+
+MAX_LOG_BYTES = int(os.environ.get("ECON_PROFILE_MAX_BYTES", str(10 * 2**20)))
+
+# دوال Streamlit التي يُقاس زمن استدعائها مباشرة
+TIMED_ELEMENTS = ("markdown", "table", "dataframe", "plotly_chart")
+
+_local = threading.local()
+_install_lock = threading.Lock()
+_log_lock = threading.Lock()
+_installed = False
+
+
+class RunProfile:
+    def __init__(self, run_id):
+        self.run_id = run_id
+        self.started = time.perf_counter()
+        self.timings = defaultdict(float)
+        self.calls = defaultdict(int)
+        self.elements = defaultdict(int)
+
+
+def _active():
+    return getattr(_local, "profile", None)
+
+
+def enabled() -> bool:
+    if os.environ.get("ECON_PROFILE") == "1":
+        return True
+    return os.environ.get("ECON_PROFILE_QUERY") == "1" and st.query_params.get("profile") == "1"
+
+
+@contextmanager
+def section(name):
+    """قياس الزمن الشامل لجزء من التشغيل؛ لا يفعل شيئًا إن لم يكن القياس مفعّلًا."""
+    profile = _active()
+    if profile is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.timings[name] += (time.perf_counter() - start) * 1000
+        profile.calls[name] += 1
+
+
+def _timed(name, func):
+    def wrapper(*args, **kwargs):
+        with section(name):
+            return func(*args, **kwargs)
+    wrapper.__wrapped__ = func
+    return wrapper
+
+
+def _install():
+    """تركيب خطافات القياس مرة واحدة لكل عملية؛ تمرر الاستدعاءات كما هي خارج التشغيلات المقاسة."""
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        from streamlit.delta_generator import DeltaGenerator
+
+        enqueue = DeltaGenerator._enqueue
+
+        def counting_enqueue(self, delta_type, *args, **kwargs):
+            profile = _active()
+            if profile is not None:
+                profile.elements[delta_type] += 1
+            return enqueue(self, delta_type, *args, **kwargs)
+
+        DeltaGenerator._enqueue = counting_enqueue
+        for name in TIMED_ELEMENTS:
+            setattr(st, name, _timed(f"st.{name}", getattr(st, name)))
+        _installed = True
+
+
+def start_run():
+    """بداية تشغيل مقاس؛ تُستدعى في أول السكربت."""
+    _local.profile = None
+    if not enabled():
+        return
+    _install()
+
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    _local.profile = RunProfile(ctx.session_id if ctx else "local")
+
+
+def _fragment_rerun() -> bool:
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    return bool(ctx and ctx.fragment_ids_this_run)
+
+
+def fragment(key):
+    """st.fragment(key=key) مع القياس.
+
+    إعادة تشغيل الجزء وحده لا تمر بـ start_run/finish_run في أعلى السكربت، فتُقاس هنا كتشغيل
+    مستقل بعنوان fragment=key؛ وداخل تشغيل كامل يُحتسب زمن الجزء كقسم "fragment:<key>".
+    """
+    def decorate(func):
+        @functools.wraps(func)
+        def body(*args, **kwargs):
+            if not _fragment_rerun():
+                with section(f"fragment:{key}"):
+                    return func(*args, **kwargs)
+            start_run()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                finish_run(fragment=key)
+        return st.fragment(body, key=key)
+    return decorate
+
+
+def finish_run(**labels):
+    """نهاية التشغيل: كتابة السجل وعرض لوحة النتائج."""
+    profile = _active()
+    if profile is None:
+        return
+    _local.profile = None
+
+    total_ms = (time.perf_counter() - profile.started) * 1000
+    record = {
+        "ts": time.time(),
+        "session": profile.run_id,
+        **labels,
+        "total_ms": round(total_ms, 3),
+        "elements": sum(profile.elements.values()),
+        "element_types": dict(profile.elements),
+        "timings": {name: round(ms, 3) for name, ms in profile.timings.items()},
+        "calls": dict(profile.calls),
+    }
+
+    _append(record)
+
+    # لوحة الجزء تُرسم داخله، فتحتاج مفتاحًا خاصًا بها لا يتعارض مع لوحة التشغيل الكامل
+    fragment_key = labels.get("fragment")
+    _render_overlay(record, f"profiler_overlay_{fragment_key}" if fragment_key else "profiler_overlay")
+
+
+def _rotated(path) -> Path:
+    path = Path(path)
+    return path.with_name(path.name + ".1")
+
+
+def _append(record, path=LOG_PATH, max_bytes=MAX_LOG_BYTES):
+    """إضافة سطر إلى السجل، ونقله إلى <السجل>.1 (بدل النسخة السابقة) حين يبلغ حده."""
+    line = json.dumps(record, ensure_ascii=False) + "\n"
+    with _log_lock:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            if path.stat().st_size + len(line) > max_bytes:
+                path.replace(_rotated(path))
+        except FileNotFoundError:
+            pass
+        with path.open("a", encoding="utf-8") as f:
+            f.write(line)
+
+
+def _render_overlay(record, key="profiler_overlay"):
+    from econ.charts import FIGURE_CACHE
+
+    rows = sorted(record["timings"].items(), key=lambda item: -item[1])
+    with st.container(key=key):
+        with st.expander(f"⏱️ {record['total_ms']:.0f} ms · {record['elements']} عنصر"):
+            st.dataframe(
+                {
+                    "الجزء": [name for name, _ in rows],
+                    "الزمن (ms)": [ms for _, ms in rows],
+                    "الاستدعاءات": [record["calls"][name] for name, _ in rows],
+                },
+                hide_index=True
+            )
+            st.caption(f"ذاكرة المخططات: {FIGURE_CACHE.stats()}")
+            st.caption(f"السجل: {LOG_PATH}")
+
+
+def summarize(path=LOG_PATH):
+    """p50/p95 لزمن كل جزء عبر جميع التشغيلات المسجلة، بما فيها السجل المنقول قبل آخر تدوير."""
+    import numpy as np
+
+    samples = defaultdict(list)
+    for part in (_rotated(path), Path(path)):
+        if not part.exists():
+            continue
+        with part.open(encoding="utf-8") as f:
+            for line in f:
+                record = json.loads(line)
+                samples["total"].append(record["total_ms"])
+                for name, ms in record["timings"].items():
+                    samples[name].append(ms)
+
+    summary = {}
+    for name, values in samples.items():
+        values = np.asarray(values)
+        summary[name] = {
+            "runs": len(values),
+            "p50": float(np.percentile(values, 50)),
+            "p95": float(np.percentile(values, 95)),
+        }
+    return summary
+
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else LOG_PATH
+    summary = summarize(path)
+    width = max(len(name) for name in summary)
+    print(f"{'part':<{width}}  {'runs':>6}  {'p50 ms':>10}  {'p95 ms':>10}")
+    for name, s in sorted(summary.items(), key=lambda item: -item[1]["p95"]):
+        print(f"{name:<{width}}  {s['runs']:>6}  {s['p50']:>10.2f}  {s['p95']:>10.2f}")
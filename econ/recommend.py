@@ -0,0 +1,160 @@
+# محرك التوصيات: يربط نتائج التقييم الذاتي بموارد محددة (دورات، كتب، قنوات)
+# مصفوفة الصلة (مورد × مهارة) تُحسب مرة واحدة لكل إصدار من الكتالوج، والتقييم عملية NumPy واحدة
+
+import re
+from dataclasses import dataclass
+
+import numpy as np
+import streamlit as st
+
+from econ.search import normalize_arabic, tokenize
+
+# الجداول المستخدمة في التوصيات: عمود العنوان ونوع المورد
+RESOURCE_TABLES = {
+    "courses": ("العنوان", "دورة"),
+    "books": ("العنوان", "كتاب"),
+    "youtube_channels": ("القناة", "قناة يوتيوب"),
+}
+
+# الكلمات الدالة على كل مهارة من مهارات التقييم الذاتي (تُطبّع بنفس تطبيع البحث)
+SKILL_KEYWORDS = {
+    'البرمجة (Python/R)': ["برمجة", "بايثون", "python", "r", "programming", "code", "كود"],
+    'الإحصاء والاحتمالات': ["إحصاء", "إحصائية", "احتمالات", "statistics", "statistical", "bayesian", "probability"],
+    'نماذج القياس الاقتصادي': ["قياس", "اقتصادي", "قياسي", "econometrics", "econometric", "regression", "انحدار",
+                              "time", "series", "السلاسل", "panel", "causal", "السببية"],
+    'التعلم الآلي': ["تعلم", "آلي", "machine", "learning", "deep", "عميق", "الخوارزميات", "ai"],
+    'تصور البيانات': ["تصور", "تصورات", "visualization", "tableau", "plotly", "مرئي", "3blue1brown"],
+    'قواعد البيانات وSQL': ["sql", "قواعد", "database", "databases"],
+    'معالجة وتنظيف البيانات': ["تحليل", "معالجة", "analysis", "analytics", "pandas", "تنظيف", "wrangling"],
+    'التواصل وعرض النتائج': ["business", "أعمال", "تواصل", "عرض", "نصائح", "مهنية"],
+}
+
+# أوزان مواضع التطابق: العنوان والتصنيف أدل على موضوع المورد من وصفه
+FIELD_WEIGHTS = {"title": 2.0, "category": 2.0, "text": 1.0}
+
+LEVELS = {"مبتدئ": 0.0, "متوسط": 1.0, "متقدم": 2.0}
+# ملاءمة المورد الذي لا يحمل مستوى (كالقنوات) لأي مستوى من مستويات المستخدم
+UNLEVELED_FIT = 0.75
+
+
+def parse_level(label) -> float:
+    """"مبتدئ إلى متوسط" -> 0.5؛ المورد بلا مستوى -> nan."""
+    values = [v for name, v in LEVELS.items() if name in str(label)]
+    return float(np.mean(values)) if values else np.nan
+
+
+_RATINGS_CODE = re.compile(r"[0-9a-fA-F]*")
+
+
+def encode_ratings(values) -> str:
+    """ترميز مضغوط للتقييمات في رابط قابل للمشاركة: خانتان ست عشريتان لكل مهارة (00-64)."""
+    return "".join(f"{int(v):02x}" for v in values)
+
+
+def decode_ratings(code, count):
+    """عكس encode_ratings؛ None إن لم يكن الرمز صالحًا لعدد المهارات المطلوب."""
+    if not isinstance(code, str) or len(code) != 2 * count or not _RATINGS_CODE.fullmatch(code):
+        return None
+    values = [int(code[i:i + 2], 16) for i in range(0, len(code), 2)]
+    return values if all(v <= 100 for v in values) else None
+
+
+@dataclass
+class Recommendation:
+    kind: str
+    title: str
+    link: str
+    level: str
+    score: float
+
+
+class Recommender:
+    def __init__(self, catalog, skills):
+        self.skills = list(skills)
+        skill_index = {skill: j for j, skill in enumerate(self.skills)}
+
+        keyword_skills = {}
+        for skill, keywords in SKILL_KEYWORDS.items():
+            if skill not in skill_index:
+                continue
+            for keyword in keywords:
+                for token in tokenize(keyword):
+                    keyword_skills.setdefault(token, set()).add(skill_index[skill])
+
+        self.resources = []
+        hits = []
+        seen = set()
+        for table, (title_column, kind) in RESOURCE_TABLES.items():
+            if table not in catalog.tables:
+                continue
+            df = catalog[table]
+            text_columns = [c for c in df.columns if c not in (title_column, "الرابط", "التصنيف", "المستوى")]
+            for row in df.itertuples(index=False, name=None):
+                record = dict(zip(df.columns, row))
+                title = str(record[title_column])
+                # المورد نفسه قد يظهر في أكثر من جدول: يُحتفظ بأول ظهور فقط
+                key = normalize_arabic(title)
+                if key in seen:
+                    continue
+                seen.add(key)
+
+                row_hits = np.zeros(len(self.skills), dtype=np.float32)
+                fields = {
+                    "title": title,
+                    "category": str(record.get("التصنيف", "")),
+                    "text": " ".join(str(record[c]) for c in text_columns),
+                }
+                for field, text in fields.items():
+                    for token in set(tokenize(text)):
+                        for j in keyword_skills.get(token, ()):
+                            row_hits[j] += FIELD_WEIGHTS[field]
+                hits.append(row_hits)
+
+                level = record.get("المستوى", "")
+                self.resources.append((kind, title, str(record.get("الرابط", "")), str(level) if level == level else ""))
+
+        hits = np.asarray(hits, dtype=np.float32).reshape(-1, len(self.skills))
+        # الصلة تتشبع مع تكرار التطابق: مورد بتطابقين قويين لا يتفوق كثيرًا على مورد بتطابق واحد
+        self.relevance = (1 - np.exp(-hits / 2)).astype(np.float32)
+        self.levels = np.array([parse_level(r[3]) for r in self.resources], dtype=np.float32)
+
+    def recommend(self, ratings, weak_below=50, top_n=3) -> dict[str, list[Recommendation]]:
+        """أفضل الموارد لكل مهارة ضعيفة، مرتبة ودون تكرار المورد بين المهارات.
+
+        ratings: المهارة -> التقييم (0-100).
+        """
+        scores = np.array([ratings.get(skill, 100) for skill in self.skills], dtype=np.float32)
+        weak = np.flatnonzero(scores < weak_below)
+        if len(weak) == 0 or len(self.resources) == 0:
+            return {}
+
+        # الحاجة تزداد كلما انخفض التقييم، والمستوى المستهدف يتبع التقييم (0 = مبتدئ، 2 = متقدم)
+        need = (weak_below - scores[weak]) / weak_below
+        target = scores[weak] / 50.0
+        fit = 1 - np.abs(self.levels[:, None] - target[None, :]) / 2
+        fit = np.where(np.isnan(fit), UNLEVELED_FIT, fit)
+        score = self.relevance[:, weak] * fit * (0.5 + need[None, :])
+
+        # إزالة التكرار: يُنسب كل مورد إلى المهارة الضعيفة التي يخدمها أكثر من غيرها
+        best = score.argmax(axis=1)
+        score = np.where(best[:, None] == np.arange(len(weak))[None, :], score, 0)
+
+        n = min(top_n, len(self.resources))
+        top = np.argpartition(-score, n - 1, axis=0)[:n]
+
+        results = {}
+        for column, j in enumerate(weak):
+            rows = top[:, column]
+            rows = rows[np.argsort(-score[rows, column], kind="stable")]
+            results[self.skills[j]] = [
+                Recommendation(*self.resources[i], score=float(score[i, column]))
+                for i in rows if score[i, column] > 0
+            ]
+        return results
+
+
+@st.cache_resource(show_spinner=False)
+def load_recommender(skills: tuple) -> Recommender:
+    from econ.catalog import load_catalog
+
+    return Recommender(load_catalog(), skills)
@@ -0,0 +1,275 @@
+# استدلال بإعادة المعاينة على مجمع عمليات: Bootstrap (أزواج، عناقيد، Wild) واختبارات التبديل
+# كل دفعة من التكرارات حساب مصفوفي واحد: مصفوفة فهارس (تكرارات × وحدات) تتحول إلى مصفوفة
+# أعداد، وضربها في مجاميع الوحدات المحسوبة مسبقًا يعطي X'X وX'y لكل تكرار دفعة واحدة
+#
+#     python -m econ.resample --rows 100000 --k 5 --method pairs --replications 2000 --workers 4
+#     python -m econ.resample --method cluster --clusters 200
+#     python -m econ.resample --method permutation --replications 5000
+#
+#     from econ import resample
+#     for snapshot in resample.run(X, y, method="wild", replications=999, workers=4):
+#         print(snapshot.done, resample.percentile_ci(snapshot.draws))
+#
+# البيانات تُنسخ مرة واحدة إلى ذاكرة مشتركة تقرؤها العمليات مباشرة، فلا تُرسل مع المهام إلا البذور؛
+# بذرة كل دفعة ابنة لـ SeedSequence(seed)، فالنتيجة واحدة مهما كان عدد العمليات أو ترتيب انتهائها
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from econ import ols
+
+METHODS = {
+    "pairs": "Bootstrap الأزواج (إعادة معاينة المشاهدات)",
+    "cluster": "Bootstrap العناقيد (إعادة معاينة العناقيد كاملة)",
+    "wild": "Wild bootstrap (أوزان رادماخر على البواقي)",
+    "permutation": "اختبار التبديل (Freedman–Lane)",
+}
+
+# حد ذاكرة مصفوفة الأعداد أو الفهارس في الدفعة الواحدة: يحدد عدد التكرارات في كل دفعة
+BATCH_BYTES = 64 * 2**20
+MAX_BATCH = 256
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """حالة التشغيل بعد اكتمال دفعة: التكرارات المكتملة حتى الآن (done × k) من أصل total."""
+    done: int
+    total: int
+    draws: np.ndarray
+    observed: np.ndarray
+
+
+# --- الإحصاءات المسبقة (في العملية الرئيسية) ---
+
+def _triu(k):
+    return np.triu_indices(k)
+
+
+def prepare(X, y, method, groups=None) -> dict:
+    """المصفوفات المشتركة لكل طريقة، محسوبة مرة واحدة قبل التكرارات.
+
+    - pairs/cluster: لكل وحدة (مشاهدة أو عنقود) مثلث x'x العلوي وx'y؛ تكرار Bootstrap هو
+      مجموعها الموزون بعدد مرات سحب الوحدة
+    - wild: b* − b̂ = (X'X)⁻¹X'(û·v)، فيكفي (X (X'X)⁻¹)·û
+    - permutation: لكل متغير j بواقي y والمتغير على بقية المتغيرات (Freedman–Lane)
+    """
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    factor = ols.factorize(X)
+    params = factor.xtx_inv @ (X.T @ y)
+    k = X.shape[1]
+
+    if method in ("pairs", "cluster"):
+        rows, cols = _triu(k)
+        xx = X[:, rows] * X[:, cols]
+        xy = X * y[:, None]
+        if method == "cluster":
+            if groups is None:
+                raise ValueError("Bootstrap العناقيد يحتاج إلى معرّفات العناقيد")
+            xx, xy = ols.group_sums(xx, groups), ols.group_sums(xy, groups)
+        return {"params": params, "arrays": {"xx": xx, "xy": xy}}
+
+    if method == "wild":
+        resid = y - X @ params
+        return {"params": params, "arrays": {"au": (X @ factor.xtx_inv) * resid[:, None]}}
+
+    if method == "permutation":
+        n = len(y)
+        resid = np.zeros((n, k))
+        direction = np.zeros((n, k))
+        # المتغيرات الثابتة (كالثابت) لا معنى لتبديلها: يبقى عمودها صفرًا وقيمة p لها NaN
+        for j in np.flatnonzero(np.ptp(X, axis=0) > 0):
+            others = np.delete(X, j, axis=1)
+            reduced = ols.factorize(others).xtx_inv
+            resid[:, j] = y - others @ (reduced @ (others.T @ y))
+            r = X[:, j] - others @ (reduced @ (others.T @ X[:, j]))
+            direction[:, j] = r / (r @ r)
+        return {"params": params, "arrays": {"resid": resid, "direction": direction}}
+
+    raise ValueError(f"طريقة غير معروفة: {method} (المتاح: {', '.join(METHODS)})")
+
+
+# --- العمليات العاملة ---
+
+# المصفوفات المشتركة في العملية الحالية: الاسم -> عرض NumPy على الذاكرة المشتركة
+_SHARED = {}
+_HANDLES = []
+
+
+def _attach(specs):
+    """مُهيئ العملية العاملة: ربط الذاكرة المشتركة مرة واحدة لكل عملية."""
+    for key, (name, shape, dtype) in specs.items():
+        # العاملة تشارك الرئيسية متتبع الموارد (spawn يورثه)، فالذاكرة تُحذف مرة واحدة حين تفكها الرئيسية
+        shm = SharedMemory(name=name)
+        _HANDLES.append(shm)
+        _SHARED[key] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _batch(method, size, seed, k, params, arrays=None):
+    """تكرارات دفعة واحدة (size × k) من المصفوفات المسبقة (المشتركة في العاملة افتراضيًا)."""
+    arrays = _SHARED if arrays is None else arrays
+    rng = np.random.default_rng(seed)
+    if method in ("pairs", "cluster"):
+        xx, xy = arrays["xx"], arrays["xy"]
+        units = len(xy)
+        draws = rng.integers(0, units, (size, units))
+        # مصفوفة الفهارس -> أعداد مرات سحب كل وحدة في كل تكرار، بعملية bincount واحدة
+        counts = np.bincount((draws + units * np.arange(size)[:, None]).ravel(), minlength=size * units)
+        counts = counts.reshape(size, units).astype(np.float64)
+        xtx = np.zeros((size, k, k))
+        rows, cols = _triu(k)
+        xtx[:, rows, cols] = counts @ xx
+        xtx[:, cols, rows] = xtx[:, rows, cols]
+        rhs = counts @ xy
+        try:
+            return np.linalg.solve(xtx, rhs[:, :, None])[:, :, 0]
+        except np.linalg.LinAlgError:
+            # عينة متدهورة نادرة (متغير ثابت في العينة المسحوبة): تُحل التكرارات فرادى وتُترك المتدهورة NaN
+            result = np.full((size, k), np.nan)
+            for i in range(size):
+                try:
+                    result[i] = np.linalg.solve(xtx[i], rhs[i])
+                except np.linalg.LinAlgError:
+                    pass
+            return result
+    if method == "wild":
+        au = arrays["au"]
+        signs = rng.integers(0, 2, (size, len(au)), dtype=np.int8) * 2.0 - 1.0
+        return params + signs @ au
+    resid, direction = arrays["resid"], arrays["direction"]
+    order = rng.permuted(np.broadcast_to(np.arange(len(resid)), (size, len(resid))), axis=1)
+    result = np.zeros((size, k))
+    # عمود بعد عمود: جمع عمود واحد مُبدَّل أسرع من جمع صفوف k كاملة، ويُتخطى عمود الثابت
+    for j in np.flatnonzero(direction.any(axis=0)):
+        result[:, j] = resid[:, j][order] @ direction[:, j]
+    return result
+
+
+def _batch_sizes(method, replications, units, k):
+    # بايتات التكرار الواحد: صف أعداد أو إشارات، أو في التبديل صف الترتيب وعمود البواقي المُبدَّلة
+    per_replicate = units * 8 * (2 if method == "permutation" else 1)
+    size = int(min(MAX_BATCH, max(1, BATCH_BYTES // per_replicate)))
+    sizes = [size] * (replications // size)
+    if replications % size:
+        sizes.append(replications % size)
+    return sizes
+
+
+# --- التشغيل ---
+
+def run(X, y, method="pairs", groups=None, replications=999, workers=None, seed=0):
+    """مولد لقطات (Snapshot) بعد كل دفعة مكتملة؛ الأخيرة تحمل كل التكرارات.
+
+    مع workers > 1 تُنسخ المصفوفات المسبقة إلى ذاكرة مشتركة وتُوزع الدفعات على عمليات جديدة
+    (spawn: لا تُورَّث حالة خيوط الخادم، ولا تصل البيانات إلى العاملة إلا عبر الذاكرة المشتركة).
+    """
+    prepared = prepare(X, y, method, groups)
+    params, arrays = prepared["params"], prepared["arrays"]
+    k = len(params)
+    units = len(next(iter(arrays.values())))
+    sizes = _batch_sizes(method, replications, units, k)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    results = [None] * len(sizes)
+    done = 0
+
+    def snapshot():
+        draws = np.concatenate([r for r in results if r is not None]) if done else np.empty((0, k))
+        return Snapshot(done, replications, draws, params)
+
+    workers = workers or 1
+    if workers <= 1:
+        for i, size in enumerate(sizes):
+            results[i] = _batch(method, size, seeds[i], k, params, arrays)
+            done += size
+            yield snapshot()
+        return
+
+    blocks = []
+    try:
+        specs = {}
+        for key, array in arrays.items():
+            shm = SharedMemory(create=True, size=max(array.nbytes, 1))
+            blocks.append(shm)
+            np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+            specs[key] = (shm.name, array.shape, array.dtype.str)
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_attach, initargs=(specs,)) as pool:
+            futures = {pool.submit(_batch, method, size, seeds[i], k, params): i for i, size in enumerate(sizes)}
+            try:
+                for future in as_completed(futures):
+                    i = futures[future]
+                    results[i] = future.result()
+                    done += sizes[i]
+                    yield snapshot()
+            finally:
+                # توقف المستهلك مبكرًا (مغادرة الصفحة مثلًا): لا تُبدأ الدفعات المتبقية
+                for future in futures:
+                    future.cancel()
+    finally:
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
+
+
+def percentile_ci(draws, level=0.95) -> np.ndarray:
+    """فترة الثقة المئينية لكل معامل (k × 2)، مع تجاهل التكرارات المتدهورة."""
+    alpha = (1.0 - level) / 2.0
+    return np.nanquantile(draws, [alpha, 1.0 - alpha], axis=0).T
+
+
+def permutation_pvalues(draws, observed) -> np.ndarray:
+    """قيمة p الثنائية الطرف لكل معامل: نسبة التبديلات التي تبلغ |b| المشاهد على الأقل."""
+    extreme = (np.abs(draws) >= np.abs(observed)).sum(axis=0)
+    pvalues = (1.0 + extreme) / (1.0 + len(draws))
+    pvalues[np.all(draws == 0, axis=0)] = np.nan
+    return pvalues
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="قياس زمن Bootstrap واختبارات التبديل على بيانات محاكاة")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--clusters", type=int, default=100)
+    parser.add_argument("--method", choices=METHODS, default="pairs")
+    parser.add_argument("--replications", type=int, default=999)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(args.seed)
+    X = np.column_stack([np.ones(args.rows), rng.standard_normal((args.rows, args.k - 1))])
+    groups = rng.integers(0, args.clusters, args.rows)
+    y = X @ np.linspace(1.0, -1.0, args.k) + np.exp(0.5 * X[:, 1]) * rng.standard_normal(args.rows)
+
+    start = time.perf_counter()
+    for snapshot in run(X, y, args.method, groups, args.replications, args.workers, args.seed):
+        print(f"\r{snapshot.done}/{snapshot.total}", end="", file=sys.stderr, flush=True)
+    elapsed = time.perf_counter() - start
+    print(file=sys.stderr)
+
+    cov_type = "cluster" if args.method == "cluster" else "HC1"
+    analytic = ols.fit(X, y, cov_type=cov_type, groups=groups)
+    print(f"{'coef':>6} {'estimate':>10} {f'{cov_type} se':>10} {'resampled':>10}")
+    if args.method == "permutation":
+        stats = permutation_pvalues(snapshot.draws, snapshot.observed)
+    else:
+        stats = np.nanstd(snapshot.draws, axis=0, ddof=1)
+    for j in range(args.k):
+        print(f"{j:>6} {analytic.params[j]:>10.4f} {analytic.bse[j]:>10.4f} {stats[j]:>10.4f}")
+    print(f"{args.replications:,} {args.method} replications on {args.rows:,} rows with {args.workers} workers "
+          f"in {elapsed:.2f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
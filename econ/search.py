@@ -0,0 +1,236 @@
+# البحث النصي الكامل في الدليل: فهرس معكوس مع تطبيع عربي وترتيب BM25 ومطابقة البادئات
+# يُبنى الفهرس مرة واحدة لكل إصدار من الكتالوج ونصوص الأقسام، ويُحفظ على القرص لتجنب بنائه عند الإقلاع
+
+import ast
+import bisect
+import hashlib
+import html
+import os
+import pickle
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import streamlit as st
+
+CACHE_DIR = Path(os.environ.get("ECON_CACHE_DIR", Path(__file__).resolve().parent.parent / ".cache"))
+
+# الجداول المفهرسة: عمود العنوان، وصف نوع النتيجة، والقسم الذي يعرضها
+INDEXED_TABLES = {
+    "books": ("العنوان", "كتاب", "references"),
+    "courses": ("العنوان", "دورة", "references"),
+    "youtube_channels": ("القناة", "قناة يوتيوب", "references"),
+    "websites": ("الموقع", "موقع", "references"),
+    "blogs": ("المدونة", "مدونة", "references"),
+    "certifications": ("الشهادة", "شهادة", "learning_paths"),
+    "platforms": ("المنصة", "منصة تعليمية", "learning_paths"),
+    "paths": ("المسار", "مسار تعليمي", "learning_paths"),
+    "career_path": ("المنصب", "مسار وظيفي", "data_science"),
+    "topics": ("title", "موضوع", "econometrics"),
+}
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+MAX_PREFIX_EXPANSIONS = 64
+INDEX_FORMAT = 1
+
+_DIACRITICS = re.compile("[\u0610-\u061a\u064b-\u065f\u0670\u06d6-\u06ed]")
+_CHAR_MAP = str.maketrans({
+    "أ": "ا", "إ": "ا", "آ": "ا", "ٱ": "ا",
+    "ؤ": "و", "ئ": "ي", "ى": "ي",
+    "ة": "ه",
+    "ـ": None,  # التطويل
+})
+_TOKEN = re.compile(r"\w+")
+_TAG = re.compile(r"<[^>]+>")
+
+
+def normalize_arabic(text: str) -> str:
+    """توحيد أشكال الألف والهمزة والتاء المربوطة والياء، وحذف التشكيل والتطويل."""
+    return _DIACRITICS.sub("", text).translate(_CHAR_MAP).lower()
+
+
+def tokenize(text: str) -> list[str]:
+    tokens = []
+    for token in _TOKEN.findall(normalize_arabic(text)):
+        # حذف أداة التعريف حتى يطابق "البيانات" كلمة "بيانات"
+        if token.startswith("ال") and len(token) > 4:
+            token = token[2:]
+        tokens.append(token)
+    return tokens
+
+
+@dataclass
+class SearchHit:
+    score: float
+    kind: str
+    title: str
+    snippet: str
+    section: str
+    link: str
+
+
+class SearchIndex:
+    """فهرس معكوس مضغوط: قوائم الورود لكل مصطلح مخزنة كمصفوفات NumPy متجاورة."""
+
+    def __init__(self, documents):
+        # documents: قائمة من (kind, title, text, section, link)
+        self.docs = [(kind, title, _snippet(text), section, link)
+                     for kind, title, text, section, link in documents]
+
+        postings = defaultdict(list)
+        doc_len = np.zeros(len(documents), dtype=np.float32)
+        for doc_id, (_, title, text, _, _) in enumerate(documents):
+            counts = Counter(tokenize(f"{title} {text}"))
+            doc_len[doc_id] = sum(counts.values())
+            for term, tf in counts.items():
+                postings[term].append((doc_id, tf))
+
+        self.terms = sorted(postings)
+        offsets = [0]
+        doc_ids, tfs = [], []
+        for term in self.terms:
+            for doc_id, tf in postings[term]:
+                doc_ids.append(doc_id)
+                tfs.append(tf)
+            offsets.append(len(doc_ids))
+
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.doc_ids = np.asarray(doc_ids, dtype=np.int32)
+        self.tfs = np.asarray(tfs, dtype=np.float32)
+        self.doc_len = doc_len
+        self.avg_len = float(doc_len.mean()) if len(doc_len) else 0.0
+
+        n_docs = len(documents)
+        df = np.diff(self.offsets)
+        self.idf = np.log1p((n_docs - df + 0.5) / (df + 0.5)).astype(np.float32)
+        # مقام BM25 الخاص بطول كل وثيقة محسوب مسبقًا
+        self.len_norm = (BM25_K1 * (1 - BM25_B + BM25_B * doc_len / max(self.avg_len, 1e-9))).astype(np.float32)
+
+    def _matching_terms(self, token):
+        """المصطلح نفسه وكل المصطلحات التي تبدأ به، عبر بحث ثنائي في المفردات المرتبة."""
+        lo = bisect.bisect_left(self.terms, token)
+        if len(token) < 2:
+            # حرف واحد يطابق نصف المفردات تقريبًا، فنكتفي بالمطابقة التامة
+            return range(lo, lo + 1) if lo < len(self.terms) and self.terms[lo] == token else range(0)
+        hi = bisect.bisect_left(self.terms, token + "\uffff", lo)
+        term_ids = range(lo, hi)
+        if len(term_ids) > MAX_PREFIX_EXPANSIONS:
+            # أكثر المصطلحات شيوعًا أولًا عند كثرة التوسعات
+            df = np.diff(self.offsets)[lo:hi]
+            term_ids = lo + np.argsort(-df, kind="stable")[:MAX_PREFIX_EXPANSIONS]
+        return term_ids
+
+    def search(self, query: str, limit: int = 10) -> list[SearchHit]:
+        tokens = tokenize(query)
+        if not tokens or not self.docs:
+            return []
+
+        scores = np.zeros(len(self.docs), dtype=np.float32)
+        for token in set(tokens):
+            for term_id in self._matching_terms(token):
+                start, end = self.offsets[term_id], self.offsets[term_id + 1]
+                ids = self.doc_ids[start:end]
+                tf = self.tfs[start:end]
+                # معرفات الوثائق فريدة داخل قائمة المصطلح الواحد، فالإضافة المتجهة آمنة
+                scores[ids] += self.idf[term_id] * tf * (BM25_K1 + 1) / (tf + self.len_norm[ids])
+
+        matched = np.flatnonzero(scores)
+        if len(matched) > limit:
+            matched = matched[np.argpartition(-scores[matched], limit)[:limit]]
+        matched = matched[np.argsort(-scores[matched], kind="stable")]
+
+        return [SearchHit(float(scores[i]), *self.docs[i]) for i in matched]
+
+
+def _snippet(text: str, length: int = 160) -> str:
+    text = " ".join(text.split())
+    return text if len(text) <= length else text[:length].rsplit(" ", 1)[0] + "…"
+
+
+def catalog_documents(catalog):
+    for table, (title_column, kind, section) in INDEXED_TABLES.items():
+        if table not in catalog.tables:
+            continue
+        df = catalog[table]
+        text_columns = [c for c in df.columns if c not in (title_column, "الرابط")]
+        links = df["الرابط"].astype(str) if "الرابط" in df.columns else [""] * len(df)
+        texts = df[text_columns].astype(str).agg(" ".join, axis=1) if text_columns else [""] * len(df)
+        for title, text, link in zip(df[title_column].astype(str), texts, links):
+            yield kind, title, text, section, link
+
+
+def section_documents(source: str, functions: dict[str, tuple[str, str]]):
+    """استخراج نصوص الأقسام من مصدر التطبيق: وثيقة لكل عنوان فرعي داخل كل قسم.
+
+    functions: اسم دالة القسم -> (مفتاح القسم، اسم القسم).
+    """
+    tree = ast.parse(source)
+    for node in tree.body:
+        if not isinstance(node, ast.FunctionDef) or node.name not in functions:
+            continue
+        section, label = functions[node.name]
+
+        strings = [n for n in ast.walk(node) if isinstance(n, ast.Constant) and isinstance(n.value, str)]
+        strings.sort(key=lambda n: (n.lineno, n.col_offset))
+
+        heading, parts = label, []
+        for n in strings:
+            value = n.value.strip()
+            if value.startswith(("<h2", "<h3")):
+                if parts:
+                    yield "قسم", heading, " ".join(parts), section, ""
+                heading, parts = f"{label}: {_strip_tags(value)}", []
+                continue
+            value = _strip_tags(value)
+            if value:
+                parts.append(value)
+        if parts:
+            yield "قسم", heading, " ".join(parts), section, ""
+
+
+def _strip_tags(text: str) -> str:
+    return html.unescape(_TAG.sub(" ", text)).strip()
+
+
+def index_path(catalog_version: str, source: str) -> Path:
+    digest = hashlib.sha1(source.encode("utf-8")).hexdigest()[:12]
+    return CACHE_DIR / f"search-v{INDEX_FORMAT}-{catalog_version}-{digest}.pkl"
+
+
+def build_search_index(catalog, source: str, functions) -> SearchIndex:
+    """بناء الفهرس أو تحميله من القرص إن سبق بناؤه لنفس الإصدار."""
+    path = index_path(catalog.version, source)
+    if path.exists():
+        with path.open("rb") as f:
+            return pickle.load(f)
+
+    documents = list(catalog_documents(catalog)) + list(section_documents(source, functions))
+    index = SearchIndex(documents)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    with tmp.open("wb") as f:
+        pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+    # الاستبدال الذري يمنع العمليات المتزامنة من قراءة ملف غير مكتمل
+    tmp.replace(path)
+    # فهارس الإصدارات السابقة من الكتالوج أو ملف التطبيق لن تُقرأ مجددًا
+    for stale in path.parent.glob(f"search-v{INDEX_FORMAT}-*.pkl"):
+        if stale != path:
+            stale.unlink(missing_ok=True)
+    return index
+
+
+@st.cache_resource(show_spinner=False)
+def load_search_index(app_path: str, sections: tuple) -> SearchIndex:
+    """الفهرس المشترك على مستوى العملية.
+
+    sections: أزواج (اسم دالة القسم، مفتاح القسم، اسم القسم) لاستخراج نصوص الأقسام من ملف التطبيق.
+    """
+    from econ.catalog import load_catalog
+
+    source = Path(app_path).read_text(encoding="utf-8")
+    functions = {name: (section, label) for name, section, label in sections}
+    return build_search_index(load_catalog(), source, functions)
@@ -0,0 +1,520 @@
+# انحدار OLS/WLS تدفقي على ملفات أكبر من الذاكرة: CSV أو Parquet أو مصفوفة NumPy (.npy)
+# المرور الأول يجمع X'X وX'y كتلة بعد كتلة ثم تُحل المعادلات الطبيعية؛ المرور الثاني (للأخطاء المتينة
+# والعنقودية) يعيد قراءة الملف بالمعاملات المقدرة ويجمع "لحم" مصفوفة الساندويتش. الذاكرة ثابتة
+# مهما كبر عدد الصفوف: كتلة واحدة لكل عملية ومصفوفات k × k (ومجاميع k لكل عنقود في الأخطاء العنقودية)
+#
+#     python -m econ.streaming data/datasets/demo.parquet --y y --x x1 --x x2 --cov HC1
+#     python -m econ.streaming wages.csv --y wage --x educ --x exper --cluster firm --workers 4
+#     python -m econ.streaming panel.npy --y 0 --x 1 --x 2          # أعمدة مصفوفة بلا أسماء تُحدد بأرقامها
+#     python -m econ.streaming wages.csv ... --checkpoint .cache/wages   # الاستئناف من حيث توقف التشغيل السابق
+#     python -m econ.streaming --make-demo data/datasets/demo.parquet --rows 10000000 --k 10
+#
+# الملف يُقسم إلى أجزاء مستقلة (نطاقات بايتات في CSV، مجموعات صفوف في Parquet، نطاقات صفوف في npy)
+# تعالجها عمليات متوازية، ثم تُدمج مجاميعها؛ وتُحفظ حالة كل جزء دوريًا عند تمرير --checkpoint
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+
+from econ import ols
+
+ROOT = Path(__file__).resolve().parent.parent
+DATASETS_DIR = Path(os.environ.get("ECON_DATASETS_DIR", ROOT / "data" / "datasets"))
+CACHE_DIR = Path(os.environ.get("ECON_CACHE_DIR", ROOT / ".cache"))
+
+FORMATS = {".csv": "csv", ".parquet": "parquet", ".npy": "npy"}
+
+# حجم الكتلة: صفوف في Parquet وnpy، وبايتات في CSV
+CHUNK_ROWS = 200_000
+CSV_BLOCK_BYTES = 32 * 2**20
+
+# أقل فاصل بين حفظين لحالة الجزء (تُحفظ دائمًا عند اكتماله)
+CHECKPOINT_SECONDS = 5.0
+
+
+def file_format(path) -> str:
+    fmt = FORMATS.get(Path(path).suffix.lower())
+    if fmt is None:
+        raise ValueError(f"صيغة غير مدعومة: {Path(path).name} (المدعوم: {', '.join(FORMATS)})")
+    return fmt
+
+
+@dataclass(frozen=True)
+class Spec:
+    """النموذج المطلوب تقديره: الملف، والمتغير التابع والمستقلة، والأوزان والعناقيد، ونوع الخطأ المعياري."""
+    path: str
+    y: str
+    x: tuple
+    constant: bool = True
+    weights: str | None = None
+    cluster: str | None = None
+    cov_type: str = "HC1"
+
+    @property
+    def names(self) -> list[str]:
+        return ["const"] * self.constant + list(self.x)
+
+    @property
+    def columns(self) -> list[str]:
+        return list(dict.fromkeys([self.y, *self.x, *filter(None, [self.weights, self.cluster])]))
+
+    def fingerprint(self, parts) -> str:
+        """بصمة النموذج والملف (الحجم ووقت التعديل) وتقسيمه: تعريف حالات الاستئناف الصالحة."""
+        stat = Path(self.path).stat()
+        payload = json.dumps([asdict(self), stat.st_size, stat.st_mtime_ns, parts], sort_keys=True, default=str)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+# --- القراءة ---
+
+def columns(path) -> list[str]:
+    """أسماء أعمدة الملف دون قراءة بياناته."""
+    path = Path(path)
+    fmt = file_format(path)
+    if fmt == "csv":
+        import pandas as pd
+
+        return list(pd.read_csv(path, nrows=0).columns)
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+
+        return list(pq.ParquetFile(path).schema_arrow.names)
+    array = np.load(path, mmap_mode="r")
+    return list(array.dtype.names) if array.dtype.names else [str(i) for i in range(array.shape[1])]
+
+
+def partitions(path, parts: int) -> list[tuple[int, int]]:
+    """تقسيم الملف إلى نطاقات [start, end) مستقلة: بايتات في CSV، ومجموعات صفوف في Parquet، وصفوف في npy.
+
+    حدود CSV تُزاح إلى بداية السطر التالي، فيُفترض ألا تحتوي الحقول على أسطر جديدة
+    (وهو حال الملفات الرقمية التي يُقدَّر عليها الانحدار).
+    """
+    path = Path(path)
+    fmt = file_format(path)
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+
+        total = pq.ParquetFile(path).num_row_groups
+        bounds = np.linspace(0, total, min(parts, total) + 1).astype(int)
+    elif fmt == "npy":
+        total = np.load(path, mmap_mode="r").shape[0]
+        bounds = np.linspace(0, total, min(parts, max(total, 1)) + 1).astype(int)
+    else:
+        size = path.stat().st_size
+        with path.open("rb") as f:
+            first = len(f.readline())
+            bounds = [first]
+            for target in np.linspace(first, size, parts + 1)[1:-1].astype(int):
+                f.seek(target)
+                f.readline()
+                bounds.append(min(f.tell(), size))
+            bounds.append(size)
+    bounds = sorted(set(int(b) for b in bounds))
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _chunks(path: Path, start: int, end: int, needed, chunk_rows=CHUNK_ROWS, text=()):
+    """(موضع نهاية الكتلة أو None، الكتلة) داخل النطاق [start, end).
+
+    الموضع None يعني أن الكتلة ليست آخر ما في وحدتها (مجموعة صفوف في Parquet) فلا يُستأنف منها.
+    أعمدة text تُقرأ من CSV نصًا كما هي في الملف، فلا يتغير نوعها بين كتلة وأخرى.
+    """
+    fmt = file_format(path)
+    if fmt == "csv":
+        import pandas as pd
+
+        header = pd.read_csv(path, nrows=0).columns
+        with path.open("rb") as f:
+            f.seek(start)
+            position = start
+            while position < end:
+                data = f.read(min(CSV_BLOCK_BYTES, end - position))
+                if position + len(data) < end:
+                    cut = data.rfind(b"\n") + 1
+                    if cut == 0:
+                        raise ValueError(f"سطر أطول من حجم الكتلة عند البايت {position:,}")
+                    f.seek(position + cut)
+                    data = data[:cut]
+                position += len(data)
+                yield position, pd.read_csv(io.BytesIO(data), header=None, names=header, usecols=needed,
+                                             dtype={name: str for name in text})
+    elif fmt == "parquet":
+        import pyarrow.parquet as pq
+
+        parquet = pq.ParquetFile(path)
+        for group in range(start, end):
+            batches = parquet.iter_batches(batch_size=chunk_rows, row_groups=[group], columns=needed)
+            previous = next(batches, None)
+            for batch in batches:
+                yield None, previous.to_pandas()
+                previous = batch
+            if previous is not None:
+                yield group + 1, previous.to_pandas()
+    else:
+        array = np.load(path, mmap_mode="r")
+        for row in range(start, end, chunk_rows):
+            stop = min(row + chunk_rows, end)
+            block = array[row:stop]
+            if array.dtype.names:
+                yield stop, {name: np.asarray(block[name]) for name in needed}
+            else:
+                yield stop, {name: np.asarray(block[:, int(name)]) for name in needed}
+
+
+def _design(chunk, spec: Spec):
+    """(X، y، الأوزان، العناقيد) لكتلة، بعد حذف الصفوف التي ينقصها أي متغير مستخدم."""
+    numeric = [spec.y, *spec.x, *filter(None, [spec.weights])]
+    values = {name: np.asarray(chunk[name], dtype=np.float64) for name in numeric}
+    keep = np.logical_and.reduce([np.isfinite(v) for v in values.values()])
+    groups = None
+    if spec.cluster:
+        import pandas as pd
+
+        raw = pd.Series(np.asarray(chunk[spec.cluster]))
+        keep &= raw.notna().to_numpy()
+        groups = raw.to_numpy()[keep]
+        # عمود أعداد صحيحة فيه قيمة مفقودة يصل عشريًا في تلك الكتلة وحدها (Parquet)، فتُوحَّد
+        # المعرّفات الصحيحة قبل تحويلها نصًا وإلا صار العنقود 12 عنقودين "12" و"12.0"
+        if groups.dtype.kind == "f" and np.array_equal(groups, np.round(groups)):
+            groups = groups.astype(np.int64)
+        groups = groups.astype(str)
+    n = int(keep.sum())
+    X = np.empty((n, len(spec.names)))
+    offset = int(spec.constant)
+    if spec.constant:
+        X[:, 0] = 1.0
+    for i, name in enumerate(spec.x):
+        X[:, offset + i] = values[name][keep]
+    weights = values[spec.weights][keep] if spec.weights else None
+    if weights is not None and (weights <= 0).any():
+        raise ValueError("الأوزان يجب أن تكون موجبة")
+    return X, values[spec.y][keep], weights, groups
+
+
+# --- المجاميع ---
+
+@dataclass
+class Moments:
+    """إحصاءات المرور الأول: تكفي للمعاملات وللأخطاء المعيارية العادية.
+
+    مع الأوزان تُجمع X'WX وX'Wy وy'Wy؛ ومجموع الأوزان ومجموع wy لحساب التباين الكلي.
+    """
+    k: int
+    n: int = 0
+    sw: float = 0.0
+    swy: float = 0.0
+    yty: float = 0.0
+    xtx: np.ndarray = None
+    xty: np.ndarray = None
+
+    def __post_init__(self):
+        if self.xtx is None:
+            self.xtx = np.zeros((self.k, self.k))
+            self.xty = np.zeros(self.k)
+
+    def update(self, X, y, weights=None):
+        w = np.ones(len(y)) if weights is None else weights
+        self.n += len(y)
+        self.sw += float(w.sum())
+        self.swy += float(w @ y)
+        Xw = X if weights is None else X * w[:, None]
+        self.xtx += Xw.T @ X
+        self.xty += Xw.T @ y
+        self.yty += float((w * y) @ y)
+
+    def merge(self, other: Moments) -> Moments:
+        self.n += other.n
+        self.sw += other.sw
+        self.swy += other.swy
+        self.yty += other.yty
+        self.xtx += other.xtx
+        self.xty += other.xty
+        return self
+
+
+@dataclass
+class Meat:
+    """إحصاءات المرور الثاني بالمعاملات المقدرة: مجموع مربعات البواقي ووسط مصفوفة الساندويتش.
+
+    في الأخطاء العنقودية يُجمع متجه الدرجات X'u لكل عنقود (labels مرتبة ومجاميعها في scores)،
+    فالذاكرة تتناسب مع عدد العناقيد لا مع عدد الصفوف.
+    """
+    k: int
+    cov_type: str
+    n: int = 0
+    ssr: float = 0.0
+    meat: np.ndarray = None
+    labels: np.ndarray = None
+    scores: np.ndarray = None
+
+    def __post_init__(self):
+        if self.meat is None:
+            self.meat = np.zeros((self.k, self.k))
+        if self.labels is None:
+            self.labels = np.empty(0, dtype=str)
+            self.scores = np.zeros((0, self.k))
+
+    def update(self, X, y, weights, groups, params, xtx_inv):
+        if weights is not None:
+            root = np.sqrt(weights)
+            X, y = X * root[:, None], y * root
+        resid = y - X @ params
+        self.n += len(y)
+        self.ssr += float(resid @ resid)
+        if self.cov_type == "cluster":
+            codes, labels = _factorize(groups)
+            order = np.argsort(codes, kind="stable")
+            starts = np.flatnonzero(np.r_[True, np.diff(codes[order]) != 0])
+            self._add_scores(labels, np.add.reduceat((X * resid[:, None])[order], starts, axis=0))
+            return
+        u2 = resid * resid
+        if self.cov_type in ("HC2", "HC3"):
+            leverage = np.einsum("ij,ij->i", X @ xtx_inv, X)
+            u2 = u2 / (1.0 - leverage) ** (1 if self.cov_type == "HC2" else 2)
+        Xu = X * np.sqrt(u2)[:, None]
+        self.meat += Xu.T @ Xu
+
+    def _add_scores(self, labels, scores):
+        if len(self.labels) == 0:
+            self.labels, self.scores = labels, scores
+            return
+        merged, inverse = np.unique(np.concatenate([self.labels, labels]), return_inverse=True)
+        total = np.zeros((len(merged), self.k))
+        np.add.at(total, inverse, np.concatenate([self.scores, scores]))
+        self.labels, self.scores = merged, total
+
+    def merge(self, other: Meat) -> Meat:
+        self.n += other.n
+        self.ssr += other.ssr
+        self.meat += other.meat
+        if len(other.labels):
+            self._add_scores(other.labels, other.scores)
+        return self
+
+
+def _factorize(groups):
+    # معرّفات العناقيد مرتبة (لدمج المجاميع بين الكتل) مع رمز كل صف
+    labels, codes = np.unique(groups, return_inverse=True)
+    return codes, labels
+
+
+def _save_state(path: Path, state, position: int):
+    arrays = {name: value for name, value in vars(state).items() if isinstance(value, np.ndarray)}
+    scalars = {name: value for name, value in vars(state).items() if not isinstance(value, np.ndarray)}
+    tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npz")
+    np.savez(tmp, meta=np.array(json.dumps({"position": position, "state": scalars})), **arrays)
+    tmp.replace(path)
+
+
+def _load_state(path: Path, cls):
+    with np.load(path) as data:
+        meta = json.loads(str(data["meta"]))
+        arrays = {name: data[name] for name in data.files if name != "meta"}
+    return cls(**meta["state"], **arrays), meta["position"]
+
+
+# --- التشغيل ---
+
+def run_part(spec: Spec, stage: str, start: int, end: int, params=None, xtx_inv=None,
+             chunk_rows=CHUNK_ROWS, checkpoint: Path | None = None):
+    """معالجة جزء واحد من الملف في مرحلة "moments" أو "meat"، مع الاستئناف من حالته المحفوظة إن وُجدت.
+
+    تعمل في عملية مستقلة: تفتح الملف بنفسها، فلا تُنقل البيانات بين العمليات بل المجاميع وحدها.
+    """
+    k = len(spec.names)
+    state = Moments(k) if stage == "moments" else Meat(k, spec.cov_type)
+    position = start
+    if checkpoint is not None and checkpoint.exists():
+        state, position = _load_state(checkpoint, type(state))
+
+    saved = time.monotonic()
+    for chunk_end, chunk in _chunks(Path(spec.path), position, end, spec.columns, chunk_rows,
+                                    text=[spec.cluster] if spec.cluster else ()):
+        X, y, weights, groups = _design(chunk, spec)
+        if stage == "moments":
+            state.update(X, y, weights)
+        else:
+            state.update(X, y, weights, groups, params, xtx_inv)
+        if checkpoint is not None and chunk_end is not None and (
+                chunk_end >= end or time.monotonic() - saved > CHECKPOINT_SECONDS):
+            _save_state(checkpoint, state, chunk_end)
+            saved = time.monotonic()
+    return state
+
+
+def _run_stage(spec, stage, parts, workers, chunk_rows, checkpoint_dir, progress, params=None, xtx_inv=None):
+    """تشغيل مرحلة على كل الأجزاء ثم دمج مجاميعها بترتيب الأجزاء (نتيجة حتمية مهما كان عدد العمليات)."""
+    def target(i):
+        return None if checkpoint_dir is None else checkpoint_dir / f"{stage}-{i}.npz"
+
+    results = [None] * len(parts)
+    if workers <= 1:
+        for i, (start, end) in enumerate(parts):
+            results[i] = run_part(spec, stage, start, end, params, xtx_inv, chunk_rows, target(i))
+            if progress:
+                progress(stage, i + 1, len(parts))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(run_part, spec, stage, start, end, params, xtx_inv, chunk_rows, target(i)): i
+                for i, (start, end) in enumerate(parts)
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                results[futures[future]] = future.result()
+                if progress:
+                    progress(stage, done, len(parts))
+
+    total = results[0]
+    for result in results[1:]:
+        total.merge(result)
+    return total
+
+
+def fit(spec: Spec, workers=1, parts=None, chunk_rows=CHUNK_ROWS, checkpoint=None, progress=None) -> ols.OLSResult:
+    """تقدير النموذج على الملف تدفقيًا. الأجزاء افتراضيًا أربعة لكل عملية لتوازن الحمل ولتقدم أدق.
+
+    checkpoint مجلد تُحفظ فيه حالة كل جزء؛ تشغيل لاحق بالنموذج والملف نفسيهما يستأنف منها،
+    وتغيّر الملف أو النموذج يبدأ حالة جديدة. progress(المرحلة، الأجزاء المكتملة، كل الأجزاء) اختيارية.
+    """
+    if spec.cov_type not in ols.COV_TYPES:
+        raise ValueError(f"نوع خطأ معياري غير معروف: {spec.cov_type}")
+    if spec.cov_type == "cluster" and not spec.cluster:
+        raise ValueError("الأخطاء المعيارية العنقودية تحتاج إلى عمود العناقيد")
+    parts = partitions(spec.path, parts or 4 * max(workers, 1))
+    checkpoint_dir = None
+    if checkpoint is not None:
+        checkpoint_dir = Path(checkpoint) / spec.fingerprint(parts)
+        checkpoint_dir.mkdir(parents=True, exist_ok=True)
+
+    moments = _run_stage(spec, "moments", parts, workers, chunk_rows, checkpoint_dir, progress)
+    k = len(spec.names)
+    if moments.n <= k:
+        raise ValueError(f"عدد المشاهدات ({moments.n}) يجب أن يزيد على عدد المعاملات ({k})")
+    xtx_inv = ols.cholesky_inverse(moments.xtx)
+    if xtx_inv is None:
+        raise ValueError(ols.RANK_ERROR)
+    params = xtx_inv @ moments.xty
+    n, df_resid = moments.n, moments.n - k
+
+    if spec.cov_type == "nonrobust":
+        ssr = max(moments.yty - 2 * params @ moments.xty + params @ moments.xtx @ params, 0.0)
+        cov = xtx_inv * (ssr / df_resid)
+    else:
+        meat = _run_stage(spec, "meat", parts, workers, chunk_rows, checkpoint_dir, progress, params, xtx_inv)
+        ssr = meat.ssr
+        if spec.cov_type == "cluster":
+            g = len(meat.labels)
+            if g < 2:
+                raise ValueError("الأخطاء المعيارية العنقودية تحتاج إلى عنقودين على الأقل")
+            middle = meat.scores.T @ meat.scores * (g / (g - 1) * (n - 1) / df_resid)
+        else:
+            middle = meat.meat * (n / df_resid if spec.cov_type == "HC1" else 1.0)
+        cov = xtx_inv @ middle @ xtx_inv
+
+    return ols.OLSResult(
+        names=spec.names, params=params, cov=cov, cov_type=spec.cov_type, nobs=n, df_resid=df_resid,
+        resid=None, fitted=None, ssr=float(ssr), tss=moments.yty - moments.swy ** 2 / moments.sw,
+        estimator="WLS" if spec.weights else "OLS", factor=ols.Factor(xtx_inv, "cholesky"),
+    )
+
+
+def make_demo(path, rows, k=5, clusters=1000, seed=0, chunk_rows=CHUNK_ROWS):
+    """ملف تجريبي بأعمدة y وx1..xk وw وfirm، يُكتب كتلة بعد كتلة (بذاكرة ثابتة)."""
+    path = Path(path)
+    fmt = file_format(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    beta = np.round(np.linspace(1.0, -1.0, k + 1), 2)
+    firm_effect = rng.standard_normal(clusters)
+    names = ["y", *(f"x{i}" for i in range(1, k + 1)), "w", "firm"]
+
+    def blocks():
+        for start in range(0, rows, chunk_rows):
+            m = min(chunk_rows, rows - start)
+            X = rng.standard_normal((m, k))
+            firm = rng.integers(0, clusters, m)
+            sigma = np.exp(0.5 * X[:, 0])
+            y = beta[0] + X @ beta[1:] + firm_effect[firm] + sigma * rng.standard_normal(m)
+            yield np.column_stack([y, X, 1.0 / sigma ** 2, firm])
+
+    if fmt == "npy":
+        array = np.lib.format.open_memmap(path, mode="w+", dtype=np.float64, shape=(rows, len(names)))
+        for start, block in zip(range(0, rows, chunk_rows), blocks()):
+            array[start:start + len(block)] = block
+        array.flush()
+    elif fmt == "parquet":
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        writer = None
+        for block in blocks():
+            table = pa.table({name: block[:, i] for i, name in enumerate(names[:-1])} |
+                             {"firm": block[:, -1].astype(np.int64)})
+            writer = writer or pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+        writer.close()
+    else:
+        import pandas as pd
+
+        with path.open("w", encoding="utf-8") as f:
+            for i, block in enumerate(blocks()):
+                df = pd.DataFrame(block[:, :-1], columns=names[:-1]).assign(firm=block[:, -1].astype(np.int64))
+                df.to_csv(f, header=i == 0, index=False, float_format="%.6g")
+    return beta
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="انحدار تدفقي على ملفات أكبر من الذاكرة")
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--y")
+    parser.add_argument("--x", action="append", default=[])
+    parser.add_argument("--no-constant", action="store_true")
+    parser.add_argument("--weights")
+    parser.add_argument("--cluster")
+    parser.add_argument("--cov", default="HC1", choices=ols.COV_TYPES)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--parts", type=int)
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    parser.add_argument("--checkpoint", type=Path, help="مجلد حالات الاستئناف")
+    parser.add_argument("--make-demo", action="store_true", help="كتابة ملف تجريبي في path")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--k", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    if args.make_demo:
+        beta = make_demo(args.path, args.rows, args.k, chunk_rows=args.chunk_rows)
+        print(f"wrote {args.rows:,} rows to {args.path}; true coefficients {beta.tolist()}")
+        return 0
+    if not args.y or not args.x:
+        parser.error("--y و--x مطلوبان")
+
+    spec = Spec(str(args.path), args.y, tuple(args.x), not args.no_constant, args.weights, args.cluster, args.cov)
+
+    def progress(stage, done, total):
+        print(f"\r{stage}: {done}/{total}", end="", file=sys.stderr, flush=True)
+
+    start = time.perf_counter()
+    result = fit(spec, args.workers, args.parts, args.chunk_rows, args.checkpoint, progress)
+    print(file=sys.stderr)
+    import pandas as pd
+
+    with pd.option_context("display.width", 160, "display.max_columns", 20):
+        print(result.table().to_string(index=False))
+    print(f"n={result.nobs:,}  R²={result.rsquared:.4f}  cov={result.cov_type}  "
+          f"in {time.perf_counter() - start:.1f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
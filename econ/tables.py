@@ -0,0 +1,90 @@
+# جداول الموارد: ترتيب وتقسيم إلى صفحات على الخادم، ثم إرسال الصفحة المعروضة وحدها
+# st.table يحوّل كل صفوف الجدول إلى HTML في كل تشغيل؛ هنا يبقى حجم الرسالة وزمن العرض
+# ثابتين مهما كبر الكتالوج، ويتولى st.dataframe التمرير الافتراضي داخل الصفحة
+
+import numpy as np
+import streamlit as st
+
+from econ import profiler
+from econ.catalog import load_catalog
+from econ.links import load_link_health
+
+PAGE_SIZES = [10, 25, 50, 100]
+DEFAULT_PAGE_SIZE = 25
+
+# عناصر التحكم التي يحتفظ التطبيق بقيمها عند التنقل بين الأقسام (لاحقة مفتاح الجدول)
+PERSISTENT_CONTROLS = ("sort", "desc", "page_size")
+
+# عند تعيينه في session_state تُعرض الجداول كاملة دون تقسيم (التصدير الثابت: python -m econ.export)
+UNPAGED_KEY = "tables_unpaged"
+
+
+def _page_count(total: int, page_size: int) -> int:
+    return max(1, -(-total // page_size))
+
+
+def resource_table(name, rows, columns, key=None):
+    """عرض صفوف من جدول الكتالوج name (بعد التصفية) مرتبة ومقسمة إلى صفحات.
+
+    rows إطار مصفى من catalog[name] يحتفظ بفهرسه الأصلي؛ تُستخدم مواقع صفوفه فقط (بعد استبعاد
+    الموارد ذات الروابط المعطلة)، وتُنسخ أعمدة الصفحة المعروضة وحدها. الجداول التي تتسع لها صفحة واحدة تُعرض كاملة
+    دون عناصر تحكم، والترتيب حينها بالنقر على رؤوس الأعمدة في المتصفح.
+    """
+    key = key or name
+    table = load_catalog()[name]
+    positions = table.index.get_indexer(rows.index)
+
+    # الموارد التي ثبت تعطل روابطها في آخر فحص (python -m econ.links) لا تُعرض
+    dead = load_link_health().dead_rows(name, table)
+    hidden = 0
+    if dead is not None:
+        alive = positions[~dead[positions]]
+        hidden = len(positions) - len(alive)
+        positions = alive
+    total = len(positions)
+
+    if total <= DEFAULT_PAGE_SIZE or st.session_state.get(UNPAGED_KEY):
+        st.dataframe(table.iloc[positions][columns], hide_index=True, use_container_width=True)
+        _hidden_caption(hidden)
+        return
+
+    col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
+    with col1:
+        sort_column = st.selectbox(
+            "ترتيب حسب:",
+            [None] + list(columns),
+            format_func=lambda column: "الترتيب الافتراضي" if column is None else column,
+            key=f"{key}_sort"
+        )
+    with col2:
+        descending = st.toggle("تنازلي", key=f"{key}_desc", disabled=sort_column is None)
+    with col3:
+        # القيمة الافتراضية عبر session_state لا index=، لأن التطبيق يعيد تعيين قيمتها عند التنقل
+        st.session_state.setdefault(f"{key}_page_size", DEFAULT_PAGE_SIZE)
+        page_size = st.selectbox("عدد الصفوف:", PAGE_SIZES, key=f"{key}_page_size")
+
+    # تصغير الجدول بالتصفية أو تكبير حجم الصفحة قد يجعل رقم الصفحة الحالي خارج النطاق
+    pages = _page_count(total, page_size)
+    page_key = f"{key}_page"
+    if st.session_state.get(page_key, 1) > pages:
+        st.session_state[page_key] = pages
+    with col4:
+        page = st.number_input("الصفحة:", min_value=1, max_value=pages, step=1, key=page_key)
+
+    with profiler.section(f"table:{name}"):
+        if sort_column is not None:
+            rank = load_catalog().sort_rank(name, sort_column)
+            positions = positions[np.argsort(rank[positions], kind="stable")]
+            if descending:
+                positions = positions[::-1]
+        start = (page - 1) * page_size
+        page_rows = table.iloc[positions[start:start + page_size]][columns]
+
+    st.dataframe(page_rows, hide_index=True, use_container_width=True)
+    st.caption(f"الصفوف {start + 1:,}–{start + len(page_rows):,} من {total:,}")
+    _hidden_caption(hidden)
+
+
+def _hidden_caption(hidden):
+    if hidden:
+        st.caption(f"أُخفي {hidden:,} من الموارد لأن روابطها لا تعمل.")
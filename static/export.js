@@ -0,0 +1,109 @@
+// سلوك الموقع الثابت (python -m econ.export): المخططات، التبويبات، وتصفية الجداول في المتصفح
+
+(function () {
+    "use strict";
+
+    // رسم المخطط عند اقترابه من مجال العرض فقط: الصفحة تظهر قبل بناء المخططات
+    function drawChart(element) {
+        if (element.dataset.drawn) {
+            return;
+        }
+        element.dataset.drawn = "1";
+        var figure = JSON.parse(document.getElementById(element.dataset.figure).textContent);
+        Plotly.newPlot(element, figure.data, figure.layout, {responsive: true, displaylogo: false});
+    }
+
+    function setupCharts() {
+        var charts = document.querySelectorAll(".chart[data-figure]");
+        if (!("IntersectionObserver" in window)) {
+            charts.forEach(drawChart);
+            return;
+        }
+        var observer = new IntersectionObserver(function (entries) {
+            entries.forEach(function (entry) {
+                if (entry.isIntersecting) {
+                    observer.unobserve(entry.target);
+                    drawChart(entry.target);
+                }
+            });
+        }, {rootMargin: "200px"});
+        charts.forEach(function (chart) {
+            observer.observe(chart);
+        });
+    }
+
+    function setupTabs() {
+        document.querySelectorAll(".tabs").forEach(function (tabs) {
+            var buttons = Array.from(tabs.querySelector(".tab-list").children);
+            var panels = Array.from(tabs.children).filter(function (child) {
+                return child.classList.contains("tab-panel");
+            });
+            buttons.forEach(function (button, index) {
+                button.addEventListener("click", function () {
+                    buttons.forEach(function (other, i) {
+                        other.setAttribute("aria-selected", i === index ? "true" : "false");
+                        panels[i].hidden = i !== index;
+                    });
+                    // المخططات التي رُسمت داخل لوحة مخفية تحتاج إلى إعادة حساب عرضها
+                    panels[index].querySelectorAll(".chart[data-drawn]").forEach(function (chart) {
+                        Plotly.Plots.resize(chart);
+                    });
+                });
+            });
+        });
+    }
+
+    function normalize(text) {
+        return text.toLowerCase().replace(/[أإآ]/g, "ا").replace(/ة/g, "ه").replace(/ى/g, "ي");
+    }
+
+    // نفس فواصل split_categories في econ/catalog.py
+    var TAG_SEPARATORS = /[،,]/;
+
+    // مطابقة كاملة: وسم من قائمة وسوم الخلية، أو قيمة الخلية كلها؛ "متوسط" لا يطابق "مبتدئ إلى متوسط"
+    function cellMatches(cell, select) {
+        var text = cell.textContent.trim();
+        if (!select.dataset.tags) {
+            return text === select.value;
+        }
+        return text.split(TAG_SEPARATORS).some(function (tag) {
+            return tag.trim() === select.value;
+        });
+    }
+
+    function setupFilters() {
+        document.querySelectorAll(".table-filter").forEach(function (bar) {
+            var rows = Array.from(document.getElementById(bar.dataset.table).tBodies[0].rows);
+            var search = bar.querySelector("input");
+            var selects = Array.from(bar.querySelectorAll("select"));
+            var texts = rows.map(function (row) {
+                return normalize(row.textContent);
+            });
+
+            function apply() {
+                var query = normalize(search.value.trim());
+                rows.forEach(function (row, i) {
+                    var visible = !query || texts[i].indexOf(query) !== -1;
+                    selects.forEach(function (select) {
+                        if (visible && select.value) {
+                            var cell = row.cells[Number(select.dataset.column)];
+                            visible = cellMatches(cell, select);
+                        }
+                    });
+                    row.hidden = !visible;
+                });
+            }
+
+            search.addEventListener("input", apply);
+            selects.forEach(function (select) {
+                select.addEventListener("change", apply);
+            });
+        });
+    }
+
+    document.addEventListener("DOMContentLoaded", function () {
+        setupCharts();
+        setupTabs();
+        setupFilters();
+    });
+})();
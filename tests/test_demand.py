@@ -0,0 +1,112 @@
+# مؤشر الطلب على المهارات: تقسيم الملف إلى كتل على حدود السجلات (مع أسطر جديدة داخل حقول CSV
+# المقتبسة) واستئناف المعالجة من العلامة المائية
+#
+#     python -m pytest tests/test_demand.py
+
+import io
+import json
+
+import pandas as pd
+import pytest
+
+from econ import demand
+
+HEADER = "date,title,description\n"
+
+ROWS = [
+    '2023-01-05,Data Analyst,"SQL and Excel\nreporting, ""weekly"" dashboards"\n',
+    '2023-01-20,Economist,"Panel data,\n\ntime series\nand Stata"\n',
+    '2023-02-02,"Data Scientist,\nML",machine learning\n',
+    'not a date,Data Analyst,sql\n',
+    '2024-03-11,Clerk,"filing\nand typing"\n',
+]
+
+# بصمة بداية الملف تغطي أول HEAD_BYTES، فملف الاستئناف يجب أن يتجاوزها كي لا يُعدّ مستبدلًا
+FILLER = ["2022-12-01,Clerk,filing\n"] * (demand.HEAD_BYTES // 20)
+
+MORE = [
+    '2024-03-15,"Econometrician\n",eviews\n',
+    '2025-07-01,Analyst,"tableau\n"\n',
+]
+
+
+def _write(path, rows, header=HEADER):
+    path.write_bytes((header + "".join(rows)).encode("utf-8"))
+    return path
+
+
+def _months(path):
+    """الأعداد المتوقعة بقراءة الملف كاملًا دفعة واحدة."""
+    return demand.count_block(path.read_bytes(), b"", "csv", demand.DATE_COLUMN, demand.TEXT_COLUMNS)[0]
+
+
+@pytest.mark.parametrize("block_size", [7, 16, 64, 4096])
+def test_blocks_end_on_records(tmp_path, block_size):
+    path = _write(tmp_path / "postings.csv", ROWS)
+    header, start = demand._header(path, "csv")
+    blocks = list(demand.read_blocks(path, start, "csv", block_size))
+
+    assert b"".join(block for block, _ in blocks) == path.read_bytes()[start:]
+    assert blocks[-1][1] == path.stat().st_size
+    parsed = 0
+    for block, _ in blocks:
+        # كل كتلة تُحلل وحدها بسطر العناوين إلى سجلات كاملة بثلاثة حقول
+        df = pd.read_csv(io.BytesIO(header + block), dtype=str, keep_default_na=False)
+        assert list(df.columns) == ["date", "title", "description"]
+        parsed += len(df)
+    assert parsed == len(ROWS)
+
+
+def test_incomplete_last_record_waits(tmp_path):
+    path = _write(tmp_path / "postings.csv", ROWS + ['2025-01-01,Data Analyst,"still being\nwritten'])
+    _, start = demand._header(path, "csv")
+    *_, (_, end) = demand.read_blocks(path, start, "csv", 16)
+    assert end == len((HEADER + "".join(ROWS)).encode("utf-8"))
+
+
+def test_counts_match_whole_file(tmp_path):
+    path = _write(tmp_path / "postings.csv", ROWS)
+    output = tmp_path / "demand_index.json"
+    stats = demand.update([path], output, workers=1, block_size=16)
+
+    assert (stats["postings"], stats["skipped"]) == (4, 1)
+    assert stats["blocks"] > 1
+    source, = json.loads(output.read_text(encoding="utf-8"))["sources"].values()
+    assert source["months"] == _months(path)
+    # المحلل، الاقتصادي، عالم البيانات: إعلان واحد لكل مجال في شهره
+    assert source["months"]["2023-01"] == [2, 1, 1, 0]
+    assert source["months"]["2023-02"] == [1, 0, 0, 1]
+    assert source["months"]["2024-03"] == [1, 0, 0, 0]
+
+
+def test_resume_from_watermark(tmp_path):
+    path = _write(tmp_path / "postings.csv", FILLER + ROWS)
+    output = tmp_path / "demand_index.json"
+    demand.update([path], output, workers=1, block_size=256)
+    first_offset = next(iter(demand.load_aggregates(output)["sources"].values()))["offset"]
+
+    _write(path, FILLER + ROWS + MORE)
+    stats = demand.update([path], output, workers=1, block_size=256)
+    # الإعلانات المضافة وحدها تُعالج
+    assert stats["postings"] == len(MORE)
+    assert stats["bytes"] == path.stat().st_size - first_offset
+
+    resumed = demand.load_aggregates(output)["sources"]
+    rebuilt_path = tmp_path / "rebuilt.json"
+    demand.update([path], rebuilt_path, workers=1, rebuild=True)
+    assert resumed == demand.load_aggregates(rebuilt_path)["sources"]
+
+    # لا جديد: لا كتل
+    assert demand.update([path], output, workers=1)["blocks"] == 0
+
+
+def test_rewritten_file_is_recounted(tmp_path):
+    path = _write(tmp_path / "postings.csv", ROWS)
+    output = tmp_path / "demand_index.json"
+    demand.update([path], output, workers=1)
+
+    _write(path, MORE)
+    stats = demand.update([path], output, workers=1)
+    assert stats["postings"] == len(MORE)
+    source, = demand.load_aggregates(output)["sources"].values()
+    assert source["months"] == _months(path)
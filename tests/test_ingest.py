@@ -0,0 +1,93 @@
+# الاستيراد بالجملة على نسخة من الكتالوج: إزالة المكررات، الصفوف المرفوضة، وتحديث manifest.json
+#
+#     python -m pytest tests/test_ingest.py
+
+import json
+import shutil
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from econ import ingest
+from econ.catalog import CATALOG_DIR, read_catalog
+
+COLUMNS = ["المدونة", "الكاتب", "الوصف", "الرابط", "التصنيف", "عمود_إضافي"]
+
+ROWS = [
+    # جديد، بتصنيف يحتاج إلى التطبيع
+    ["Applied Metrics", "A. Author", "وصف", "https://applied.example.org/", "اقتصاد قياسي ،، تطبيقـي، اقتصاد قياسي", "x"],
+    # مكرر لمدونة موجودة بالرابط (بروتوكول وwww و/ أخيرة وحالة أحرف مختلفة)
+    ["Other title", "", "", "http://www.MachineLearningMastery.com/", "", ""],
+    # مكرر داخل الملف نفسه (في دفعة لاحقة) بالرابط بعد حذف الجزء #
+    ["Applied Metrics again", "", "", "https://applied.example.org#top", "", ""],
+    # بلا رابط: المفتاح العنوان والكاتب بعد توحيد المسافات وحالة الأحرف
+    ["Causal  Notes", "B. Writer", "", "", "سببية", ""],
+    ["causal notes", "b. writer", "", "", "", ""],
+    # مرفوضان
+    ["", "No Title", "", "https://notitle.example.org", "", ""],
+    ["Bad Link", "", "", "ftp://bad.example.org", "", ""],
+]
+
+
+@pytest.fixture
+def catalog_dir(tmp_path):
+    return Path(shutil.copytree(CATALOG_DIR, tmp_path / "catalog"))
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "blogs.csv"
+    pd.DataFrame(ROWS, columns=COLUMNS).to_csv(path, index=False)
+    return path
+
+
+def test_dedup_rejects_and_manifest(catalog_dir, source, tmp_path):
+    existing = len(read_catalog(catalog_dir).tables["blogs"])
+    before = json.loads((catalog_dir / "manifest.json").read_text(encoding="utf-8"))
+    rejects = tmp_path / "rejected.csv"
+
+    report = ingest.ingest("blogs", source, catalog_dir, chunk_size=2, rejects=rejects)
+
+    assert (report.existing, report.read, report.written, report.duplicates) == (existing, 7, 2, 3)
+    assert report.rejected == {"missing:المدونة": 1, "invalid:الرابط": 1}
+    assert report.ignored_columns == ["عمود_إضافي"]
+    rejected = pd.read_csv(rejects, dtype=str, keep_default_na=False)
+    assert rejected["سبب_الرفض"].tolist() == ["missing:المدونة", "invalid:الرابط"]
+
+    manifest = json.loads((catalog_dir / "manifest.json").read_text(encoding="utf-8"))
+    assert manifest["files"] == {"blogs": "blogs.arrow"}
+    assert manifest["version"] != before["version"]
+    assert manifest["version"] == report.version
+
+    blogs = read_catalog(catalog_dir).tables["blogs"]
+    assert len(blogs) == existing + 2
+    added = blogs.iloc[existing:]
+    assert added["المدونة"].tolist() == ["Applied Metrics", "Causal  Notes"]
+    assert added["التصنيف"].tolist() == ["اقتصاد قياسي، تطبيقي", "سببية"]
+
+
+def test_reingest_adds_nothing(catalog_dir, source):
+    first = ingest.ingest("blogs", source, catalog_dir)
+    again = ingest.ingest("blogs", source, catalog_dir)
+    assert again.existing == first.existing + first.written
+    assert again.written == 0
+    assert again.duplicates == 5
+
+
+def test_replace(catalog_dir, source):
+    report = ingest.ingest("blogs", source, catalog_dir, replace=True)
+    assert (report.existing, report.written) == (0, 3)
+    assert len(read_catalog(catalog_dir).tables["blogs"]) == 3
+
+
+def test_missing_required_column(catalog_dir, tmp_path):
+    path = tmp_path / "books.csv"
+    pd.DataFrame({"العنوان": ["T"]}).to_csv(path, index=False)
+    manifest = (catalog_dir / "manifest.json").read_text(encoding="utf-8")
+    with pytest.raises(ValueError, match="المؤلف"):
+        ingest.ingest("books", path, catalog_dir)
+    assert (catalog_dir / "manifest.json").read_text(encoding="utf-8") == manifest
+    assert not (catalog_dir / "books.arrow").exists()
@@ -0,0 +1,69 @@
+# فاحص الروابط على خادم HTTP محلي وهمي (links.stub_servers) دون شبكة
+#
+#     python -m pytest tests/test_links.py
+
+import asyncio
+
+import pytest
+
+from econ import links
+
+KINDS = ("ok", "gone", "moved", "flaky", "nohead", "etag")
+
+
+@pytest.fixture(scope="module")
+def sweeps(tmp_path_factory):
+    """مسحان متتاليان لمسار واحد من كل نوع: (الروابط، نتائج كل مسح، صفوف المخزن بعد كل مسح، الطلبات)."""
+    path = tmp_path_factory.mktemp("links") / "links.sqlite"
+
+    async def run():
+        async with links.stub_servers() as (ports, requests):
+            urls = {kind: f"http://127.0.0.1:{ports[0]}/{kind}/1" for kind in KINDS}
+            db = links.open_store(path)
+            outcomes, rows = [], []
+            for _ in range(2):
+                outcomes.append(await links.sweep(list(urls.values()), db, timeout=5, max_age_hours=None))
+                rows.append({url: tuple(row) for url, *row in db.execute(
+                    "SELECT url, status, dead, final_url, etag FROM links")})
+            db.close()
+            return urls, outcomes, rows, dict(requests)
+
+    return asyncio.run(run())
+
+
+def test_missing_page_is_dead(sweeps):
+    urls, _, rows, _ = sweeps
+    status, dead, _, _ = rows[0][urls["gone"]]
+    assert (status, dead) == (404, 1)
+    assert rows[0][urls["ok"]][:2] == (200, 0)
+
+
+def test_redirect_is_followed(sweeps):
+    urls, outcomes, rows, _ = sweeps
+    status, dead, final_url, _ = rows[0][urls["moved"]]
+    assert (status, dead) == (200, 0)
+    assert final_url.endswith("/ok/1")
+    assert outcomes[0]["redirected"] == 1
+
+
+def test_unavailable_is_retried(sweeps):
+    urls, _, rows, requests = sweeps
+    assert rows[0][urls["flaky"]][:2] == (200, 0)
+    # 503 في أول طلب ثم 200 في إعادة المحاولة، ثم طلب واحد في المسح الثاني
+    assert requests["/flaky/1"] == 3
+
+
+def test_rejected_head_falls_back_to_get(sweeps):
+    urls, _, rows, requests = sweeps
+    assert rows[0][urls["nohead"]][:2] == (200, 0)
+    # HEAD (405) ثم GET في كل مسح
+    assert requests["/nohead/1"] == 4
+
+
+def test_etag_revalidation_keeps_status(sweeps):
+    urls, outcomes, rows, _ = sweeps
+    assert outcomes[0]["not_modified"] == 0
+    assert outcomes[1]["not_modified"] == 1
+    status, dead, _, etag = rows[1][urls["etag"]]
+    assert (status, dead) == (200, 0)
+    assert etag == '"/etag/1"'
@@ -0,0 +1,87 @@
+# المقدرات المجمّعة لمحاكاة مونت كارلو مقابل تقدير كل تكرار منفردًا، وحتمية البذور
+#
+#     python -m pytest tests/test_montecarlo.py
+
+import numpy as np
+import pytest
+
+from econ import montecarlo
+
+DGP = montecarlo.DGP(rho=0.5, pi=0.5, gamma=0.5, periods=5)
+
+
+@pytest.fixture(scope="module")
+def batch():
+    x, y, z = montecarlo.draw(DGP, 7, 60, np.random.default_rng(23))
+    return x, y, z, montecarlo.estimate_batch(DGP, x, y, z, tuple(montecarlo.ESTIMATORS))
+
+
+def _ols(X, y, df_extra=0):
+    n, k = X.shape
+    params = np.linalg.lstsq(X, y, rcond=None)[0]
+    resid = y - X @ params
+    cov = resid @ resid / (n - k - df_extra) * np.linalg.inv(X.T @ X)
+    return params, np.sqrt(np.diag(cov))
+
+
+def test_ols_per_replication(batch):
+    x, y, _, out = batch
+    for r in range(len(x)):
+        params, se = _ols(np.column_stack([np.ones_like(x[r]), x[r]]), y[r])
+        np.testing.assert_allclose([out["OLS"][0][r], out["OLS"][1][r]], [params[1], se[1]], rtol=1e-9)
+
+
+def test_iv_per_replication(batch):
+    x, y, z, out = batch
+    for r in range(len(x)):
+        X = np.column_stack([np.ones_like(x[r]), x[r]])
+        Z = np.column_stack([np.ones_like(z[r]), z[r]])
+        # أداة واحدة لمتغير داخلي واحد: β = (Z'X)⁻¹Z'y
+        params = np.linalg.solve(Z.T @ X, Z.T @ y[r])
+        resid = y[r] - X @ params
+        X_hat = Z @ np.linalg.lstsq(Z, X, rcond=None)[0]
+        se = np.sqrt(resid @ resid / (len(y[r]) - 2) * np.diag(np.linalg.inv(X_hat.T @ X_hat)))
+        np.testing.assert_allclose([out["IV"][0][r], out["IV"][1][r]], [params[1], se[1]], rtol=1e-9)
+
+
+def test_fixed_effects_per_replication(batch):
+    x, y, _, out = batch
+    entities = x.shape[1] // DGP.periods
+    dummies = np.repeat(np.eye(entities), DGP.periods, axis=0)
+    for r in range(len(x)):
+        params, se = _ols(np.column_stack([x[r], dummies]), y[r])
+        np.testing.assert_allclose([out["FE"][0][r], out["FE"][1][r]], [params[0], se[0]], rtol=1e-9)
+
+
+def test_sizes_are_independent_and_deterministic():
+    alone = montecarlo.simulate(DGP, [100], replications=50, seed=1)
+    together = montecarlo.simulate(DGP, [50, 100], replications=50, seed=1)
+    again = montecarlo.simulate(DGP, [100], replications=50, seed=1)
+    for name in montecarlo.ESTIMATORS:
+        np.testing.assert_array_equal(together[(name, 100)][0], alone[(name, 100)][0])
+        np.testing.assert_array_equal(again[(name, 100)][0], alone[(name, 100)][0])
+    # حجم غير مضاعف لعدد الفترات يُقرَّب إليه
+    assert ("OLS", 100) in montecarlo.simulate(DGP, [103], replications=5, seed=1)
+
+
+def test_batches_cover_all_replications():
+    # حد ذاكرة صغير يقسم التكرارات على دفعات كثيرة
+    budget = 100 * 8 * montecarlo._LIVE_ARRAYS * 7
+    assert montecarlo.batch_size(100, 50, budget) == 7
+    results = montecarlo.simulate(DGP, [100], replications=50, seed=2, budget=budget)
+    estimates, errors = results[("OLS", 100)]
+    assert estimates.shape == errors.shape == (50,)
+    assert len(np.unique(estimates)) == 50
+
+
+def test_summary_properties():
+    dgp = montecarlo.DGP(rho=0.5, pi=1.0, gamma=0.0, periods=5)
+    summaries = {s.estimator: s for s in montecarlo.summarize(
+        dgp, montecarlo.simulate(dgp, [2000], replications=400, seed=3))}
+    # x داخلية: OLS متحيز وتغطيته منهارة، وIV بأداة قوية قريب من β وتغطيته قرب الاسمية
+    assert summaries["OLS"].bias > 0.1
+    assert summaries["OLS"].coverage < 0.5
+    assert abs(summaries["IV"].bias) < 0.02
+    assert 0.9 < summaries["IV"].coverage < 0.99
+    s = summaries["IV"]
+    np.testing.assert_allclose(s.rmse ** 2, s.bias ** 2 + s.sd ** 2 * (400 - 1) / 400, rtol=1e-9)
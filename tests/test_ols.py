@@ -0,0 +1,89 @@
+# مقارنة OLS بصيغ الساندويتش الصريحة على بيانات محاكاة ببذرة ثابتة
+#
+#     python -m pytest tests/test_ols.py
+
+import numpy as np
+import pytest
+
+from econ import ols
+
+
+@pytest.fixture(scope="module")
+def regression():
+    rng = np.random.default_rng(20)
+    n = 400
+    X = np.column_stack([np.ones(n), rng.standard_normal((n, 3))])
+    firm = rng.integers(0, 30, n)
+    y = X @ [1.0, 0.5, -1.0, 2.0] + rng.standard_normal(30)[firm] + np.exp(0.5 * X[:, 1]) * rng.standard_normal(n)
+    return X, y, firm
+
+
+@pytest.mark.parametrize("cov_type", ["nonrobust", "HC0", "HC1", "HC2", "HC3"])
+def test_ols_sandwich(regression, cov_type):
+    X, y, _ = regression
+    n, k = X.shape
+    bread = np.linalg.inv(X.T @ X)
+    beta = bread @ X.T @ y
+    u = y - X @ beta
+    h = np.diag(X @ bread @ X.T)
+    weights = {
+        "HC0": u ** 2,
+        "HC1": u ** 2 * n / (n - k),
+        "HC2": u ** 2 / (1 - h),
+        "HC3": u ** 2 / (1 - h) ** 2,
+    }
+    if cov_type == "nonrobust":
+        expected = bread * (u @ u / (n - k))
+    else:
+        expected = bread @ (X.T @ np.diag(weights[cov_type]) @ X) @ bread
+
+    result = ols.fit(X, y, cov_type=cov_type)
+    np.testing.assert_allclose(result.params, beta, rtol=1e-10)
+    np.testing.assert_allclose(result.cov, expected, rtol=1e-9)
+
+
+def test_ols_cluster(regression):
+    X, y, firm = regression
+    n, k = X.shape
+    bread = np.linalg.inv(X.T @ X)
+    u = y - X @ (bread @ X.T @ y)
+    labels = np.unique(firm)
+    meat = sum(np.outer(X[firm == g].T @ u[firm == g], X[firm == g].T @ u[firm == g]) for g in labels)
+    g = len(labels)
+    expected = bread @ meat @ bread * (g / (g - 1) * (n - 1) / (n - k))
+
+    result = ols.fit(X, y, cov_type="cluster", groups=firm)
+    np.testing.assert_allclose(result.cov, expected, rtol=1e-9)
+
+
+def _breusch_pagan(X, resid):
+    """n·R² لانحدار û² على [1، X] بالمربعات الصغرى مباشرة."""
+    Z = np.column_stack([np.ones(len(X)), X])
+    u2 = resid ** 2
+    fitted = Z @ np.linalg.lstsq(Z, u2, rcond=None)[0]
+    return len(X) * (1 - ((u2 - fitted) @ (u2 - fitted)) / ((u2 - u2.mean()) @ (u2 - u2.mean())))
+
+
+@pytest.mark.parametrize("estimator", ["OLS", "WLS", "FGLS"])
+def test_breusch_pagan(regression, estimator):
+    X, y, _ = regression
+    if estimator == "OLS":
+        result = ols.fit(X, y)
+    elif estimator == "WLS":
+        result = ols.fit(X, y, weights=np.exp(-X[:, 1]))
+    else:
+        result = ols.fgls(X, y)
+    resid = result.resid if result.weights is None else result.resid * np.sqrt(result.weights)
+
+    stat, pvalue = ols.diagnostics(result, X)["بروش-باغان (عدم تجانس التباين)"]
+    np.testing.assert_allclose(stat, _breusch_pagan(X[:, 1:], resid), rtol=1e-9)
+    assert 0 <= stat <= len(y)
+    np.testing.assert_allclose(pvalue, ols.chi2_pvalue(stat, X.shape[1] - 1))
+
+
+def test_breusch_pagan_without_constant(regression):
+    X, y, _ = regression
+    result = ols.fit(X[:, 1:], y)
+    stat, pvalue = ols.diagnostics(result, X[:, 1:])["بروش-باغان (عدم تجانس التباين)"]
+    np.testing.assert_allclose(stat, _breusch_pagan(X[:, 1:], result.resid), rtol=1e-9)
+    np.testing.assert_allclose(pvalue, ols.chi2_pvalue(stat, X.shape[1] - 1))
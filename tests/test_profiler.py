@@ -0,0 +1,48 @@
+# سجل القياس: التدوير عند بلوغ الحد، وتلخيص السجلين، وتفعيل ?profile=1 بإذن الخادم فقط
+#
+#     python -m pytest tests/test_profiler.py
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from econ import profiler
+
+
+def _record(total_ms):
+    return {"total_ms": total_ms, "timings": {"section:overview": total_ms / 2}}
+
+
+def test_log_rotates_at_cap(tmp_path):
+    path = tmp_path / "profile.jsonl"
+    line = len(json.dumps(_record(1.0)) + "\n")
+    for i in range(7):
+        profiler._append(_record(float(i)), path, max_bytes=3 * line)
+
+    # كل ملف لا يتجاوز الحد، ولا يبقى إلا سجل واحد منقول
+    assert path.stat().st_size <= 3 * line
+    assert profiler._rotated(path).stat().st_size <= 3 * line
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["profile.jsonl", "profile.jsonl.1"]
+    assert [json.loads(l)["total_ms"] for l in path.read_text().splitlines()] == [6.0]
+    assert [json.loads(l)["total_ms"] for l in profiler._rotated(path).read_text().splitlines()] == [3.0, 4.0, 5.0]
+
+    summary = profiler.summarize(path)
+    assert summary["total"]["runs"] == 4
+    assert summary["total"]["p50"] == 4.5
+
+
+@pytest.mark.parametrize("env, allow, expected", [
+    ({}, None, False),
+    ({}, "1", True),
+    ({"ECON_PROFILE": "1"}, None, True),
+])
+def test_query_param_needs_server_opt_in(monkeypatch, env, allow, expected):
+    monkeypatch.delenv("ECON_PROFILE", raising=False)
+    monkeypatch.delenv("ECON_PROFILE_QUERY", raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    if allow:
+        monkeypatch.setenv("ECON_PROFILE_QUERY", allow)
+    monkeypatch.setattr(profiler, "st", SimpleNamespace(query_params={"profile": "1"}))
+    assert profiler.enabled() is expected
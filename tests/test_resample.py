@@ -0,0 +1,92 @@
+# إعادة المعاينة المجمّعة مقابل مرجع تسلسلي بالبذور نفسها: كل تكرار يُعاد بناؤه صراحة
+# (الصفوف أو العناقيد المسحوبة، أو y* في Wild والتبديل) ويُقدَّر بـ lstsq
+#
+#     python -m pytest tests/test_resample.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from econ import resample
+
+# أكثر من دفعة واحدة (MAX_BATCH = 256)
+REPLICATIONS = 300
+
+
+@pytest.fixture(scope="module")
+def data():
+    rng = np.random.default_rng(22)
+    n = 120
+    X = np.column_stack([np.ones(n), rng.standard_normal((n, 2))])
+    groups = rng.integers(0, 15, n)
+    y = X @ [1.0, 0.5, -0.5] + rng.standard_normal(15)[groups] + np.exp(0.5 * X[:, 1]) * rng.standard_normal(n)
+    return X, y, groups
+
+
+def _lstsq(X, y):
+    return np.linalg.lstsq(X, y, rcond=None)[0]
+
+
+def _reference(X, y, groups, method, replications, seed=0):
+    """تكرارات run() واحدًا واحدًا بالبذور ومصفوفات السحب نفسها."""
+    n, k = X.shape
+    params = _lstsq(X, y)
+    resid = y - X @ params
+    labels = pd.unique(groups)
+    units = len(labels) if method == "cluster" else n
+    sizes = resample._batch_sizes(method, replications, units, k)
+    draws = []
+    for size, batch_seed in zip(sizes, np.random.SeedSequence(seed).spawn(len(sizes))):
+        rng = np.random.default_rng(batch_seed)
+        if method == "pairs":
+            for rows in rng.integers(0, n, (size, n)):
+                draws.append(_lstsq(X[rows], y[rows]))
+        elif method == "cluster":
+            for picked in rng.integers(0, units, (size, units)):
+                rows = np.concatenate([np.flatnonzero(groups == labels[g]) for g in picked])
+                draws.append(_lstsq(X[rows], y[rows]))
+        elif method == "wild":
+            signs = rng.integers(0, 2, (size, n), dtype=np.int8) * 2.0 - 1.0
+            for v in signs:
+                draws.append(_lstsq(X, X @ params + resid * v))
+        else:
+            # Freedman–Lane: بواقي النموذج المقيد (دون x_j) تُبدَّل وتُضاف إلى قيمه المقدرة
+            order = rng.permuted(np.broadcast_to(np.arange(n), (size, n)), axis=1)
+            batch = np.zeros((size, k))
+            for j in range(1, k):
+                others = np.delete(X, j, axis=1)
+                fitted = others @ _lstsq(others, y)
+                for i, perm in enumerate(order):
+                    batch[i, j] = _lstsq(X, fitted + (y - fitted)[perm])[j]
+            draws.extend(batch)
+    return params, np.array(draws)
+
+
+@pytest.mark.parametrize("method", list(resample.METHODS))
+def test_matches_serial_reference(data, method):
+    X, y, groups = data
+    params, expected = _reference(X, y, groups, method, REPLICATIONS)
+
+    snapshots = list(resample.run(X, y, method, groups, REPLICATIONS, workers=1))
+    assert [s.done for s in snapshots] == [256, REPLICATIONS]
+    final = snapshots[-1]
+    np.testing.assert_allclose(final.observed, params, rtol=1e-10)
+    np.testing.assert_allclose(final.draws, expected, rtol=1e-8, atol=1e-10)
+    if method != "permutation":
+        np.testing.assert_allclose(resample.percentile_ci(final.draws),
+                                   np.quantile(expected, [0.025, 0.975], axis=0).T, rtol=1e-8)
+
+
+def test_workers_do_not_change_draws(data):
+    X, y, groups = data
+    serial = list(resample.run(X, y, "cluster", groups, REPLICATIONS, workers=1))[-1]
+    parallel = list(resample.run(X, y, "cluster", groups, REPLICATIONS, workers=2))[-1]
+    np.testing.assert_array_equal(parallel.draws, serial.draws)
+
+
+def test_permutation_pvalues():
+    draws = np.array([[0.0, 1.0], [0.0, -3.0], [0.0, 0.5]])
+    pvalues = resample.permutation_pvalues(draws, np.array([2.0, 2.0]))
+    # عمود الثابت (تبديلات صفرية) بلا قيمة p؛ تبديل واحد من ثلاثة يبلغ |2|
+    assert np.isnan(pvalues[0])
+    assert pvalues[1] == (1 + 1) / (1 + 3)
@@ -0,0 +1,97 @@
+# الانحدار التدفقي مقابل التقدير في الذاكرة على الملف نفسه، والاستئناف من نقاط الحفظ
+#
+#     python -m pytest tests/test_streaming.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from econ import ols, streaming
+
+
+SPECS = {
+    "csv": dict(y="y", x=("x1", "x2", "x3"), cluster="firm"),
+    # أعمدة npy بأرقامها: y ثم x1..x3 ثم w ثم firm
+    "npy": dict(y="0", x=("1", "2", "3"), cluster="5"),
+}
+
+
+def _in_memory(path, spec: streaming.Spec):
+    if path.suffix == ".csv":
+        data = pd.read_csv(path)
+    else:
+        data = pd.DataFrame(np.load(path), columns=[str(i) for i in range(6)])
+    X = np.column_stack([np.ones(len(data)), data[list(spec.x)].to_numpy()])
+    weights = data[spec.weights].to_numpy() if spec.weights else None
+    return ols.fit(X, data[spec.y].to_numpy(), weights=weights, cov_type=spec.cov_type,
+                   groups=data[spec.cluster].to_numpy())
+
+
+@pytest.mark.parametrize("fmt", SPECS)
+@pytest.mark.parametrize("cov_type,weighted", [("nonrobust", False), ("HC1", False), ("HC3", True),
+                                               ("cluster", False)])
+def test_streaming_matches_in_memory(tmp_path, fmt, cov_type, weighted):
+    path = tmp_path / f"demo.{fmt}"
+    streaming.make_demo(path, 5000, k=3, clusters=40, seed=1, chunk_rows=700)
+    spec = streaming.Spec(str(path), cov_type=cov_type, weights=("w" if fmt == "csv" else "4") if weighted else None,
+                          **SPECS[fmt])
+
+    expected = _in_memory(path, spec)
+    result = streaming.fit(spec, parts=3, chunk_rows=600)
+    np.testing.assert_allclose(result.params, expected.params, rtol=1e-9)
+    np.testing.assert_allclose(result.cov, expected.cov, rtol=1e-7)
+    assert result.nobs == expected.nobs
+
+
+def test_streaming_resumes_from_checkpoint(tmp_path, monkeypatch):
+    path = tmp_path / "demo.npy"
+    streaming.make_demo(path, 6000, k=3, clusters=40, seed=2, chunk_rows=1000)
+    spec = streaming.Spec(str(path), cov_type="cluster", **SPECS["npy"])
+    expected = streaming.fit(spec, parts=2, chunk_rows=500)
+
+    # جزءان من 6 كتل لكل منهما: 12 كتلة في مرحلة "moments" ثم انقطاع عند الكتلة الثالثة من الجزء
+    # الثاني في مرحلة "meat"، مع حفظ الحالة بعد كل كتلة
+    monkeypatch.setattr(streaming, "CHECKPOINT_SECONDS", -1.0)
+    design, calls = streaming._design, []
+
+    def interrupted(chunk, spec):
+        calls.append(1)
+        if len(calls) == 12 + 6 + 3:
+            raise KeyboardInterrupt
+        return design(chunk, spec)
+
+    monkeypatch.setattr(streaming, "_design", interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        streaming.fit(spec, parts=2, chunk_rows=500, checkpoint=tmp_path / "state")
+
+    resumed_calls = []
+    monkeypatch.setattr(streaming, "_design", lambda chunk, spec: resumed_calls.append(1) or design(chunk, spec))
+    result = streaming.fit(spec, parts=2, chunk_rows=500, checkpoint=tmp_path / "state")
+    # الاستئناف لا يعيد إلا الكتل الأربع التي لم تكتمل من الجزء الثاني
+    assert len(resumed_calls) == 4
+    np.testing.assert_allclose(result.params, expected.params, rtol=1e-12)
+    np.testing.assert_allclose(result.cov, expected.cov, rtol=1e-12)
+
+
+@pytest.mark.parametrize("fmt", ["csv", "parquet"])
+def test_cluster_ids_with_missing_values(tmp_path, fmt):
+    # معرّف عنقود فارغ يجعل عمود العناقيد عشريًا في كتلته وحدها؛ العنقود نفسه يجب أن يبقى واحدًا
+    source = tmp_path / "demo.csv"
+    streaming.make_demo(source, 4000, k=2, clusters=20, seed=5, chunk_rows=1000)
+    data = pd.read_csv(source)
+    data["firm"] = data["firm"].astype("Int64")
+    data.loc[3100, "firm"] = pd.NA
+    path = tmp_path / f"blank.{fmt}"
+    if fmt == "csv":
+        data.to_csv(path, index=False)
+    else:
+        pytest.importorskip("pyarrow")
+        data.to_parquet(path, row_group_size=1000)
+
+    spec = streaming.Spec(str(path), y="y", x=("x1", "x2"), cluster="firm", cov_type="cluster")
+    result = streaming.fit(spec, parts=2, chunk_rows=500)
+    complete = data.dropna(subset=["firm"])
+    X = np.column_stack([np.ones(len(complete)), complete[["x1", "x2"]].to_numpy()])
+    expected = ols.fit(X, complete["y"].to_numpy(), cov_type="cluster", groups=complete["firm"].to_numpy())
+    np.testing.assert_allclose(result.params, expected.params, rtol=1e-9)
+    np.testing.assert_allclose(result.cov, expected.cov, rtol=1e-7)